@@ -4,9 +4,14 @@
 # Distributed under the terms of the Modified BSD License.
 
 import asyncio
+import gc
 import json
 import os
+import pickle
 import sys
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import Process
 
 import pytest
@@ -14,6 +19,8 @@ from pytest import mark
 
 import zmq
 import zmq.asyncio as zaio
+from zmq._future import _get_timer_wheel
+from zmq.utils.garbage import gc as zmq_gc
 
 
 @pytest.fixture
@@ -64,6 +71,233 @@ async def test_recv(create_bound_pair):
     assert recvd == b"there"
 
 
+async def test_recv_drain(create_bound_pair):
+    a, b = create_bound_pair(zmq.PUSH, zmq.PULL)
+    futures = [b.recv() for i in range(20)]
+    # send and wait without running the event loop
+    sync_a = zmq.Socket(a)
+    for i in range(15):
+        sync_a.send(b'%i' % i)
+    time.sleep(0.2)
+    # one event resolves every future with a message waiting
+    b._handle_recv()
+    assert [f.done() for f in futures] == [True] * 15 + [False] * 5
+    assert [f.result() for f in futures[:15]] == [b'%i' % i for i in range(15)]
+    assert len(b._recv_futures) == 5
+    await a.send_multipart([b'a', b'b', b'c', b'd', b'e'])
+    assert await asyncio.gather(*futures[15:]) == [b'a', b'b', b'c', b'd', b'e']
+    assert len(b._recv_futures) == 0
+
+
+async def test_send_drain(create_bound_pair):
+    a, b = create_bound_pair(zmq.PUSH, zmq.PULL)
+    a.sndhwm = b.rcvhwm = 1
+    # fill the queues
+    while True:
+        try:
+            await a.send(b'x', flags=zmq.DONTWAIT)
+        except zmq.Again:
+            break
+    futures = [a.send(b'%i' % i) for i in range(10)]
+    received = []
+    while len(received) < 10:
+        msg = await b.recv()
+        if msg != b'x':
+            received.append(msg)
+    assert received == [b'%i' % i for i in range(10)]
+    await asyncio.gather(*futures)
+
+
+async def test_aiter(create_bound_pair):
+    a, b = create_bound_pair(zmq.PUSH, zmq.PULL)
+    b.rcvtimeo = 1000
+    sent = [[b'%i' % i, b'x'] for i in range(200)]
+
+    async def send():
+        for msg in sent:
+            await a.send_multipart(msg)
+            if len(msg[0]) == 1:
+                # pause after the first few, so iteration has to wait
+                await asyncio.sleep(0.01)
+
+    send_task = asyncio.create_task(send())
+    received = []
+    async for msg in b:
+        received.append(msg)
+        if len(received) == 150:
+            break
+    await send_task
+    assert received == sent[:150]
+    # messages after break are not lost
+    assert await b.recv_multipart() == sent[150]
+    # RCVTIMEO raises, as for recv
+    b.rcvtimeo = 50
+    with pytest.raises(zmq.Again):
+        async for msg in b:
+            received.append(msg)
+    assert received[150:] == sent[151:]
+
+
+async def test_stream(create_bound_pair):
+    a, b = create_bound_pair(zmq.PUSH, zmq.PULL)
+    b.rcvtimeo = 1000
+    with pytest.raises(ValueError):
+        b.stream(0)
+    sync_a = zmq.Socket(a)
+    for i in range(10):
+        sync_a.send(b'%i' % i)
+    time.sleep(0.2)
+    stream = b.stream(4, copy=False)
+    batches = [await stream.__anext__() for i in range(3)]
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert [msg[0].bytes for batch in batches for msg in batch] == [
+        b'%i' % i for i in range(10)
+    ]
+    # waits for the next message
+    f = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0.1)
+    assert not f.done()
+    # waiting recv calls go first
+    r = b.recv()
+    await a.send(b'a')
+    await a.send(b'b')
+    assert await r == b'a'
+    assert [msg[0].bytes for msg in await f] == [b'b']
+    await stream.aclose()
+
+
+async def test_write_drain(create_bound_pair):
+    a, b = create_bound_pair(zmq.PUSH, zmq.PULL)
+    a.sndhwm = b.rcvhwm = 10
+    with pytest.raises(ValueError):
+        a.set_write_buffer_limits(high=1, low=2)
+    a.set_write_buffer_limits(high=20)
+    assert (a._write_high, a._write_low) == (20, 5)
+    # fire and forget
+    await a.drain()
+    n = 0
+    while a.get_write_buffer_size() <= 20:
+        a.write_multipart([b'%i' % n])
+        n += 1
+    drained = a.drain()
+    assert not drained.done()
+    # awaited sends wait behind buffered writes
+    sent = a.send(b'last')
+    received = []
+    while not drained.done():
+        received.append(await b.recv())
+    await drained
+    assert a.get_write_buffer_size() <= 5
+    while len(received) < n + 1:
+        received.append(await b.recv())
+    assert received == [b'%i' % i for i in range(n)] + [b'last']
+    await sent
+    assert a.get_write_buffer_size() == 0
+
+
+async def test_send_gather(socket):
+    a = socket(zmq.PUSH)
+    b = socket(zmq.PULL)
+    a.sndhwm = b.rcvhwm = 1
+    port = a.bind_to_random_port('tcp://127.0.0.1')
+    b.connect(f'tcp://127.0.0.1:{port}')
+    # big messages fill the tcp buffers quickly
+    big = b'x' * 65536
+    futures = [a.send_gather((b'%i' % i, big)) for i in range(100)]
+    assert not futures[-1].done()
+    for i in range(100):
+        assert await b.recv() == b'%i' % i + big
+    await asyncio.gather(*futures)
+    with pytest.raises(TypeError):
+        await a.send_gather([b'a', 'str'])
+
+
+async def test_send_many(socket):
+    a = socket(zmq.PUSH)
+    b = socket(zmq.PULL)
+    a.sndhwm = b.rcvhwm = 1
+    port = a.bind_to_random_port('tcp://127.0.0.1')
+    b.connect(f'tcp://127.0.0.1:{port}')
+    # big messages fill the tcp buffers quickly
+    big = b'x' * 65536
+    msgs = [[b'%i' % i, big] for i in range(100)]
+    sent = a.send_many(msgs)
+    assert not sent.done()
+    received = []
+    while len(received) < len(msgs):
+        received.append(await b.recv_multipart())
+    assert await sent == len(msgs)
+    assert received == msgs
+    # with DONTWAIT, only what can be sent right away
+    await a.poll(flags=zmq.POLLOUT)
+    nowait = await a.send_many(msgs, flags=zmq.DONTWAIT)
+    assert 0 < nowait < len(msgs)
+    for i in range(nowait):
+        assert await b.recv_multipart() == msgs[i]
+
+
+async def test_write_send_order(create_bound_pair):
+    a, b = create_bound_pair(zmq.PUSH, zmq.PULL)
+    a.sndhwm = b.rcvhwm = 1
+    # big messages fill the tcp buffers quickly
+    big = b'x' * 65536
+    while a.get_write_buffer_size() == 0:
+        a.write_multipart([big])
+    # writes and sends go out in the order they were made
+    sent = [a.send(b'A')]
+    a.write_multipart([b'B'])
+    sent.append(a.send(b'C'))
+    a.write_multipart([b'D'])
+    received = []
+    while len(received) < 4:
+        msg = await b.recv()
+        if msg != big:
+            received.append(msg)
+    assert received == [b'A', b'B', b'C', b'D']
+    await asyncio.gather(*sent)
+    assert a.get_write_buffer_size() == 0
+
+
+async def test_write_error(create_bound_pair):
+    a, b = create_bound_pair(zmq.PUSH, zmq.PULL)
+    a.sndhwm = b.rcvhwm = 1
+    # big messages fill the tcp buffers quickly
+    big = b'x' * 65536
+    while a.get_write_buffer_size() == 0:
+        a.write_multipart([big])
+    a.set_write_buffer_limits(high=0)
+    a.write_multipart(['not bytes'])
+    drained = a.drain()
+    while not drained.done():
+        await b.recv()
+    with pytest.raises(TypeError):
+        await drained
+    # raised once
+    await a.drain()
+
+
+async def test_write_close(create_bound_pair):
+    a, b = create_bound_pair(zmq.PUSH, zmq.PULL)
+    a.sndhwm = b.rcvhwm = 1
+    # big messages fill the tcp buffers quickly
+    big = b'x' * 65536
+    a.set_write_buffer_limits(high=0)
+    while a.get_write_buffer_size() == 0:
+        a.write_multipart([big])
+    # behind a waiting send, so it can't be flushed on close
+    sent = a.send(big)
+    a.write_multipart([big])
+    drained = a.drain()
+    a.close(linger=0)
+    assert sent.cancelled()
+    # buffered messages are discarded, and drain says so
+    assert a.get_write_buffer_size() == 0
+    with pytest.raises(zmq.ZMQError) as exc_info:
+        await drained
+    assert exc_info.value.errno == zmq.ENOTSOCK
+    assert "discarding" in str(exc_info.value)
+
+
 async def test_recv_into(create_bound_pair):
     a, b = create_bound_pair()
     b.rcvtimeo = 1000
@@ -119,6 +353,154 @@ async def test_recv_into_bad(create_bound_pair):
         await b.recv_into(buf, nbytes=-1)
 
 
+async def test_recv_multipart_into(create_bound_pair):
+    a, b = create_bound_pair()
+    b.rcvtimeo = 1000
+    bufs = [bytearray(4), bytearray(10)]
+    f = b.recv_multipart_into(bufs)
+    assert not f.done()
+    await a.send_multipart([b'head', b'body'])
+    assert await f == [4, 4]
+    assert bufs == [b'head', b'body' + bytes(6)]
+
+
+async def test_recv_many(push_pull):
+    a, b = push_pull
+    b.rcvtimeo = 1000
+    f = b.recv_many(10)
+    assert not f.done()
+    for i in range(3):
+        await a.send(b'%i' % i)
+    recvd = await f
+    while len(recvd) < 3:
+        recvd.extend(await b.recv_many(10))
+    assert recvd == [b'0', b'1', b'2']
+    # waiting doesn't block the loop
+    tic = time.perf_counter()
+    f = b.recv_many_multipart(10)
+    assert time.perf_counter() - tic < 0.5
+    assert not f.done()
+    await a.send_multipart([b'a', b'b'])
+    await a.send_multipart([b'c', b'd'])
+    recvd = await f
+    while len(recvd) < 2:
+        recvd.extend(await b.recv_many_multipart(10, copy=False))
+    assert [[bytes(part) for part in msg] for msg in recvd] == [
+        [b'a', b'b'],
+        [b'c', b'd'],
+    ]
+    with pytest.raises(zmq.Again):
+        await b.recv_many(10, flags=zmq.DONTWAIT)
+
+
+async def test_recv_arena(push_pull):
+    a, b = push_pull
+    arena = bytearray(10)
+    f = b.recv_arena(arena)
+    assert not f.done()
+    await a.send(b'hi')
+    index, rest = await f
+    assert list(index) == [0, 2, 0]
+    assert rest == []
+    assert arena[:2] == b'hi'
+    # the message that doesn't fit is returned separately
+    await a.send(b'x' * 8)
+    await a.send(b'y' * 8)
+    await asyncio.sleep(0.1)
+    index, rest = await b.recv_arena(arena)
+    assert list(index) == [0, 8, 0]
+    assert rest == [b'y' * 8]
+
+
+async def test_recv_array(push_pull):
+    np = pytest.importorskip("numpy")
+    a, b = push_pull
+    A = np.arange(12, dtype='i2').reshape(3, 4)
+    f = b.recv_array()
+    assert not f.done()
+    await a.send_array(A)
+    B = await f
+    assert B.dtype == A.dtype
+    assert (B == A).all()
+
+    out = np.empty_like(A)
+    f = b.recv_array(out=out)
+    await a.send_array(A.T.copy())
+    with pytest.raises(ValueError):
+        await f
+
+
+async def test_recv_pyobj_out_of_band(push_pull):
+    a, b = push_pull
+    f = b.recv_pyobj(out_of_band=True)
+    assert not f.done()
+    obj = [pickle.PickleBuffer(b'buf'), 'x']
+    await a.send_pyobj(obj, out_of_band=True)
+    rcvd = await f
+    assert bytes(rcvd[0]) == b'buf'
+    assert rcvd[1] == 'x'
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+async def test_serialization_offload(push_pull):
+    a, b = push_pull
+    with CountingExecutor(1) as executor:
+        with pytest.raises(ValueError):
+            b.set_serialization_offload(executor, -1)
+        a.set_serialization_offload(executor)
+        b.set_serialization_offload(executor, 1000)
+        small = {'x': 1}
+        big = {'x': 'y' * 1000}
+        f = b.recv_json()
+        await a.send_json(small)
+        assert await f == small
+        assert executor.submitted == 0
+        # by size
+        await a.send_json(big)
+        assert await b.recv_json() == big
+        assert executor.submitted == 1
+        # or per call
+        await a.send_json(small, offload=True)
+        assert await b.recv_json(offload=True) == small
+        assert executor.submitted == 3
+        await a.send_json(big)
+        assert await b.recv_json(offload=False) == big
+        assert executor.submitted == 3
+
+        await a.send_pyobj(big, offload=True)
+        assert await b.recv_pyobj() == big
+        assert executor.submitted == 5
+        # out-of-band pickles are never offloaded
+        obj = [pickle.PickleBuffer(b'x' * 1000), small]
+        await a.send_pyobj(obj, out_of_band=True, offload=True)
+        rcvd = await b.recv_pyobj(out_of_band=True, offload=True)
+        assert bytes(rcvd[0]) == b'x' * 1000
+        assert rcvd[1] == small
+        assert executor.submitted == 5
+
+        # errors are raised by the returned Future
+        with pytest.raises(TypeError):
+            await a.send_json(object(), offload=True)
+        await a.send(b'not json' * 200)
+        with pytest.raises(ValueError):
+            await b.recv_json()
+
+        b.set_serialization_offload(None)
+        await a.send_json(big)
+        assert await b.recv_json() == big
+        # no executor, nowhere to offload to
+        await a.send_json(big)
+        assert await b.recv_json(offload=True) == big
+        assert executor.submitted == 7
+
+
 @mark.skipif(not hasattr(zmq, "RCVTIMEO"), reason="requires RCVTIMEO")
 async def test_recv_timeout(push_pull):
     a, b = push_pull
@@ -134,6 +516,70 @@ async def test_recv_timeout(push_pull):
     assert recvd == [b"hi", b"there"]
 
 
+@mark.skipif(not hasattr(zmq, "RCVTIMEO"), reason="requires RCVTIMEO")
+async def test_recv_timeout_wheel(push_pull):
+    a, b = push_pull
+    wheel = _get_timer_wheel(asyncio.get_running_loop())
+    b.rcvtimeo = 200
+    futures = [b.recv() for i in range(1000)]
+    # timeouts share a few buckets, with one loop timer
+    assert 1 <= len(wheel.buckets) < 100
+    assert wheel.scheduled == wheel.ticks[0]
+    later = wheel.scheduled
+    b.rcvtimeo = 50
+    early = b.recv()
+    assert wheel.scheduled == wheel.ticks[0] < later
+    with pytest.raises(zmq.Again):
+        await early
+    # resolving cancels the timeouts
+    await a.send_multipart([b'%i' % i for i in range(500)])
+    assert await asyncio.gather(*futures[:500]) == [b'%i' % i for i in range(500)]
+    assert sum(len(bucket) for bucket in wheel.buckets.values()) == 500
+    results = await asyncio.gather(*futures[500:], return_exceptions=True)
+    assert all(isinstance(r, zmq.Again) for r in results)
+    assert wheel.buckets == {}
+    assert wheel.scheduled is None
+
+
+async def test_timer_wheel_error():
+    loop = asyncio.get_running_loop()
+    wheel = _get_timer_wheel(loop)
+    errors = []
+    loop.set_exception_handler(lambda loop, context: errors.append(context))
+    called = []
+
+    def fail(arg):
+        raise ValueError(arg)
+
+    # timers due together, usually in one bucket
+    wheel.call_later(0, called.append, 1)
+    wheel.call_later(0, fail, 'oops')
+    wheel.call_later(0, called.append, 2)
+    await asyncio.sleep(0.1)
+    loop.set_exception_handler(None)
+    # an error doesn't stop the rest of the bucket
+    assert called == [1, 2]
+    assert len(errors) == 1
+    assert isinstance(errors[0]['exception'], ValueError)
+
+
+async def test_dispatcher(create_bound_pair):
+    loop = asyncio.get_running_loop()
+    dispatcher = zaio._get_dispatcher(loop)
+    pairs = [create_bound_pair(zmq.PUSH, zmq.PULL) for i in range(10)]
+    futures = [b.recv() for a, b in pairs]
+    for i, (a, b) in enumerate(pairs):
+        await a.send(b'%i' % i)
+    assert await asyncio.gather(*futures) == [b'%i' % i for i in range(10)]
+    # all waiting sockets on a loop share one dispatcher
+    for a, b in pairs:
+        assert b._dispatcher is dispatcher
+    for a, b in pairs:
+        a.close()
+        b.close()
+    assert dispatcher.pending == {}
+
+
 @mark.skipif(not hasattr(zmq, "SNDTIMEO"), reason="requires SNDTIMEO")
 async def test_send_timeout(socket):
     s = socket(zmq.PUSH)
@@ -279,6 +725,26 @@ async def test_recv_cancel(push_pull):
     assert recvd == [b"hi", b"there"]
 
 
+async def test_recv_cancel_cleanup(push_pull):
+    a, b = push_pull
+    futures = [b.recv() for i in range(3)]
+    assert len(b._recv_futures) == 3
+    # cancelled events leave the queue without waiting for a message
+    futures[1].cancel()
+    await asyncio.sleep(0)
+    assert [event.future for event in b._recv_futures] == [futures[0], futures[2]]
+    await a.send_multipart([b"a", b"b"])
+    assert await asyncio.gather(futures[0], futures[2]) == [b"a", b"b"]
+    assert len(b._recv_futures) == 0
+    # messages already waiting resolve without a done-callback
+    await a.send(b"c")
+    await asyncio.sleep(0.1)
+    f = b.recv()
+    assert f.done()
+    assert f.result() == b"c"
+    assert not f._callbacks
+
+
 async def test_poll(push_pull):
     a, b = push_pull
     f = b.poll(timeout=0)
@@ -369,6 +835,98 @@ async def test_poll_raw():
     w.close()
 
 
+async def test_persistent_poller(push_pull, sockets):
+    a, b = push_pull
+    ctx = zmq.Context()
+    url = "inproc://test-persistent"
+    c = ctx.socket(zmq.PUSH)
+    d = ctx.socket(zmq.PULL)
+    sockets.extend([c, d])
+    c.bind(url)
+    d.connect(url)
+
+    poller = zaio.PersistentPoller()
+    poller.register(b, zmq.POLLIN)
+    # blocking sockets are wrapped for as long as they are registered
+    poller.register(d, zmq.POLLIN)
+    assert await poller.poll(timeout=0) == []
+    assert await poller.poll(timeout=10) == []
+    assert set(poller._watched) == {b, d}
+
+    for i in range(3):
+        f = poller.poll(timeout=1000)
+        assert not f.done()
+        # one waiting poll at a time
+        with pytest.raises(RuntimeError):
+            await poller.poll()
+        await a.send(b"hi")
+        assert await f == [(b, zmq.POLLIN)]
+        # events left ready are returned right away
+        assert await poller.poll() == [(b, zmq.POLLIN)]
+        assert await b.recv() == b"hi"
+
+    f = poller.poll(timeout=1000)
+    c.send(b"there")
+    assert await f == [(d, zmq.POLLIN)]
+    assert d.recv() == b"there"
+
+    # a socket's own recv still works alongside the poller
+    r = b.recv()
+    await a.send(b"both")
+    assert await poller.poll(timeout=1000) == [(b, zmq.POLLIN)]
+    assert await r == b"both"
+
+    poller.unregister(d)
+    assert list(poller._watched) == [b]
+    poller.unregister(b)
+    assert not b._pollers
+    assert await poller.poll(timeout=10) == []
+
+    # a poller dropped without unregistering isn't kept alive by its sockets
+    poller.register(b, zmq.POLLIN)
+    assert list(b._pollers) == [poller]
+    poller_ref = weakref.ref(poller)
+    del poller
+    gc.collect()
+    assert poller_ref() is None
+    assert not b._pollers
+    await a.send(b"gone")
+    assert await b.recv() == b"gone"
+
+
+@pytest.mark.skipif(
+    sys.platform.startswith("win"),
+    reason="Windows does not support polling on files",
+)
+async def test_persistent_poller_raw():
+    p = zaio.PersistentPoller()
+    r, w = os.pipe()
+    r = os.fdopen(r, "rb")
+    w = os.fdopen(w, "wb")
+    p.register(r, zmq.POLLIN)
+    assert await p.poll(timeout=10) == []
+
+    w.write(b"x")
+    w.flush()
+    assert await p.poll(timeout=1000) == [(r.fileno(), zmq.POLLIN)]
+    # ready while not polling: stops watching until the next poll
+    await asyncio.sleep(0.01)
+    assert p._raw_paused
+    assert await p.poll(timeout=1000) == [(r.fileno(), zmq.POLLIN)]
+    assert r.read(1) == b"x"
+
+    f = p.poll(timeout=1000)
+    await asyncio.sleep(0.01)
+    assert not f.done()
+    w.write(b"y")
+    w.flush()
+    assert await f == [(r.fileno(), zmq.POLLIN)]
+    assert r.read(1) == b"y"
+    p.unregister(r)
+    r.close()
+    w.close()
+
+
 def test_multiple_loops(push_pull):
     a, b = push_pull
 
@@ -405,6 +963,78 @@ async def test_poll_leak():
         assert len(s._recv_futures) == 0
 
 
+async def test_completion_queue(push_pull):
+    a, b = push_pull
+    cq = zmq.CompletionQueue()
+    f = asyncio.ensure_future(cq)
+    await asyncio.sleep(0.1)
+    assert not f.done()
+    buf = bytearray(b'x' * 100)
+    await a.send(zmq.Frame(buf, copy=False, completion_queue=cq))
+    assert await b.recv() == buf
+    tokens = await asyncio.wait_for(f, timeout=5)
+    assert tokens == [buf]
+    assert tokens[0] is buf
+
+    # concurrent awaiters each get a batch
+    f1 = asyncio.ensure_future(cq)
+    f2 = asyncio.ensure_future(cq)
+    await asyncio.sleep(0.1)
+    assert not f1.done() and not f2.done()
+    for token in ('first', 'second'):
+        await a.send(
+            zmq.Frame(b'x' * 100, copy=False, completion_queue=cq, token=token)
+        )
+        await b.recv()
+        await asyncio.wait_for(
+            asyncio.wait([f1, f2], return_when=asyncio.FIRST_COMPLETED), timeout=5
+        )
+        await asyncio.sleep(0.1)
+    tokens = await asyncio.wait_for(asyncio.gather(f1, f2), timeout=5)
+    assert sorted(tokens) == [['first'], ['second']]
+    # cancelled waits don't leave the reader behind
+    f = asyncio.ensure_future(cq)
+    await asyncio.sleep(0.1)
+    f.cancel()
+    await asyncio.sleep(0)
+    assert cq._waiters == []
+    # closing cancels pending waits
+    f = asyncio.ensure_future(cq)
+    await asyncio.sleep(0.1)
+    cq.close()
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(f, timeout=5)
+    assert cq._waiters == []
+
+
+async def test_await_tracker(push_pull):
+    a, b = push_pull
+    frame = zmq.Frame(b'x' * 100, copy=False, track=True)
+    tracker = frame.tracker
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(tracker, timeout=0.1)
+    # cancelled waits don't leave callbacks behind
+    assert zmq_gc._event_callbacks == {}
+    f = asyncio.ensure_future(tracker)
+    await asyncio.sleep(0.1)
+    assert not f.done()
+    del frame
+    await asyncio.wait_for(f, timeout=5)
+    assert tracker.done
+
+    # many trackers at once, on one loop
+    trackers = [
+        await a.send(b'%i' % i * 10000, copy=False, track=True) for i in range(100)
+    ]
+    for i in range(100):
+        await b.recv(copy=False)
+    await asyncio.wait_for(asyncio.gather(*trackers), timeout=5)
+    assert all(tracker.done for tracker in trackers)
+    assert zmq_gc._event_callbacks == {}
+    # done trackers return right away
+    await zmq.MessageTracker(*trackers)
+
+
 async def test_draft_asyncio():
     if not zmq.DRAFT_API:
         pytest.skip("draft API")
@@ -0,0 +1,113 @@
+"""Test copy threshold calibration"""
+
+# Copyright (C) PyZMQ Developers
+# Distributed under the terms of the Modified BSD License.
+
+import pytest
+
+import zmq
+from zmq.utils import calibrate
+
+
+@pytest.fixture(autouse=True)
+def clear_thresholds():
+    calibrate._thresholds.clear()
+    yield
+    calibrate._thresholds.clear()
+
+
+@pytest.mark.parametrize("transport", ["tcp", "inproc"])
+def test_measure(context, transport):
+    sizes = [1024, 16384]
+    threshold = calibrate.measure_copy_threshold(
+        transport, sizes=sizes, min_time=0.01, context=context
+    )
+    assert threshold in sizes + [2 * sizes[-1]]
+    assert calibrate.get_copy_threshold(transport) is None
+
+
+@pytest.mark.parametrize(
+    "crossover, expected",
+    [
+        # zero-copy is faster from the crossover up
+        (4096, 4096),
+        (1024, 1024),
+        # never faster
+        (None, 2 * 16384),
+        # faster for 1kB, but not for 4kB
+        ((1024, 16384), 16384),
+    ],
+)
+def test_measure_crossover(monkeypatch, crossover, expected):
+    sizes = [1024, 4096, 16384]
+    if crossover is None:
+        faster = set()
+    elif isinstance(crossover, tuple):
+        faster = set(crossover)
+    else:
+        faster = {size for size in sizes if size >= crossover}
+
+    def measure(ctx, transport, size, copy, min_time):
+        # messages per second
+        if copy:
+            return 1000.0
+        return 2000.0 if size in faster else 500.0
+
+    monkeypatch.setattr(calibrate, "_measure", measure)
+    threshold = calibrate.measure_copy_threshold('inproc', sizes=sizes)
+    assert threshold == expected
+    assert calibrate.calibrate_copy_threshold(['inproc'], sizes=sizes) == {
+        'inproc': expected
+    }
+    assert calibrate.get_copy_threshold('inproc') == expected
+
+
+def test_measure_bad_transport():
+    with pytest.raises(ValueError):
+        calibrate.measure_copy_threshold('pgm')
+
+
+def test_calibrate():
+    thresholds = calibrate.calibrate_copy_threshold(
+        ['inproc'], sizes=[1024], min_time=0.01
+    )
+    assert list(thresholds) == ['inproc']
+    assert calibrate.get_copy_threshold('inproc') == thresholds['inproc']
+    assert calibrate.get_copy_threshold('inproc://anything') == thresholds['inproc']
+    assert calibrate.get_copy_threshold('tcp') is None
+
+
+def test_socket_copy_threshold(socket):
+    calibrate.set_copy_threshold('inproc', 123)
+    calibrate.set_copy_threshold('tcp', 456)
+
+    s = socket(zmq.PUSH)
+    assert s.copy_threshold == zmq.COPY_THRESHOLD
+    s.bind('inproc://calibrated')
+    assert s.copy_threshold == 123
+    # first calibrated endpoint decides
+    s.bind('tcp://127.0.0.1:0')
+    assert s.copy_threshold == 123
+
+    s = socket(zmq.PULL)
+    s.connect('tcp://127.0.0.1:5555')
+    assert s.copy_threshold == 456
+
+    # explicit thresholds are left alone
+    s = socket(zmq.PUSH, copy_threshold=10)
+    s.bind('inproc://explicit')
+    assert s.copy_threshold == 10
+    s = socket(zmq.PUSH)
+    s.copy_threshold = 20
+    s.connect('inproc://calibrated')
+    assert s.copy_threshold == 20
+    # even if the explicit threshold is the default
+    s = socket(zmq.PUSH)
+    s.copy_threshold = zmq.COPY_THRESHOLD
+    s.connect('inproc://calibrated')
+    assert s.copy_threshold == zmq.COPY_THRESHOLD
+
+    calibrate.set_copy_threshold('inproc', None)
+    s = socket(zmq.PUSH)
+    s.connect('inproc://calibrated')
+    assert s.copy_threshold == zmq.COPY_THRESHOLD
@@ -13,6 +13,7 @@ else:
     grc = getrefcount
 
 import time
+from threading import Event
 
 import pytest
 
@@ -227,6 +228,92 @@ class TestFrame(BaseZMQTestCase):
         assert mt.wait(0.1) is None
         assert mt.done
 
+    def test_tracker_burst(self):
+        """zero-copy releases larger than one gc queue batch are all collected"""
+        a, b = self.create_bound_pair(zmq.PUSH, zmq.PULL)
+        n = 1000
+        trackers = [a.send(b'x' * 100, copy=False, track=True) for i in range(n)]
+        for i in range(n):
+            assert b.recv() == b'x' * 100
+        mt = zmq.MessageTracker(*trackers)
+        assert mt.wait(5) is None
+        assert all(t.done for t in trackers)
+
+    def test_event_callback_race(self):
+        """a callback added while the gc thread sets the event is still called"""
+
+        class LateEvent(Event):
+            # the event is set by the gc thread right after the first check
+            checked = False
+
+            def is_set(self):
+                if not self.checked:
+                    self.checked = True
+                    return False
+                return super().is_set()
+
+        event = LateEvent()
+        # the gc thread sets it, and finds no callbacks
+        event.set()
+        called = []
+        zmq_gc.add_event_callback(event, lambda: called.append(True))
+        assert called == [True]
+        assert event not in zmq_gc._event_callbacks
+
+    def test_completion_queue(self):
+        a, b = self.create_bound_pair(zmq.PUSH, zmq.PULL)
+        cq = zmq.CompletionQueue()
+        poller = zmq.Poller()
+        poller.register(cq, zmq.POLLIN)
+        assert poller.poll(0) == []
+        assert cq.get() == []
+        buffers = [bytearray(b'x' * 100) for i in range(10)]
+        for i, buf in enumerate(buffers):
+            a.send(zmq.Frame(buf, copy=False, completion_queue=cq, token=i))
+        # copied frames complete immediately, default token is data
+        small = b'small'
+        zmq.Frame(small, copy=True, completion_queue=cq)
+        for i in range(len(buffers)):
+            b.recv()
+        tokens = []
+        while len(tokens) < len(buffers) + 1:
+            assert poller.poll(5000) == [(cq.fileno(), zmq.POLLIN)]
+            tokens.extend(cq.get(timeout=1))
+        assert small in tokens
+        assert sorted(t for t in tokens if t is not small) == list(range(10))
+        assert len(cq) == 0
+        assert poller.poll(0) == []
+        assert cq.get(timeout=0.1) == []
+        cq.close()
+        # tokens released after close are dropped
+        cq._complete(['late'])
+        assert len(cq) == 0
+
+    def test_buffer_pool(self):
+        a, b = self.create_bound_pair(zmq.PUSH, zmq.PULL)
+        pool = zmq.BufferPool(64, count=2, max_free=3)
+        assert len(pool) == 2
+        bufs = [pool.get() for i in range(4)]
+        assert len(pool) == 0
+        assert all(len(buf) == 64 for buf in bufs)
+        assert len({id(buf) for buf in bufs}) == 4
+        for i, buf in enumerate(bufs[:3]):
+            buf[:2] = b'%02i' % i
+            a.send(pool.frame(buf, 2))
+        pool.release(bufs[3])
+        for i in range(3):
+            assert b.recv() == b'%02i' % i
+        deadline = time.monotonic() + 3
+        while len(pool) < 3 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        # only max_free buffers are kept
+        assert len(pool) == 3
+        assert {id(pool.get()) for i in range(3)} < {id(buf) for buf in bufs}
+        with pytest.raises(ValueError):
+            pool.frame(bytearray(10))
+        with pytest.raises(ValueError):
+            pool.frame(pool.get(), 100)
+
     def test_buffer_in(self):
         """test using a buffer as input"""
         ins = "§§¶•ªº˜µ¬˚…∆˙åß∂©œ∑´†≈ç√".encode()
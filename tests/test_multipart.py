@@ -26,6 +26,39 @@ class TestMultipart(BaseZMQTestCase):
         recvd = b.recv_multipart()
         assert msg == recvd
 
+    def test_send_multipart_mixed(self):
+        a, b = self.create_bound_pair(zmq.PAIR, zmq.PAIR)
+        a.copy_threshold = 4
+        msg = [b'hi', bytearray(b'there'), memoryview(b'big message'), zmq.Frame(b'f')]
+        for copy in (True, False):
+            a.send_multipart(msg, copy=copy)
+            recvd = self.recv_multipart(b)
+            assert recvd == [b'hi', b'there', b'big message', b'f']
+
+    def test_send_multipart_bad(self):
+        a, b = self.create_bound_pair(zmq.PAIR, zmq.PAIR)
+        with self.assertRaises(TypeError):
+            a.send_multipart([b'a', 'str'])
+        with self.assertRaises(IndexError):
+            a.send_multipart([])
+        # nothing was sent
+        a.send_multipart([b'b'])
+        assert self.recv_multipart(b) == [b'b']
+
+    def test_recv_multipart_frames(self):
+        a, b = self.create_bound_pair(zmq.PAIR, zmq.PAIR)
+        with self.assertRaises(zmq.Again):
+            b.recv_multipart(zmq.DONTWAIT)
+        msg = [b'hi', b'', b'x' * 100]
+        a.send_multipart(msg)
+        assert b.poll(1000)
+        frames = b.recv_multipart(copy=False)
+        assert [frame.bytes for frame in frames] == msg
+        assert [frame.more for frame in frames] == [True, True, False]
+        a.send_multipart(msg)
+        assert b.poll(1000)
+        assert b.recv_multipart(zmq.DONTWAIT) == msg
+
 
 if have_gevent:
 
@@ -5,7 +5,7 @@ import os
 import sys
 import time
 
-from pytest import mark
+from pytest import mark, raises
 
 import zmq
 from zmq_test_utils import GreenTest, PollZMQTestCase, have_gevent
@@ -156,6 +156,52 @@ class TestPoll(PollZMQTestCase):
         w.close()
         r.close()
 
+    def test_register_unregister(self):
+        poller = self.Poller()
+        pairs = [self.create_bound_pair(zmq.PUSH, zmq.PULL) for i in range(5)]
+        pulls = [pull for push, pull in pairs]
+        for pull in pulls:
+            poller.register(pull, zmq.POLLIN)
+        for i, (push, pull) in enumerate(pairs):
+            push.send(b'%i' % i)
+        wait()
+        assert dict(poller.poll(1000)) == dict.fromkeys(pulls, zmq.POLLIN)
+
+        # unregister from the middle and the end
+        poller.unregister(pulls[1])
+        poller.register(pulls[4], 0)
+        # registration order is kept
+        assert poller.sockets == [
+            (pull, zmq.POLLIN) for pull in (pulls[0], pulls[2], pulls[3])
+        ]
+        for idx, (socket, flags) in enumerate(poller.sockets):
+            assert poller._map[socket] == idx
+        assert dict(poller.poll(1000)) == {
+            pull: zmq.POLLIN for pull in (pulls[0], pulls[2], pulls[3])
+        }
+        poller.modify(pulls[0], zmq.POLLOUT)
+        assert dict(poller.poll(1000)) == {
+            pull: zmq.POLLIN for pull in (pulls[2], pulls[3])
+        }
+
+        # bad sockets raise on register
+        with self.assertRaises(TypeError):
+            poller.register(object(), zmq.POLLIN)
+        assert len(poller.sockets) == 3
+        # closed sockets raise on poll
+        pulls[2].close()
+        self.assertRaisesErrno(zmq.ENOTSOCK, poller.poll, 0)
+        # closing an unregistered socket doesn't affect the poller
+        poller.unregister(pulls[2])
+        pulls[1].close()
+        assert dict(poller.poll(1000)) == {pulls[3]: zmq.POLLIN}
+        # closed sockets can be registered and modified, but raise on poll
+        poller.register(pulls[1], zmq.POLLIN)
+        poller.modify(pulls[1], zmq.POLLOUT)
+        self.assertRaisesErrno(zmq.ENOTSOCK, poller.poll, 0)
+        poller.unregister(pulls[1])
+        assert dict(poller.poll(1000)) == {pulls[3]: zmq.POLLIN}
+
     @mark.flaky(reruns=3)
     def test_timeout(self):
         """make sure Poller.poll timeout has the right units (milliseconds)."""
@@ -178,6 +224,25 @@ class TestPoll(PollZMQTestCase):
         assert toc - tic > 0.1
 
 
+@mark.skipif(not zmq.DRAFT_API, reason="draft api unavailable")
+class TestZMQPoller(TestPoll):
+    def Poller(self):
+        return zmq.Poller(use_zmq_poller=True)
+
+
+def test_zmq_poller_opt_in():
+    from zmq.backend import _PollItems
+
+    assert type(zmq.Poller()._pollitems) is _PollItems
+
+
+@mark.skipif(zmq.DRAFT_API, reason="draft api available")
+def test_zmq_poller_unavailable():
+    with raises(RuntimeError):
+        zmq.Poller(use_zmq_poller=True)
+    assert len(zmq.Poller().sockets) == 0
+
+
 class TestSelect(PollZMQTestCase):
     def test_pair(self):
         s1, s2 = self.create_bound_pair(zmq.PAIR, zmq.PAIR)
@@ -87,6 +87,35 @@ class TestEINTRSysCall(BaseZMQTestCase):
         assert self.timer_fired
         assert self.context.closed
 
+    def test_retry_recv_many_multipart(self):
+        if not hasattr(signal, 'setitimer'):
+            raise SkipTest('EINTR tests require setitimer')
+        a, b = self.create_bound_pair(zmq.PAIR, zmq.PAIR)
+        parts = [b'a', b'b' * 1024, b'c']
+        nmsgs = 200
+
+        def send():
+            for i in range(nmsgs):
+                b.send_multipart(parts)
+                if i % 10 == 0:
+                    time.sleep(0.001)
+
+        # keep signals arriving while messages are received
+        orig_handler = signal.signal(signal.SIGALRM, lambda *args: None)
+        signal.setitimer(signal.ITIMER_REAL, 1e-4, 1e-4)
+        t = Thread(target=send)
+        t.start()
+        received = []
+        try:
+            while len(received) < nmsgs:
+                received.extend(a.recv_many_multipart(nmsgs))
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0, 0)
+            signal.signal(signal.SIGALRM, orig_handler)
+            t.join()
+        # no message was split or truncated by an interrupted recv
+        assert received == [parts] * nmsgs
+
     def test_retry_getsockopt(self):
         raise SkipTest("TODO: find a way to interrupt getsockopt")
 
@@ -0,0 +1,148 @@
+"""Test asyncio RPC over DEALER/ROUTER"""
+
+# Copyright (C) PyZMQ Developers
+# Distributed under the terms of the Modified BSD License.
+
+import asyncio
+
+import pytest
+
+import zmq
+import zmq.asyncio
+from zmq.rpc import RPCClient, RPCError, RPCServer
+
+
+@pytest.fixture
+def Context():
+    return zmq.asyncio.Context
+
+
+@pytest.fixture
+async def rpc(dealer_router):
+    dealer, router = dealer_router
+    server = RPCServer(router, concurrency=4)
+    client = RPCClient(dealer)
+    serving = asyncio.ensure_future(server.serve())
+    yield client, server
+    client.close()
+    serving.cancel()
+    await asyncio.gather(serving, return_exceptions=True)
+
+
+async def test_pipelined_calls(rpc):
+    client, server = rpc
+    active = 0
+    max_active = 0
+
+    @server.register
+    async def add(a, b):
+        nonlocal active, max_active
+        active += 1
+        max_active = max(active, max_active)
+        await asyncio.sleep(0.001)
+        active -= 1
+        return a + b
+
+    @server.register(name="mul")
+    def multiply(a, b=2):
+        return a * b
+
+    results = await asyncio.gather(*(client.call("add", i, i) for i in range(500)))
+    assert results == [2 * i for i in range(500)]
+    # calls overlap, up to the limit
+    assert max_active == server.concurrency
+    assert await client.call("mul", 3) == 6
+    assert await client.call("mul", 3, b=5) == 15
+    assert client._pending == {}
+
+
+async def test_errors(rpc):
+    client, server = rpc
+    server.register(lambda: 1 / 0, name="div")
+    with pytest.raises(RPCError) as exc_info:
+        await client.call("div")
+    assert exc_info.value.type == "ZeroDivisionError"
+    with pytest.raises(RPCError) as exc_info:
+        await client.call("nosuchmethod")
+    assert exc_info.value.type == "MethodNotFound"
+    # the server keeps going
+    server.register(str.upper, name="upper")
+    assert await client.call("upper", "hi") == "HI"
+    with pytest.raises(ValueError):
+        RPCServer(server.socket, concurrency=0)
+    assert not issubclass(RPCError, zmq.ZMQBaseError)
+
+
+async def test_reply_error(rpc):
+    client, server = rpc
+    loop = asyncio.get_running_loop()
+    errors = []
+    loop.set_exception_handler(lambda loop, context: errors.append(context))
+
+    class Unprintable(Exception):
+        def __str__(self):
+            raise RuntimeError("can't print")
+
+    @server.register
+    def fail():
+        raise Unprintable()
+
+    # the call gets no reply, but the error is reported
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(client.call("fail"), timeout=0.5)
+    assert len(errors) == 1
+    assert isinstance(errors[0]['exception'], RuntimeError)
+    # the server keeps going
+    server.register(str.upper, name="upper")
+    assert await client.call("upper", "hi") == "HI"
+    loop.set_exception_handler(None)
+
+
+async def test_cancel(rpc):
+    client, server = rpc
+    release = asyncio.Event()
+
+    @server.register
+    async def wait():
+        await release.wait()
+        return "done"
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(client.call("wait"), timeout=0.1)
+    assert client._pending == {}
+    release.set()
+    # the late reply is discarded
+    assert await client.call("wait") == "done"
+
+    release.clear()
+    call = asyncio.ensure_future(client.call("wait"))
+    await asyncio.sleep(0.1)
+    client.close()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+    release.set()
+
+
+async def test_serve_cancel(dealer_router):
+    dealer, router = dealer_router
+    server = RPCServer(router)
+    client = RPCClient(dealer)
+    cancelled = []
+
+    @server.register
+    async def wait():
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    serving = asyncio.ensure_future(server.serve())
+    call = asyncio.ensure_future(client.call("wait"))
+    await asyncio.sleep(0.1)
+    serving.cancel()
+    await asyncio.gather(serving, return_exceptions=True)
+    # calls in progress have finished by the time serve returns
+    assert cancelled == [True]
+    client.close()
+    await asyncio.gather(call, return_exceptions=True)
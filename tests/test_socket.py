@@ -531,6 +531,311 @@ class TestSocket(BaseZMQTestCase):
         with pytest.raises(zmq.Again):
             b.recv_into(bytearray(5), flags=zmq.DONTWAIT)
 
+    def test_recv_multipart_into(self):
+        a, b = self.create_bound_pair()
+        if not self.green:
+            b.rcvtimeo = 1000
+        with pytest.raises(zmq.Again):
+            b.recv_multipart_into([bytearray(5)], flags=zmq.DONTWAIT)
+        # bad buffers raise before receiving
+        with pytest.raises(BufferError):
+            b.recv_multipart_into([bytearray(5), memoryview(b"readonly")])
+        with pytest.raises(TypeError):
+            b.recv_multipart_into([bytearray(5), pytest])
+
+        msg = [b'head', b'body' * 4, b'trailer']
+        a.send_multipart(msg)
+        a.send_multipart(msg)
+        a.send_multipart(msg[:1])
+
+        # slices of one array, one too small
+        arr = array('Q', [0] * 4)
+        view = memoryview(arr).cast('B')
+        sizes = b.recv_multipart_into([view[:8], view[8:16], view[16:]])
+        assert sizes == [len(part) for part in msg]
+        assert view[:4] == msg[0]
+        # truncated
+        assert view[8:16] == msg[1][:8]
+        assert view[16:23] == msg[2]
+
+        # extra frames are discarded
+        buf = bytearray(10)
+        sizes = b.recv_multipart_into([buf])
+        assert sizes == [len(part) for part in msg]
+        assert buf[:4] == msg[0]
+
+        # extra buffers are unused
+        bufs = [bytearray(10), bytearray(10)]
+        assert b.recv_multipart_into(bufs) == [4]
+        assert bufs[1] == bytearray(10)
+
+    def test_recv_arena(self):
+        a, b = self.create_bound_pair(zmq.PUSH, zmq.PULL)
+        if not self.green:
+            b.rcvtimeo = 1000
+        with pytest.raises(zmq.Again):
+            b.recv_arena(bytearray(10), flags=zmq.DONTWAIT)
+        with pytest.raises(BufferError):
+            b.recv_arena(memoryview(b"readonly"))
+        with pytest.raises(ValueError):
+            b.recv_arena(bytearray(10), max_frames=-1)
+
+        msgs = [[b'%i' % i, b'x' * i] for i in range(200)]
+        for msg in msgs:
+            a.send_multipart(msg)
+        expected = [part for msg in msgs for part in msg]
+        arena = bytearray(100_000)
+        received = []
+        while len(received) < len(expected):
+            index, rest = b.recv_arena(arena, max_frames=len(expected) - len(received))
+            assert index.typecode == 'Q'
+            assert rest == []
+            for i in range(0, len(index), 3):
+                offset, length, more = index[i : i + 3]
+                assert more == (len(received) % 2 == 0)
+                received.append(bytes(arena[offset : offset + length]))
+        assert received == expected
+
+        # arena fills up, the message that doesn't fit is returned separately
+        a.send(b'x' * 8)
+        a.send_multipart([b'y' * 2, b'z' * 4])
+        a.send(b'w' * 16)
+        a.send(b'v')
+        time.sleep(0.1)
+        arena = bytearray(12)
+        index, rest = b.recv_arena(arena)
+        assert list(index) == [0, 8, 0]
+        assert arena[:8] == b'x' * 8
+        # multipart messages are not split
+        assert rest == [b'y' * 2, b'z' * 4]
+        # a message larger than the arena
+        index, rest = b.recv_arena(arena)
+        assert list(index) == []
+        assert rest == [b'w' * 16]
+        # nothing is held back from other recv calls
+        assert self.recv(b) == b'v'
+
+        # max_frames stops on message boundaries too
+        a.send_multipart([b'a', b'b'])
+        a.send(b'c')
+        a.send(b'd')
+        time.sleep(0.1)
+        index, rest = b.recv_arena(arena, max_frames=1)
+        assert list(index) == []
+        assert rest == [b'a', b'b']
+        index, rest = b.recv_arena(arena, max_frames=1)
+        assert list(index) == [0, 1, 0]
+        assert rest == []
+        assert self.recv(b) == b'd'
+
+    def test_recv_arena_mixed(self):
+        a, b = self.create_bound_pair(zmq.PUSH, zmq.PULL)
+        if not self.green:
+            b.rcvtimeo = 1000
+        a.send(b'x' * 8)
+        a.send(b'y' * 8)
+        a.send(b'z')
+        time.sleep(0.1)
+        index, rest = b.recv_arena(bytearray(4))
+        assert list(index) == []
+        assert rest == [b'x' * 8]
+        assert self.recv(b) == b'y' * 8
+        assert self.recv(b) == b'z'
+        poller = zmq.Poller()
+        poller.register(b, zmq.POLLIN)
+        assert poller.poll(0) == []
+
+    def test_send_recv_array(self):
+        try:
+            import numpy
+            from numpy.testing import assert_array_equal
+        except ImportError:
+            raise SkipTest("requires numpy")
+        a, b = self.create_bound_pair(zmq.PUSH, zmq.PULL)
+        if not self.green:
+            b.rcvtimeo = 1000
+        base = numpy.arange(60, dtype='>f8').reshape(3, 4, 5)
+        arrays = [
+            base,
+            numpy.asfortranarray(base),
+            base[:, ::2, 1:],
+            numpy.array([0, 1, 2], dtype='datetime64[s]'),
+            numpy.zeros(3, dtype=[('x', 'i4'), ('y', 'f8', (2,))]),
+            numpy.empty((0, 4), dtype='u1'),
+        ]
+        for A in arrays:
+            for copy in (True, False):
+                a.send_array(A, copy=copy)
+                B = b.recv_array(copy=copy)
+                assert B.dtype == A.dtype
+                assert B.shape == A.shape
+                assert_array_equal(B, A)
+            assert B.flags.f_contiguous == A.flags.f_contiguous
+
+        with pytest.raises(TypeError):
+            a.send_array(numpy.array([None]))
+
+        # receive into an existing array
+        out = numpy.empty_like(base)
+        a.send_array(base)
+        assert b.recv_array(out=out) is out
+        assert_array_equal(out, base)
+        out = numpy.empty_like(base, order='F')
+        a.send_array(numpy.asfortranarray(base))
+        b.recv_array(out=out)
+        assert_array_equal(out, base)
+
+        # mismatches
+        for A in (base.astype('f4'), base[:2], numpy.asfortranarray(base)):
+            a.send_array(A)
+            with pytest.raises(ValueError):
+                b.recv_array(out=numpy.empty_like(base))
+        with pytest.raises(ValueError):
+            b.recv_array(out=base[:, ::2])
+        a.send(b'not an array')
+        with pytest.raises(ValueError):
+            b.recv_array()
+
+    def test_pyobj_out_of_band(self):
+        try:
+            import numpy
+            from numpy.testing import assert_array_equal
+        except ImportError:
+            raise SkipTest("requires numpy")
+        a, b = self.create_bound_pair(zmq.PUSH, zmq.PULL)
+        if not self.green:
+            b.rcvtimeo = 1000
+        A = numpy.arange(100_000, dtype='f8')
+        obj = {'a': A, 'b': [A[:10], 'x'], 'c': bytearray(b'oob')}
+        a.send_pyobj(obj, out_of_band=True)
+        frames = self.recv_multipart(b)
+        # pickle stream, then one frame per buffer (bytearray is in-band)
+        assert len(frames) == 3
+        assert frames[1] == A.tobytes()
+
+        a.send_pyobj(obj, protocol=2, out_of_band=True, copy=True)
+        rcvd = b.recv_pyobj(out_of_band=True)
+        assert_array_equal(rcvd['a'], A)
+        assert_array_equal(rcvd['b'][0], A[:10])
+        assert rcvd['b'][1] == 'x'
+        assert rcvd['c'] == b'oob'
+
+        # in-band messages can be received out-of-band
+        a.send_pyobj(obj)
+        rcvd = b.recv_pyobj(out_of_band=True)
+        assert_array_equal(rcvd['a'], A)
+
+    def test_send_many(self):
+        a, b = self.create_bound_pair(zmq.PUSH, zmq.PULL)
+        msgs = [b'a', [b'b', bytearray(b'c')], memoryview(b'd'), (zmq.Frame(b'e'),)]
+        for copy in (True, False):
+            assert a.send_many(msgs, copy=copy) == len(msgs)
+            assert self.recv(b) == b'a'
+            assert self.recv_multipart(b) == [b'b', b'c']
+            assert self.recv(b) == b'd'
+            assert self.recv(b) == b'e'
+        assert a.send_many([]) == 0
+
+        # bad messages raise before anything is sent
+        with pytest.raises(TypeError):
+            a.send_many([b'a', [b'b', 'str']])
+        with pytest.raises(IndexError):
+            a.send_many([b'a', []])
+        a.send(b'last')
+        assert self.recv(b) == b'last'
+
+    def test_send_many_eagain(self):
+        push = self.socket(zmq.PUSH)
+        # no peer, nothing can be sent
+        assert push.send_many([b'x'] * 5, zmq.DONTWAIT) == 0
+        push.sndhwm = 1
+        pull = self.socket(zmq.PULL)
+        pull.rcvhwm = 1
+        port = push.bind_to_random_port('tcp://127.0.0.1')
+        pull.connect(f'tcp://127.0.0.1:{port}')
+        push.send(b'first')
+        assert self.recv(pull) == b'first'
+        msgs = [[b'%i' % i, b'more'] for i in range(10000)]
+        sent = push.send_many(msgs, zmq.DONTWAIT)
+        assert 0 < sent < len(msgs)
+        if not self.green:
+            pull.rcvtimeo = 1000
+        recvd = []
+        while len(recvd) < sent:
+            recvd.extend(pull.recv_many_multipart(sent - len(recvd)))
+        assert recvd == msgs[:sent]
+
+    def test_send_gather(self):
+        a, b = self.create_bound_pair()
+        header = b'head'
+        payload = bytearray(b'x' * 1000)
+        trailer = memoryview(b'01234567')[2:6]
+        a.send_gather([header, payload, trailer], zmq.SNDMORE)
+        a.send_gather(iter([zmq.Frame(b'frame'), b'']))
+        a.send_gather([])
+        assert self.recv_multipart(b) == [b'head' + b'x' * 1000 + b'2345', b'frame']
+        assert self.recv(b) == b''
+        with pytest.raises(TypeError):
+            a.send_gather([b'ok', 'unicode'])
+        with pytest.raises(TypeError):
+            a.send_gather([b'ok', 5])
+
+    def test_recv_many(self):
+        a, b = self.create_bound_pair()
+        if not self.green:
+            b.rcvtimeo = 1000
+        with pytest.raises(zmq.Again):
+            b.recv_many(5, flags=zmq.DONTWAIT)
+        with pytest.raises(ValueError):
+            b.recv_many(0)
+        msgs = [b'%i' % i for i in range(10)]
+        for msg in msgs:
+            a.send(msg)
+        recvd = []
+        while len(recvd) < len(msgs):
+            batch = b.recv_many(4)
+            assert 1 <= len(batch) <= 4
+            recvd.extend(batch)
+        assert recvd == msgs
+
+        a.send_multipart([b'a', b'b'])
+        frames = []
+        while len(frames) < 2:
+            frames.extend(b.recv_many(5, copy=False))
+        assert [frame.bytes for frame in frames] == [b'a', b'b']
+        assert [frame.more for frame in frames] == [True, False]
+
+        # room is made as messages arrive, not for max_messages up front
+        msgs = [b'%i' % i for i in range(100)]
+        for msg in msgs:
+            a.send(msg)
+        recvd = []
+        while len(recvd) < len(msgs):
+            recvd.extend(b.recv_many(0x7FFFFFFF))
+        assert recvd == msgs
+
+    def test_recv_many_multipart(self):
+        a, b = self.create_bound_pair()
+        if not self.green:
+            b.rcvtimeo = 1000
+        with pytest.raises(zmq.Again):
+            b.recv_many_multipart(5, flags=zmq.DONTWAIT)
+        msgs = [[b'%i' % j for j in range(i)] for i in range(1, 40)]
+        for msg in msgs:
+            a.send_multipart(msg)
+        recvd = []
+        while len(recvd) < len(msgs):
+            batch = b.recv_many_multipart(16)
+            assert 1 <= len(batch) <= 16
+            recvd.extend(batch)
+        assert recvd == msgs
+
+        a.send_multipart([b'a', b'b'])
+        recvd = b.recv_many_multipart(5, copy=False)
+        assert len(recvd) == 1
+        assert [frame.bytes for frame in recvd[0]] == [b'a', b'b']
+        assert [frame.more for frame in recvd[0]] == [True, False]
+
     def test_close_after_destroy(self):
         """s.close() after ctx.destroy() should be fine"""
         ctx = self.Context()
@@ -69,6 +69,21 @@ async def test_on_recv_basic(push, pull):
     assert recvd == sent
 
 
+async def test_on_recv_array(push, pull):
+    np = pytest.importorskip("numpy")
+    A = np.arange(10, dtype='f4')
+    push.send_array(A)
+    f = asyncio.Future()
+
+    def callback(B):
+        f.set_result(B)
+
+    pull.on_recv_array(callback)
+    B = await asyncio.wait_for(f, timeout=5)
+    assert B.dtype == A.dtype
+    assert (B == A).all()
+
+
 async def test_on_recv_wake(push, pull):
     sent = [b'wake']
 
@@ -30,6 +30,7 @@ __all__ = [
     'BACKLOG',
     'BINDTODEVICE',
     'BLOCKY',
+    'BufferPool',
     'BUSY_POLL',
     'CHANNEL',
     'CLIENT',
@@ -42,6 +43,7 @@ __all__ = [
     'CURVE_SECRETKEY',
     'CURVE_SERVER',
     'CURVE_SERVERKEY',
+    'CompletionQueue',
     'Context',
     'ContextOption',
     'ContextTerminated',
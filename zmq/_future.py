@@ -4,31 +4,76 @@
 # Distributed under the terms of the Modified BSD License.
 from __future__ import annotations
 
+import asyncio
+import heapq
+import math
+import pickle
 import warnings
+from array import array
 from asyncio import Future
 from collections import deque
-from collections.abc import Awaitable
+from collections.abc import AsyncIterator, Awaitable
+from concurrent.futures import Executor
 from functools import partial
 from itertools import chain
 from typing import (
     Any,
     Callable,
-    NamedTuple,
     TypeVar,
     cast,
 )
+from weakref import WeakKeyDictionary, ref
 
 import zmq as _zmq
 from zmq import EVENTS, POLLIN, POLLOUT
+from zmq.sugar.socket import _unpickle_frames
+from zmq.utils import jsonapi
 
 
-class _FutureEvent(NamedTuple):
-    future: Future
-    kind: str
-    args: tuple
-    kwargs: dict
-    msg: Any
-    timer: Any
+class _FutureEvent:
+    """A send or recv waiting in one of a socket's queues
+
+    Also the done-callback of its Future,
+    removing itself from the queue if the Future is resolved elsewhere
+    (e.g. cancelled, or timed out).
+    """
+
+    __slots__ = ("future", "kind", "args", "kwargs", "msg", "timer", "queue")
+
+    def __init__(
+        self,
+        future: Future,
+        kind: str,
+        args: tuple,
+        kwargs: dict,
+        msg: Any,
+        timer: Any,
+        queue: deque | None,
+    ) -> None:
+        self.future = future
+        self.kind = kind
+        self.args = args
+        self.kwargs = kwargs
+        self.msg = msg
+        self.timer = timer
+        # the queue this event is waiting in, None once consumed
+        self.queue = queue
+
+    def __call__(self, future: Future) -> None:
+        """Make sure that events are removed from the queue when they resolve
+
+        Avoids delaying cleanup until the next send/recv event,
+        which may never come.
+        """
+        queue = self.queue
+        if queue is None:
+            # consumed, already removed
+            return
+        self.queue = None
+        try:
+            queue.remove(self)
+        except ValueError:
+            pass
 
 
 # These are incomplete classes and need a Mixin for compatibility with an eventloop
@@ -195,6 +240,131 @@ class _NoTimer:
         pass
 
 
+class _WheelTimer:
+    """A timeout in a _TimerWheel bucket"""
+
+    __slots__ = ("bucket", "callback", "arg")
+
+    def __init__(self, bucket: dict, callback: Callable[[Any], Any], arg: Any) -> None:
+        self.bucket = bucket
+        self.callback = callback
+        self.arg = arg
+
+    def cancel(self) -> None:
+        self.bucket.pop(self, None)
+
+
+class _TimerWheel:
+    """Socket timeouts for one event loop, bucketed by deadline
+
+    Deadlines are rounded up to the next tick of `resolution` seconds,
+    and timeouts with the same tick share a bucket,
+    so adding and cancelling a timeout is O(1)
+    (plus O(log ticks) for the first timeout in a tick),
+    and the loop only has a timer per tick, not per timeout.
+    """
+
+    resolution = 0.01
+
+    def __init__(self, loop: Any) -> None:
+        # weak, so the loop can be collected from _timer_wheels
+        self.loop_ref = ref(loop)
+        # buckets of timers by tick
+        self.buckets: dict[int, dict[_WheelTimer, None]] = {}
+        # heap of ticks in buckets
+        self.ticks: list[int] = []
+        # the earliest tick with a loop callback scheduled
+        self.scheduled: int | None = None
+
+    def call_later(
+        self, delay: float, callback: Callable[[Any], Any], arg: Any
+    ) -> _WheelTimer:
+        """Call callback(arg) after delay (rounded up to the next tick)"""
+        loop = self.loop_ref()
+        tick = math.ceil((loop.time() + delay) / self.resolution)
+        bucket = self.buckets.get(tick)
+        if bucket is None:
+            bucket = self.buckets[tick] = {}
+            heapq.heappush(self.ticks, tick)
+            if self.ticks[0] == tick:
+                self._schedule(loop, tick)
+        timer = _WheelTimer(bucket, callback, arg)
+        bucket[timer] = None
+        return timer
+
+    def _schedule(self, loop: Any, tick: int) -> None:
+        if self.scheduled is not None and self.scheduled <= tick:
+            # an earlier callback will schedule this one when it fires
+            return
+        self.scheduled = tick
+        delay = max(tick * self.resolution - loop.time(), 0)
+        loop.call_later(delay, self._fire, tick)
+
+    def _fire(self, tick: int) -> None:
+        if tick == self.scheduled:
+            self.scheduled = None
+        loop = self.loop_ref()
+        if loop is None:
+            return
+        now = math.floor(loop.time() / self.resolution)
+        ticks = self.ticks
+        while ticks and ticks[0] <= now:
+            bucket = self.buckets.pop(heapq.heappop(ticks))
+            for timer in list(bucket):
+                try:
+                    timer.callback(timer.arg)
+                except Exception as e:
+                    # don't lose the rest of the bucket
+                    loop.call_exception_handler(
+                        {
+                            'message': 'Exception in socket timeout callback',
+                            'exception': e,
+                        }
+                    )
+        if ticks:
+            self._schedule(loop, ticks[0])
+
+
+# registry of event loop : _TimerWheel
+_timer_wheels: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def _get_timer_wheel(loop: Any) -> _TimerWheel:
+    """Get the _TimerWheel for an event loop"""
+    try:
+        return _timer_wheels[loop]
+    except KeyError:
+        wheel = _timer_wheels[loop] = _TimerWheel(loop)
+        return wheel
+
+
+def _future_timeout(future: Future) -> None:
+    """Raise EAGAIN on a send or recv Future that timed out"""
+    if future.done():
+        # future already resolved, do nothing
+        return
+    future.set_exception(_zmq.Again())
+
+
+def _chain_result(source: Any, target: Any) -> None:
+    """Resolve target with the outcome of source, unless it is already done"""
+    if target.done():
+        return
+    if source.cancelled():
+        target.cancel()
+    elif source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(source.result())
+
+
+def _message_size(msg: Any) -> int:
+    """The size in bytes of a received message (or list of parts)"""
+    if isinstance(msg, list):
+        return sum(len(part) for part in msg)
+    return len(msg)
+
+
 T = TypeVar("T", bound="_AsyncSocket")
 
 
@@ -203,6 +373,16 @@ class _AsyncSocket(_Async, _zmq.Socket[Future]):
     # They be overridden at instance initialization and not shared in the whole class
     _recv_futures = None
     _send_futures = None
+    _write_buffer = None
+    _drain_waiters = None
+    _write_exception: Exception | None = None
+    _write_paused = False
+    # write buffer watermarks, in messages
+    _write_high = 1000
+    _write_low = 250
+    # offloading (de)serialization, see set_serialization_offload
+    _offload_executor: Executor | None = None
+    _offload_threshold = 1 << 20
     _state = 0
     _shadow_sock: _zmq.Socket
     _poller_class = _AsyncPoller
@@ -234,6 +414,8 @@ class _AsyncSocket(_Async, _zmq.Socket[Future]):
             )
         self._recv_futures = deque()
         self._send_futures = deque()
+        self._write_buffer = deque()
+        self._drain_waiters = []
         self._state = 0
         self._fd = self._shadow_sock.FD
 
@@ -243,22 +425,47 @@ class _AsyncSocket(_Async, _zmq.Socket[Future]):
         return cls(_from_socket=socket, io_loop=io_loop)
 
     def close(self, linger: int | None = None) -> None:
+        """Close the socket.
+
+        Like :meth:`zmq.Socket.close`, and pending sends and receives are cancelled.
+
+        Messages in the :meth:`write_multipart` buffer are handed to libzmq
+        as far as it will take them without blocking, and the rest are discarded.
+        If any are discarded, waiting :meth:`drain` calls raise
+        :class:`ZMQError` (ENOTSOCK).
+        """
         if not self.closed and self._fd is not None:
-            event_list: list[_FutureEvent] = list(
-                chain(self._recv_futures or [], self._send_futures or [])
-            )
-            for event in event_list:
-                if not event.future.done():
+            if self._write_buffer:
+                # hand whatever fits to libzmq, subject to linger
+                self._flush_write_buffer()
+            if self._write_buffer:
+                # the rest is discarded, tell anyone waiting to drain
+                n = len(self._write_buffer)
+                self._write_buffer.clear()
+                for f in self._drain_waiters:
+                    if not f.done():
+                        f.set_exception(
+                            _zmq.ZMQError(
+                                _zmq.ENOTSOCK,
+                                f"Socket closed, discarding {n} buffered messages",
+                            )
+                        )
+                self._drain_waiters = []
+            futures: list[Future] = [
+                event.future
+                for event in chain(self._recv_futures or [], self._send_futures or [])
+            ]
+            futures.extend(self._drain_waiters or [])
+            for future in futures:
+                if not future.done():
                     try:
-                        event.future.cancel()
+                        future.cancel()
                     except RuntimeError:
                         # RuntimeError may be called during teardown
                         pass
             self._clear_io_state()
         super().close(linger=linger)
 
-    close.__doc__ = _zmq.Socket.close.__doc__
-
     def get(self, key):
         result = super().get(key)
         if key == EVENTS:
@@ -291,6 +498,32 @@ class _AsyncSocket(_Async, _zmq.Socket[Future]):
             'recv', kwargs=dict(flags=flags, copy=copy, track=track)
         )
 
+    def recv_many(  # type: ignore
+        self, max_messages: int, flags: int = 0, copy: bool = True, track: bool = False
+    ) -> Awaitable[list[bytes] | list[_zmq.Frame]]:
+        """Receive up to `max_messages` messages that are ready.
+
+        Returns a Future, whose result will be a list of at least one message.
+        """
+        return self._add_recv_event(
+            'recv_many',
+            args=(max_messages,),
+            kwargs=dict(flags=flags, copy=copy, track=track),
+        )
+
+    def recv_many_multipart(  # type: ignore
+        self, max_messages: int, flags: int = 0, copy: bool = True, track: bool = False
+    ) -> Awaitable[list[list[bytes]] | list[list[_zmq.Frame]]]:
+        """Receive up to `max_messages` multipart messages that are ready.
+
+        Returns a Future, whose result will be a list of at least one multipart message.
+        """
+        return self._add_recv_event(
+            'recv_many_multipart',
+            args=(max_messages,),
+            kwargs=dict(flags=flags, copy=copy, track=track),
+        )
+
     def recv_into(  # type: ignore
         self, buf, /, *, nbytes: int = 0, flags: int = 0
     ) -> Awaitable[int]:
@@ -302,6 +535,108 @@ class _AsyncSocket(_Async, _zmq.Socket[Future]):
             'recv_into', args=(buf,), kwargs=dict(nbytes=nbytes, flags=flags)
         )
 
+    def recv_multipart_into(  # type: ignore
+        self, buffers, flags: int = 0
+    ) -> Awaitable[list[int]]:
+        """Receive a multipart message into pre-allocated buffers.
+
+        Returns a Future, whose result will be the number of bytes in each frame.
+        """
+        return self._add_recv_event(
+            'recv_multipart_into', args=(buffers,), kwargs=dict(flags=flags)
+        )
+
+    def recv_arena(  # type: ignore
+        self, buf, /, *, max_frames: int = 0, flags: int = 0
+    ) -> Awaitable[tuple[array, list[bytes]]]:
+        """Receive pending messages into one pre-allocated buffer.
+
+        Returns a Future, whose result will be the (offset, length, more) index
+        and the message that did not fit, if any.
+        """
+        return self._add_recv_event(
+            'recv_arena',
+            args=(buf,),
+            kwargs=dict(max_frames=max_frames, flags=flags),
+        )
+
+    # how many messages iteration receives before yielding to the event loop
+    _iter_fairness = 64
+
+    def __aiter__(self) -> AsyncIterator[list[bytes]]:
+        """Iterate over received multipart messages
+
+        ``async for msg in socket`` is equivalent to calling
+        ``msg = await socket.recv_multipart()`` in a loop,
+        except that messages which are already waiting are received directly,
+        without a Future per message.
+        A timeout (RCVTIMEO) raises zmq.Again, as it does for recv.
+
+        .. versionadded:: 27.3
+        """
+        return self._iter_recv(0, copy=True, track=False)
+
+    def stream(
+        self, batch: int = 64, *, copy: bool = True, track: bool = False
+    ) -> AsyncIterator[list[list[bytes]] | list[list[_zmq.Frame]]]:
+        """Iterate over batches of received multipart messages
+
+        Each batch is a list of all the messages that are ready to be received,
+        up to `batch` messages, waiting for at least one.
+
+        .. versionadded:: 27.3
+
+        Parameters
+        ----------
+        batch : int
+            The maximum number of messages in each batch.
+        copy, track : bool
+            Passed to recv_multipart for each message.
+        """
+        if batch < 1:
+            raise ValueError(f"batch must be at least 1, not {batch}")
+        return self._iter_recv(batch, copy=copy, track=track)
+
+    async def _iter_recv(self, batch: int, copy: bool, track: bool):
+        """Receive ready messages without Futures, waiting for more with one
+
+        yields lists of up to `batch` messages, or single messages if batch is 0
+        """
+        recv_multipart = self._shadow_sock.recv_multipart
+        limit = batch or self._iter_fairness
+        while True:
+            if self._recv_futures:
+                # don't jump the queue of waiting recv calls
+                msg = await self.recv_multipart(copy=copy, track=track)
+                yield [msg] if batch else msg
+                continue
+            count = 0
+            msgs = []
+            try:
+                while count < limit:
+                    msg = recv_multipart(_zmq.DONTWAIT, copy=copy, track=track)
+                    count += 1
+                    if batch:
+                        msgs.append(msg)
+                    else:
+                        # yield messages as they are received,
+                        # so none are lost if iteration stops
+                        yield msg
+            except _zmq.Again:
+                pass
+            # receiving may have consumed the edge-triggered event
+            # other waiting Futures are relying on
+            self._schedule_remaining_events()
+            if count == 0:
+                # wait for the socket to be readable, with one Future
+                # raises Again on RCVTIMEO
+                await self._add_recv_event('poll')
+            elif batch:
+                yield msgs
+            if count == limit:
+                # messages keep coming, let other tasks run
+                await asyncio.sleep(0)
+
     def send_multipart(  # type: ignore
         self, msg_parts: Any, flags: int = 0, copy: bool = True, track=False, **kwargs
     ) -> Awaitable[_zmq.MessageTracker | None]:
@@ -314,6 +649,35 @@ class _AsyncSocket(_Async, _zmq.Socket[Future]):
         kwargs['track'] = track
         return self._add_send_event('send_multipart', msg=msg_parts, kwargs=kwargs)
 
+    def send_gather(  # type: ignore
+        self, buffers: Any, flags: int = 0
+    ) -> Awaitable[None]:
+        """Send a sequence of buffers as a single message frame.
+
+        Returns a Future that resolves when sending is complete.
+        """
+        if not isinstance(buffers, (list, tuple)):
+            buffers = list(buffers)
+        return self._add_send_event(
+            'send_gather', msg=buffers, kwargs=dict(flags=flags)
+        )
+
+    def send_many(  # type: ignore
+        self, msgs: Any, flags: int = 0, copy: bool = True
+    ) -> Awaitable[int]:
+        """Send a sequence of messages back-to-back.
+
+        Returns a Future that resolves to the number of messages sent
+        when all of them have been sent.
+        With DONTWAIT, it resolves right away with the number of messages
+        that could be sent without waiting.
+        """
+        if not isinstance(msgs, (list, tuple)):
+            msgs = list(msgs)
+        return self._add_send_event(
+            'send_many', msg=msgs, kwargs=dict(flags=flags, copy=copy)
+        )
+
     def send(  # type: ignore
         self,
         data: Any,
@@ -334,8 +698,12 @@ class _AsyncSocket(_Async, _zmq.Socket[Future]):
         kwargs.update(dict(flags=flags, copy=copy, track=track))
         return self._add_send_event('send', msg=data, kwargs=kwargs)
 
-    def _deserialize(self, recvd, load):
-        """Deserialize with Futures"""
+    def _deserialize(self, recvd, load, offload: bool | None = False):
+        """Deserialize with Futures
+
+        offload: whether to deserialize in the offload executor,
+        None to decide by the size of the message.
+        """
         f = self._Future()
 
         def _chain(_):
@@ -356,6 +724,11 @@ class _AsyncSocket(_Async, _zmq.Socket[Future]):
                 f.set_exception(recvd.exception())
             else:
                 buf = recvd.result()
+                if self._should_offload(offload, buf):
+                    self._run_in_executor(load, buf).add_done_callback(
+                        partial(_chain_result, target=f)
+                    )
+                    return
                 try:
                     loaded = load(buf)
                 except Exception as e:
@@ -376,6 +749,168 @@ class _AsyncSocket(_Async, _zmq.Socket[Future]):
 
         return f
 
+    def set_serialization_offload(
+        self, executor: Executor | None, threshold: int = 1 << 20
+    ) -> None:
+        """Deserialize large messages in an executor, instead of on the event loop.
+
+        Deserializing a large JSON or pickle message blocks the event loop,
+        stalling every other coroutine until it is done.
+        After calling this, :meth:`recv_json` and :meth:`recv_pyobj`
+        deserialize messages of at least `threshold` bytes
+        with :meth:`~asyncio.loop.run_in_executor`.
+        They also accept `offload=True` or `offload=False`
+        to offload (or not) regardless of size.
+        The size of an outgoing message isn't known before it is serialized,
+        so :meth:`send_json` and :meth:`send_pyobj` only offload with `offload=True`.
+
+        json and pickle hold the GIL while they run,
+        so in a ThreadPoolExecutor they still stall the event loop
+        (except on free-threaded Python).
+        A ProcessPoolExecutor does the parsing in another process,
+        leaving the loop only the cost of passing the message and the result
+        to and from the worker.
+        Pickles with `out_of_band=True` are never offloaded:
+        their buffers are passed without copying, leaving little to parse,
+        and their Frames can't be passed to another process.
+
+        Parameters
+        ----------
+        executor : concurrent.futures.Executor or None
+            The executor to use. None to stop offloading.
+        threshold : int
+            The size in bytes from which to deserialize in the executor.
+            Default: 1MB.
+
+        .. versionadded:: 27.3
+        """
+        if threshold < 0:
+            raise ValueError(f"threshold must be >= 0, not {threshold!r}")
+        self._offload_executor = executor
+        self._offload_threshold = threshold
+
+    def _should_offload(self, offload: bool | None, msg: Any) -> bool:
+        if self._offload_executor is None:
+            return False
+        if offload is None:
+            return _message_size(msg) >= self._offload_threshold
+        return offload
+
+    def _run_in_executor(self, func: Callable, arg: Any) -> Future:
+        """Call func(arg) in the offload executor"""
+        return self._get_loop().run_in_executor(self._offload_executor, func, arg)
+
+    def _send_offloaded(
+        self, dump: Callable, obj: Any, send: Callable
+    ) -> Awaitable[_zmq.MessageTracker | None]:
+        """Serialize obj in the offload executor, then send it
+
+        Returns a Future for the send.
+        """
+        f = self._Future()
+
+        def _send(serialized):
+            if f.done():
+                # cancelled before it was serialized, don't send it
+                return
+            if serialized.cancelled() or serialized.exception() is not None:
+                _chain_result(serialized, f)
+                return
+            try:
+                sent = send(serialized.result())
+            except Exception as e:
+                f.set_exception(e)
+            else:
+                sent.add_done_callback(partial(_chain_result, target=f))
+
+        self._run_in_executor(dump, obj).add_done_callback(_send)
+        return f
+
+    def send_json(  # type: ignore
+        self, obj: Any, flags: int = 0, *, offload: bool = False, **kwargs
+    ) -> Awaitable[_zmq.MessageTracker | None]:
+        """Send a Python object as a message using json to serialize.
+
+        With `offload=True`, serialize in the executor
+        set with :meth:`set_serialization_offload`, if any.
+        The message is sent once it has been serialized,
+        so sends made in the meantime may go first.
+        See :meth:`zmq.Socket.send_json`.
+        """
+        if not (offload and self._offload_executor):
+            return super().send_json(obj, flags, **kwargs)
+        send_kwargs = {}
+        for key in ('routing_id', 'group'):
+            if key in kwargs:
+                send_kwargs[key] = kwargs.pop(key)
+        return self._send_offloaded(
+            partial(jsonapi.dumps, **kwargs),
+            obj,
+            partial(self.send, flags=flags, **send_kwargs),
+        )
+
+    def recv_json(  # type: ignore
+        self, flags: int = 0, *, offload: bool | None = None, **kwargs
+    ) -> Awaitable[Any]:
+        """Receive a Python object as a message using json to serialize.
+
+        Large messages are deserialized in an executor,
+        see :meth:`set_serialization_offload`.
+        See :meth:`zmq.Socket.recv_json`.
+        """
+        msg = self.recv(flags)
+        return self._deserialize(msg, partial(jsonapi.loads, **kwargs), offload)
+
+    def send_pyobj(  # type: ignore
+        self,
+        obj: Any,
+        flags: int = 0,
+        protocol: int = pickle.DEFAULT_PROTOCOL,
+        *,
+        out_of_band: bool = False,
+        offload: bool = False,
+        **kwargs,
+    ) -> Awaitable[_zmq.MessageTracker | None]:
+        """Send a Python object as a message using pickle to serialize.
+
+        With `offload=True`, pickle in the executor
+        set with :meth:`set_serialization_offload`, if any,
+        unless `out_of_band=True`.
+        The message is sent once it has been pickled,
+        so sends made in the meantime may go first.
+        See :meth:`zmq.Socket.send_pyobj`.
+        """
+        if out_of_band or not (offload and self._offload_executor):
+            return super().send_pyobj(
+                obj, flags, protocol, out_of_band=out_of_band, **kwargs
+            )
+        return self._send_offloaded(
+            partial(pickle.dumps, protocol=protocol),
+            obj,
+            partial(self.send, flags=flags, **kwargs),
+        )
+
+    def recv_pyobj(  # type: ignore
+        self,
+        flags: int = 0,
+        *,
+        out_of_band: bool = False,
+        offload: bool | None = None,
+    ) -> Awaitable[Any]:
+        """Receive a Python object as a message using UNSAFE pickle to serialize.
+
+        Large messages are unpickled in an executor,
+        unless `out_of_band=True`,
+        see :meth:`set_serialization_offload`.
+        See :meth:`zmq.Socket.recv_pyobj`.
+        """
+        if out_of_band:
+            # Frames can't be passed to an executor in another process
+            frames = self.recv_multipart(flags, copy=False)
+            return self._deserialize(frames, _unpickle_frames)
+        msg = self.recv(flags)
+        return self._deserialize(msg, pickle.loads, offload)
+
     def poll(self, timeout=None, flags=_zmq.POLLIN) -> Awaitable[int]:  # type: ignore
         """poll the socket for events
 
@@ -428,16 +963,9 @@ class _AsyncSocket(_Async, _zmq.Socket[Future]):
 
     def _add_timeout(self, future, timeout):
         """Add a timeout for a send or recv Future"""
-
-        def future_timeout():
-            if future.done():
-                # future already resolved, do nothing
-                return
-
-            # raise EAGAIN
-            future.set_exception(_zmq.Again())
-
-        return self._call_later(timeout, future_timeout)
+        return _get_timer_wheel(self._get_loop()).call_later(
+            timeout, _future_timeout, future
+        )
 
     def _call_later(self, delay, callback):
         """Schedule a function to be called later
@@ -449,24 +977,6 @@ class _AsyncSocket(_Async, _zmq.Socket[Future]):
         """
         return self._get_loop().call_later(delay, callback)
 
-    @staticmethod
-    def _remove_finished_future(future, event_list, event=None):
-        """Make sure that futures are removed from the event list when they resolve
-
-        Avoids delaying cleanup until the next send/recv event,
-        which may never come.
-        """
-        # "future" instance is shared between sockets, but each socket has its own event list.
-        if not event_list:
-            return
-        # only unconsumed events (e.g. cancelled calls)
-        # will be present when this happens
-        try:
-            event_list.remove(event)
-        except ValueError:
-            # usually this will have been removed by being consumed
-            return
-
     def _add_recv_event(
         self,
         kind: str,
@@ -501,34 +1011,36 @@ class _AsyncSocket(_Async, _zmq.Socket[Future]):
         # we add it to the list of futures before we add the timeout as the
         # timeout will remove the future from recv_futures to avoid leaks
         _future_event = _FutureEvent(
-            f, kind, args=args, kwargs=kwargs, msg=None, timer=timer
+            f, kind, args, kwargs, None, timer, self._recv_futures
         )
         self._recv_futures.append(_future_event)
 
         if self._shadow_sock.get(EVENTS) & POLLIN:
             # recv immediately, if we can
             self._handle_recv()
-        if self._recv_futures and _future_event in self._recv_futures:
+        if _future_event.queue is not None:
             # Don't let the Future sit in _recv_events after it's done
             # no need to register this if we've already been handled
             # (i.e. immediately-resolved recv)
-            f.add_done_callback(
-                partial(
-                    self._remove_finished_future,
-                    event_list=self._recv_futures,
-                    event=_future_event,
-                )
-            )
+            # shared Futures (poll) may be in more than one socket's queue,
+            # each event removes itself from its own.
+            f.add_done_callback(_future_event)
             self._add_io_state(POLLIN)
         return f
 
     def _add_send_event(self, kind, msg=None, kwargs=None, future=None):
         """Add a send event, returning the corresponding Future"""
         f = future or self._Future()
+        # send_many remembers how many messages it was given
+        args = (len(msg),) if kind == 'send_many' else ()
         # attempt send with DONTWAIT if no futures are waiting
         # short-circuit for sends that will resolve immediately
         # only call if no send Futures are waiting
-        if kind in ('send', 'send_multipart') and not self._send_futures:
+        if (
+            kind in ('send', 'send_multipart', 'send_gather', 'send_many')
+            and not self._send_futures
+            and not self._write_buffer
+        ):
             flags = kwargs.get('flags', 0)
             nowait_kwargs = kwargs.copy()
             nowait_kwargs['flags'] = flags | _zmq.DONTWAIT
@@ -550,7 +1062,12 @@ class _AsyncSocket(_Async, _zmq.Socket[Future]):
             except Exception as e:
                 f.set_exception(e)
             else:
-                f.set_result(r)
+                if kind == 'send_many' and r < len(msg) and not flags & _zmq.DONTWAIT:
+                    # wait to send the rest
+                    msg = msg[r:]
+                    finish_early = False
+                else:
+                    f.set_result(r)
 
             if finish_early:
                 # short-circuit resolved, return finished Future
@@ -568,104 +1085,297 @@ class _AsyncSocket(_Async, _zmq.Socket[Future]):
         # we add it to the list of futures before we add the timeout as the
         # timeout will remove the future from recv_futures to avoid leaks
         _future_event = _FutureEvent(
-            f, kind, args=(), kwargs=kwargs, msg=msg, timer=timer
+            f, kind, args, kwargs, msg, timer, self._send_futures
         )
         self._send_futures.append(_future_event)
         # Don't let the Future sit in _send_futures after it's done
-        f.add_done_callback(
-            partial(
-                self._remove_finished_future,
-                event_list=self._send_futures,
-                event=_future_event,
-            )
-        )
+        f.add_done_callback(_future_event)
 
         self._add_io_state(POLLOUT)
         return f
 
+    def write_multipart(
+        self, msg_parts: Any, flags: int = 0, copy: bool = True
+    ) -> None:
+        """Queue a multipart message to be sent, without waiting.
+
+        Messages are sent right away if the socket can send,
+        otherwise they are buffered and sent in batches
+        as soon as the socket becomes writable again.
+
+        Use :meth:`drain` to wait for the buffer to empty enough
+        (like :meth:`asyncio.StreamWriter.drain`)::
+
+            for msg in messages:
+                socket.write_multipart(msg)
+                await socket.drain()
+
+        Errors from sending buffered messages are raised
+        by the next call to write_multipart or drain.
+        Messages are sent in order with :meth:`send` calls:
+        after the sends that are already waiting, and before later ones.
+
+        Closing the socket hands libzmq as many buffered messages as it
+        will take without blocking, and discards the rest.
+        If any are discarded, waiting :meth:`drain` calls raise
+        :class:`ZMQError` (ENOTSOCK).
+
+        .. versionadded:: 27.3
+        """
+        self._raise_write_exception()
+        if self._send_futures:
+            # keep messages in order, behind the last waiting send
+            self._write_buffer.append((msg_parts, flags, copy, self._send_futures[-1]))
+        elif self._write_buffer:
+            self._write_buffer.append((msg_parts, flags, copy, None))
+        else:
+            try:
+                self._shadow_sock.send_multipart(
+                    msg_parts, flags | _zmq.DONTWAIT, copy=copy
+                )
+            except _zmq.Again:
+                self._write_buffer.append((msg_parts, flags, copy, None))
+            else:
+                return
+        if len(self._write_buffer) > self._write_high:
+            self._write_paused = True
+        self._add_io_state(POLLOUT)
+
+    def drain(self) -> Awaitable[None]:
+        """Wait until the write buffer is small enough to keep writing.
+
+        Resolves immediately unless the buffer has grown beyond the high watermark,
+        in which case it resolves once it has been flushed down to the low watermark.
+        See :meth:`set_write_buffer_limits`.
+
+        .. versionadded:: 27.3
+        """
+        f = self._Future()
+        if self._write_exception is not None:
+            e, self._write_exception = self._write_exception, None
+            f.set_exception(e)
+        elif self._write_paused:
+            self._drain_waiters.append(f)
+        else:
+            f.set_result(None)
+        return f
+
+    def set_write_buffer_limits(
+        self, high: int | None = None, low: int | None = None
+    ) -> None:
+        """Set the high and low watermarks of the write buffer, in messages.
+
+        Like :meth:`asyncio.WriteTransport.set_write_buffer_limits`:
+        :meth:`drain` waits when more than `high` messages are buffered,
+        until the buffer has been flushed down to `low`.
+
+        The defaults are 1000 and 250.
+        If only `high` is given, `low` is a quarter of it.
+        If only `low` is given, `high` is four times it.
+
+        .. versionadded:: 27.3
+        """
+        if high is None:
+            high = 1000 if low is None else 4 * low
+        if low is None:
+            low = high // 4
+        if not high >= low >= 0:
+            raise ValueError(f"high ({high!r}) must be >= low ({low!r}) must be >= 0")
+        self._write_high = high
+        self._write_low = low
+        self._check_write_buffer()
+
+    def get_write_buffer_size(self) -> int:
+        """The number of messages waiting in the write buffer
+
+        .. versionadded:: 27.3
+        """
+        return len(self._write_buffer)
+
+    def _raise_write_exception(self) -> None:
+        if self._write_exception is not None:
+            e, self._write_exception = self._write_exception, None
+            raise e
+
+    def _flush_write_buffer(self) -> None:
+        """Send buffered messages until the socket would block
+
+        or until a message that must wait for an earlier send.
+        """
+        send_multipart = self._shadow_sock.send_multipart
+        buffer = self._write_buffer
+        while buffer:
+            msg_parts, flags, copy, after = buffer[0]
+            if after is not None and after.queue is not None:
+                # written after a send that is still waiting
+                break
+            try:
+                send_multipart(msg_parts, flags | _zmq.DONTWAIT, copy=copy)
+            except _zmq.Again:
+                break
+            except Exception as e:
+                # drop the message, raise on the next write or drain
+                buffer.popleft()
+                self._write_exception = e
+                break
+            buffer.popleft()
+        self._check_write_buffer()
+
+    def _check_write_buffer(self) -> None:
+        """Pause or resume writing, according to the watermarks"""
+        size = len(self._write_buffer)
+        if size > self._write_high:
+            self._write_paused = True
+        elif self._write_paused and size <= self._write_low:
+            self._write_paused = False
+        if self._write_exception is not None or not self._write_paused:
+            waiters, self._drain_waiters = self._drain_waiters, []
+            for f in waiters:
+                if f.done():
+                    continue
+                if self._write_exception is not None:
+                    e, self._write_exception = self._write_exception, None
+                    f.set_exception(e)
+                else:
+                    f.set_result(None)
+
     def _handle_recv(self):
-        """Handle recv events"""
+        """Handle recv events
+
+        Resolves as many waiting recv Futures as there are messages ready,
+        instead of one per event.
+        """
         if not self._shadow_sock.get(EVENTS) & POLLIN:
             # event triggered, but state may have been changed between trigger and callback
             return
-        f = None
         while self._recv_futures:
-            f, kind, args, kwargs, _, timer = self._recv_futures.popleft()
+            event = self._recv_futures.popleft()
+            # consumed, no need to remove it from the queue when resolved
+            event.queue = None
+            f = event.future
             # skip any cancelled futures
             if f.done():
-                f = None
+                continue
+            kind = event.kind
+            kwargs = event.kwargs
+            timer = event.timer
+
+            if kind == 'poll':
+                # on poll event, just signal ready, nothing else.
+                timer.cancel()
+                f.set_result(None)
+                continue
+            elif kind == 'recv_multipart':
+                recv = self._shadow_sock.recv_multipart
+            elif kind == 'recv':
+                recv = self._shadow_sock.recv
+            elif kind == 'recv_into':
+                recv = self._shadow_sock.recv_into
+            elif kind == 'recv_multipart_into':
+                recv = self._shadow_sock.recv_multipart_into
+            elif kind == 'recv_arena':
+                recv = self._shadow_sock.recv_arena
+            elif kind == 'recv_many':
+                recv = self._shadow_sock.recv_many
+            elif kind == 'recv_many_multipart':
+                recv = self._shadow_sock.recv_many_multipart
             else:
+                raise ValueError(f"Unhandled recv event type: {kind!r}")
+
+            kwargs['flags'] |= _zmq.DONTWAIT
+            try:
+                result = recv(*event.args, **kwargs)
+            except _zmq.Again:
+                # no more messages, keep waiting
+                event.queue = self._recv_futures
+                self._recv_futures.appendleft(event)
                 break
+            except Exception as e:
+                timer.cancel()
+                f.set_exception(e)
+            else:
+                timer.cancel()
+                f.set_result(result)
 
         if not self._recv_futures:
             self._drop_io_state(POLLIN)
 
-        if f is None:
-            return
-
-        timer.cancel()
-
-        if kind == 'poll':
-            # on poll event, just signal ready, nothing else.
-            f.set_result(None)
-            return
-        elif kind == 'recv_multipart':
-            recv = self._shadow_sock.recv_multipart
-        elif kind == 'recv':
-            recv = self._shadow_sock.recv
-        elif kind == 'recv_into':
-            recv = self._shadow_sock.recv_into
-        else:
-            raise ValueError(f"Unhandled recv event type: {kind!r}")
-
-        kwargs['flags'] |= _zmq.DONTWAIT
-        try:
-            result = recv(*args, **kwargs)
-        except Exception as e:
-            f.set_exception(e)
-        else:
-            f.set_result(result)
-
     def _handle_send(self):
+        """Handle send events
+
+        Resolves as many waiting send Futures as can be sent without blocking,
+        instead of one per event, interleaved with the write buffer
+        in the order they were made.
+        """
         if not self._shadow_sock.get(EVENTS) & POLLOUT:
             # event triggered, but state may have been changed between trigger and callback
             return
-        f = None
-        while self._send_futures:
-            f, kind, args, kwargs, msg, timer = self._send_futures.popleft()
+        while True:
+            if self._write_buffer:
+                # buffered writes that aren't waiting for an earlier send
+                self._flush_write_buffer()
+                if self._write_buffer and (
+                    self._write_buffer[0][3] is None
+                    or self._write_buffer[0][3].queue is None
+                ):
+                    # blocked
+                    return
+            if not self._send_futures:
+                break
+            event = self._send_futures.popleft()
+            # consumed, no need to remove it from the queue when resolved
+            event.queue = None
+            f = event.future
             # skip any cancelled futures
             if f.done():
-                f = None
+                continue
+            kind = event.kind
+            kwargs = event.kwargs
+            timer = event.timer
+
+            if kind == 'poll':
+                # on poll event, just signal ready, nothing else.
+                timer.cancel()
+                f.set_result(None)
+                continue
+            elif kind == 'send_multipart':
+                send = self._shadow_sock.send_multipart
+            elif kind == 'send':
+                send = self._shadow_sock.send
+            elif kind == 'send_gather':
+                send = self._shadow_sock.send_gather
+            elif kind == 'send_many':
+                send = self._shadow_sock.send_many
             else:
+                raise ValueError(f"Unhandled send event type: {kind!r}")
+
+            kwargs['flags'] |= _zmq.DONTWAIT
+            try:
+                result = send(event.msg, **kwargs)
+            except _zmq.Again:
+                # can't send any more, keep waiting
+                event.queue = self._send_futures
+                self._send_futures.appendleft(event)
                 break
+            except Exception as e:
+                timer.cancel()
+                f.set_exception(e)
+            else:
+                if kind == 'send_many':
+                    if result < len(event.msg):
+                        # sent what we could, keep waiting to send the rest
+                        event.msg = event.msg[result:]
+                        event.queue = self._send_futures
+                        self._send_futures.appendleft(event)
+                        break
+                    # the number of messages the Future was given
+                    result = event.args[0]
+                timer.cancel()
+                f.set_result(result)
 
         if not self._send_futures:
             self._drop_io_state(POLLOUT)
 
-        if f is None:
-            return
-
-        timer.cancel()
-
-        if kind == 'poll':
-            # on poll event, just signal ready, nothing else.
-            f.set_result(None)
-            return
-        elif kind == 'send_multipart':
-            send = self._shadow_sock.send_multipart
-        elif kind == 'send':
-            send = self._shadow_sock.send
-        else:
-            raise ValueError(f"Unhandled send event type: {kind!r}")
-
-        kwargs['flags'] |= _zmq.DONTWAIT
-        try:
-            result = send(msg, **kwargs)
-        except Exception as e:
-            f.set_exception(e)
-        else:
-            f.set_result(result)
-
     # event masking from ZMQStream
     def _handle_events(self, fd=0, events=0):
         """Dispatch IO events to _handle_recv, etc."""
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from array import array
 from asyncio import Future
-from collections.abc import Awaitable, Sequence
+from collections.abc import AsyncIterator, Awaitable, Sequence
+from concurrent.futures import Executor
 from pickle import DEFAULT_PROTOCOL
 from typing import Any, Literal, TypeVar, overload
 
@@ -42,9 +44,84 @@ class _AsyncSocket(_zmq.Socket[Future]):
     def recv(
         self, flags: int = 0, copy: bool = True, track: bool = False
     ) -> Awaitable[bytes | _zmq.Frame]: ...
+    @overload  # type: ignore
+    def recv_many(
+        self,
+        max_messages: int,
+        flags: int = 0,
+        copy: Literal[True] = True,
+        track: bool = False,
+    ) -> Awaitable[list[bytes]]: ...
+    @overload
+    def recv_many(
+        self,
+        max_messages: int,
+        flags: int = 0,
+        *,
+        copy: Literal[False],
+        track: bool = False,
+    ) -> Awaitable[list[_zmq.Frame]]: ...
+    @overload
+    def recv_many(
+        self, max_messages: int, flags: int = 0, copy: bool = True, track: bool = False
+    ) -> Awaitable[list[bytes] | list[_zmq.Frame]]: ...
+    @overload  # type: ignore
+    def recv_many_multipart(
+        self,
+        max_messages: int,
+        flags: int = 0,
+        copy: Literal[True] = True,
+        track: bool = False,
+    ) -> Awaitable[list[list[bytes]]]: ...
+    @overload
+    def recv_many_multipart(
+        self,
+        max_messages: int,
+        flags: int = 0,
+        *,
+        copy: Literal[False],
+        track: bool = False,
+    ) -> Awaitable[list[list[_zmq.Frame]]]: ...
+    @overload
+    def recv_many_multipart(
+        self, max_messages: int, flags: int = 0, copy: bool = True, track: bool = False
+    ) -> Awaitable[list[list[bytes]] | list[list[_zmq.Frame]]]: ...
     def recv_into(  # type: ignore
         self, buffer: Any, /, *, nbytes: int = 0, flags: int = 0
     ) -> Awaitable[int]: ...
+    def recv_multipart_into(  # type: ignore
+        self, buffers: Sequence[Any], flags: int = 0
+    ) -> Awaitable[list[int]]: ...
+    def recv_arena(  # type: ignore
+        self, buffer: Any, /, *, max_frames: int = 0, flags: int = 0
+    ) -> Awaitable[tuple[array, list[bytes]]]: ...
+    def write_multipart(
+        self, msg_parts: Sequence, flags: int = 0, copy: bool = True
+    ) -> None: ...
+    def drain(self) -> Awaitable[None]: ...
+    def set_write_buffer_limits(
+        self, high: int | None = None, low: int | None = None
+    ) -> None: ...
+    def get_write_buffer_size(self) -> int: ...
+    def __aiter__(self) -> AsyncIterator[list[bytes]]: ...
+    @overload
+    def stream(
+        self, batch: int = 64, *, copy: Literal[True] = ..., track: bool = False
+    ) -> AsyncIterator[list[list[bytes]]]: ...
+    @overload
+    def stream(
+        self, batch: int = 64, *, copy: Literal[False], track: bool = False
+    ) -> AsyncIterator[list[list[_zmq.Frame]]]: ...
+    @overload
+    def stream(
+        self, batch: int = 64, *, copy: bool = True, track: bool = False
+    ) -> AsyncIterator[list[list[bytes]] | list[list[_zmq.Frame]]]: ...
+    def send_gather(  # type: ignore
+        self, buffers: Sequence[Any], flags: int = 0
+    ) -> Awaitable[None]: ...
+    def send_many(  # type: ignore
+        self, msgs: Sequence[Any], flags: int = 0, copy: bool = True
+    ) -> Awaitable[int]: ...
     def send_multipart(  # type: ignore
         self,
         msg_parts: Sequence,
@@ -86,11 +163,35 @@ class _AsyncSocket(_zmq.Socket[Future]):
         self, flags: int = 0, encoding: str = 'utf-8'
     ) -> Awaitable[str]: ...
     def send_pyobj(  # type: ignore
-        self, obj: Any, flags: int = 0, protocol: int = DEFAULT_PROTOCOL, **kwargs
+        self,
+        obj: Any,
+        flags: int = 0,
+        protocol: int = DEFAULT_PROTOCOL,
+        *,
+        out_of_band: bool = False,
+        offload: bool = False,
+        **kwargs,
     ) -> Awaitable[_zmq.Frame | None]: ...
-    def recv_pyobj(self, flags: int = 0) -> Awaitable[Any]: ...
+    def recv_pyobj(  # type: ignore
+        self,
+        flags: int = 0,
+        *,
+        out_of_band: bool = False,
+        offload: bool | None = None,
+    ) -> Awaitable[Any]: ...
     def send_json(  # type: ignore
-        self, obj: Any, flags: int = 0, **kwargs
+        self, obj: Any, flags: int = 0, *, offload: bool = False, **kwargs
     ) -> Awaitable[_zmq.Frame | None]: ...
-    def recv_json(self, flags: int = 0, **kwargs) -> Awaitable[Any]: ...  # type: ignore
+    def recv_json(  # type: ignore
+        self, flags: int = 0, *, offload: bool | None = None, **kwargs
+    ) -> Awaitable[Any]: ...
+    def set_serialization_offload(
+        self, executor: Executor | None, threshold: int = ...
+    ) -> None: ...
+    def send_array(  # type: ignore
+        self, A: Any, flags: int = 0, copy: bool = True, track: bool = False, **kwargs
+    ) -> Awaitable[_zmq.MessageTracker | None]: ...
+    def recv_array(  # type: ignore
+        self, flags: int = 0, copy: bool = True, track: bool = False, out: Any = None
+    ) -> Awaitable[Any]: ...
     def poll(self, timeout=-1) -> Awaitable[list[tuple[Any, int]]]: ...  # type: ignore
@@ -12,13 +12,16 @@ import selectors
 import sys
 import warnings
 from asyncio import Future, SelectorEventLoop
-from weakref import WeakKeyDictionary
+from typing import Any
+from weakref import WeakKeyDictionary, WeakSet, ref
 
 import zmq as _zmq
 from zmq import _future
 
 # registry of asyncio loop : selector thread
 _selectors: WeakKeyDictionary = WeakKeyDictionary()
+# registry of asyncio loop : _Dispatcher
+_dispatchers: WeakKeyDictionary = WeakKeyDictionary()
 
 
 class ProactorSelectorThreadWarning(RuntimeWarning):
@@ -98,6 +101,72 @@ else:
     _get_selector = _get_selector_noop
 
 
+class _Dispatcher:
+    """Handle events for all the async sockets on one event loop
+
+    ZMQ_FD is edge-triggered, so a socket has to check its events
+    whenever its FD fires, and again after each recv/send,
+    in case more are ready.
+    Instead of each socket scheduling its own callback to do that,
+    sockets are marked as pending here,
+    and once per loop iteration a single zmq_poll
+    checks all the pending sockets that are waiting for something,
+    dispatching events to the ones that are ready.
+    Any PersistentPollers watching the pending sockets are woken afterward.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        # weak, so the loop can be collected from _dispatchers
+        self.loop_ref = ref(loop)
+        self.pending: dict[Socket, None] = {}
+        self.scheduled = False
+
+    def mark(self, socket: Socket) -> None:
+        """Check a socket for events on the next iteration"""
+        self.pending[socket] = None
+        if not self.scheduled:
+            loop = self.loop_ref()
+            if loop is not None and not loop.is_closed():
+                self.scheduled = True
+                loop.call_soon(self.dispatch)
+
+    def discard(self, socket: Socket) -> None:
+        self.pending.pop(socket, None)
+
+    def dispatch(self) -> None:
+        """Poll the pending sockets at once, and handle their events"""
+        self.scheduled = False
+        pending, self.pending = self.pending, {}
+        sockets = []
+        pollers: set[PersistentPoller] = set()
+        for socket in pending:
+            if socket._pollers:
+                pollers.update(socket._pollers)
+            if socket._state and not socket.closed:
+                sockets.append((socket, socket._state))
+        if sockets:
+            try:
+                ready = _zmq.zmq_poll(sockets, 0)
+            except _zmq.ZMQError:
+                # e.g. a socket closed by another thread, check them one at a time
+                for socket, _ in sockets:
+                    socket._handle_events()
+            else:
+                for socket, events in ready:
+                    socket._dispatch_events(events)
+        for poller in pollers:
+            poller._wake()
+
+
+def _get_dispatcher(loop: asyncio.AbstractEventLoop) -> _Dispatcher:
+    """Get the _Dispatcher for an event loop"""
+    try:
+        return _dispatchers[loop]
+    except KeyError:
+        dispatcher = _dispatchers[loop] = _Dispatcher(loop)
+        return dispatcher
+
+
 class _AsyncIO:
     _Future = Future
     _WRITE = selectors.EVENT_WRITE
@@ -135,6 +204,190 @@ class Poller(_AsyncIO, _future._AsyncPoller):
             selector.remove_writer(socket)
 
 
+class PersistentPoller(Poller):
+    """Poller that keeps watching its sockets between calls to poll.
+
+    :class:`Poller` sets up a watcher for each registered socket
+    on every call to :meth:`poll`, and tears them all down when it returns.
+    PersistentPoller sets up a socket's watcher when it is registered,
+    and keeps it until the socket is unregistered,
+    so :meth:`poll` only has to check for events and wait for the next ones.
+    This is much cheaper when polling the same sockets in a loop, e.g. in a proxy.
+
+    Only one call to :meth:`poll` may wait at a time.
+
+    .. versionadded:: 27.3
+    """
+
+    # registered zmq socket : the async socket whose watcher is used
+    _watched: dict[Any, Socket]
+    # registered raw sockets being watched
+    _raw_watched: set[Any]
+    # raw sockets are level-triggered,
+    # so stop watching them when one is ready and poll is not waiting
+    _raw_paused: bool = False
+    _watch_loop: asyncio.AbstractEventLoop | None = None
+    _waiter: Future | None = None
+
+    def __init__(self, use_zmq_poller: bool = False) -> None:
+        super().__init__(use_zmq_poller)
+        self._watched = {}
+        self._raw_watched = set()
+
+    def register(self, socket: Any, flags: int = _zmq.POLLIN | _zmq.POLLOUT):
+        super().register(socket, flags)
+        if flags and self._watch_loop is not None:
+            self._watch(socket, flags)
+
+    register.__doc__ = _zmq.Poller.register.__doc__
+
+    def unregister(self, socket: Any):
+        self._unwatch(socket)
+        super().unregister(socket)
+
+    unregister.__doc__ = _zmq.Poller.unregister.__doc__
+
+    def _watch(self, socket: Any, flags: int) -> None:
+        """Start watching a registered socket on the current loop"""
+        if isinstance(socket, _zmq.Socket):
+            watched = self._watched.get(socket)
+            if watched is None:
+                if isinstance(socket, self._socket_class):
+                    watched = socket
+                else:
+                    # it's a blocking zmq.Socket, wrap it in async for its watcher
+                    watched = self._socket_class.from_socket(socket)
+                self._watched[socket] = watched
+                if watched._pollers is None:
+                    watched._pollers = WeakSet()
+                watched._pollers.add(self)
+            # registers the FD reader on this loop
+            watched._get_loop()
+            return
+
+        if socket in self._raw_watched:
+            # modified
+            self._unwatch_raw_sockets(self._watch_loop, socket)
+        self._raw_watched.add(socket)
+        if not self._raw_paused:
+            self._watch_raw_socket(
+                self._watch_loop, socket, self._raw_events(flags), self._wake_raw
+            )
+
+    def _raw_events(self, flags: int) -> int:
+        evt = 0
+        if flags & _zmq.POLLIN:
+            evt |= self._READ
+        if flags & _zmq.POLLOUT:
+            evt |= self._WRITE
+        return evt
+
+    def _unwatch(self, socket: Any) -> None:
+        """Stop watching a socket"""
+        watched = self._watched.pop(socket, None)
+        if watched is not None:
+            if watched._pollers:
+                watched._pollers.discard(self)
+            if watched is not socket:
+                watched._clear_io_state()
+        elif socket in self._raw_watched:
+            self._raw_watched.discard(socket)
+            if not self._raw_paused:
+                self._unwatch_raw_sockets(self._watch_loop, socket)
+
+    def _watch_all(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Watch all the registered sockets on a (new) loop"""
+        for socket in list(self._watched) + list(self._raw_watched):
+            self._unwatch(socket)
+        self._watch_loop = loop
+        self._raw_paused = False
+        for socket, flags in self.sockets:
+            self._watch(socket, flags)
+
+    def _resume_raw(self) -> None:
+        self._raw_paused = False
+        for socket, flags in self.sockets:
+            if socket in self._raw_watched:
+                self._watch_raw_socket(
+                    self._watch_loop, socket, self._raw_events(flags), self._wake_raw
+                )
+
+    def _poll_ready(self) -> list[tuple[Any, int]]:
+        """Check for events without waiting"""
+        result = _zmq.Poller.poll(self, 0)
+        for socket, events in result:
+            watched = self._watched.get(socket)
+            if watched is not None and watched._state:
+                # retrieving events resets the FD,
+                # so the socket has to check for its own waiting recv/send
+                watched._schedule_remaining_events(events)
+        return result
+
+    def _resolve(self, future: Future, timed_out: bool = False) -> None:
+        """Resolve a waiting poll, if there are events (or it timed out)"""
+        if future.done():
+            return
+        try:
+            result = self._poll_ready()
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            if not (result or timed_out):
+                return
+            future.set_result(result)
+        if self._waiter is future:
+            self._waiter = None
+
+    def _wake(self) -> None:
+        """Called when a watched zmq socket may have events"""
+        if self._waiter is not None:
+            self._resolve(self._waiter)
+
+    def _wake_raw(self) -> None:
+        """Called when a watched raw socket is ready"""
+        if self._waiter is None:
+            # not waiting, pause until the next poll instead of busy-looping
+            self._unwatch_raw_sockets(self._watch_loop, *self._raw_watched)
+            self._raw_paused = True
+        else:
+            self._resolve(self._waiter)
+
+    def poll(self, timeout=-1) -> Future[list[tuple[Any, int]]]:  # type: ignore
+        """Return a Future for the next poll events
+
+        Resolves immediately if there are events ready,
+        otherwise with the first events to arrive, or an empty list on timeout.
+        """
+        future: Future = self._Future()
+        loop = self._get_loop()
+        if loop is not self._watch_loop:
+            self._watch_all(loop)
+        elif self._raw_paused:
+            self._resume_raw()
+
+        if self._waiter is not None:
+            future.set_exception(RuntimeError("Already waiting for poll"))
+            return future
+
+        self._resolve(future, timed_out=timeout == 0)
+        if future.done():
+            return future
+
+        self._waiter = future
+        timer = None
+        if timeout is not None and timeout > 0:
+            timer = loop.call_later(1e-3 * timeout, self._resolve, future, True)
+
+        def _poll_done(f):
+            if timer is not None:
+                timer.cancel()
+            if self._waiter is f:
+                self._waiter = None
+
+        future.add_done_callback(_poll_done)
+        return future
+
+
 class Socket(_AsyncIO, _future._AsyncSocket):
     """Socket returning asyncio Futures for send/recv/poll methods."""
 
@@ -145,21 +398,57 @@ class Socket(_AsyncIO, _future._AsyncSocket):
             io_loop = self._get_loop()
         return _get_selector(io_loop)
 
+    _dispatcher: _Dispatcher | None = None
+    # PersistentPollers watching this socket,
+    # weak so a poller that is dropped without unregistering can be collected
+    _pollers: WeakSet[PersistentPoller] | None = None
+
     def _init_io_state(self, io_loop=None):
         """initialize the ioloop event handler"""
-        self._get_selector(io_loop).add_reader(
-            self._fd, lambda: self._handle_events(0, 0)
-        )
+        if io_loop is None:
+            io_loop = self._get_loop()
+        if self._dispatcher is not None:
+            # moved to a new loop
+            self._dispatcher.discard(self)
+        self._dispatcher = dispatcher = _get_dispatcher(io_loop)
+        self._get_selector(io_loop).add_reader(self._fd, dispatcher.mark, self)
+        dispatcher.mark(self)
 
     def _clear_io_state(self):
         """clear any ioloop event handler
 
         called once at close
         """
+        if self._dispatcher is not None:
+            self._dispatcher.discard(self)
         loop = self._current_loop
         if loop and not loop.is_closed() and self._fd != -1:
             self._get_selector(loop).remove_reader(self._fd)
 
+    def _schedule_remaining_events(self, events=None):
+        """Check for events with all pending sockets on the next iteration
+
+        via the loop's _Dispatcher, instead of a callback per socket
+        """
+        if self._state == 0:
+            # not watching for anything, nothing to schedule
+            return
+        if events is not None and not events & self._state:
+            return
+        if self._dispatcher is None:
+            # registers with the dispatcher
+            self._get_loop()
+        else:
+            self._dispatcher.mark(self)
+
+    def _dispatch_events(self, events):
+        """Handle events found by the _Dispatcher"""
+        if events & _zmq.POLLIN:
+            self._handle_recv()
+        if events & _zmq.POLLOUT:
+            self._handle_send()
+        self._schedule_remaining_events()
+
 
 Poller._socket_class = Socket
 
@@ -219,6 +508,7 @@ __all__ = [
     "Context",
     "Socket",
     "Poller",
+    "PersistentPoller",
     "ZMQEventLoop",
     "install",
 ]
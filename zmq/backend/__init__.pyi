@@ -1,3 +1,4 @@
+from array import array
 from collections.abc import Sequence
 from typing import Any, Final, Protocol, overload, type_check_only
 
@@ -39,6 +40,8 @@ class Frame:
         track: bool = False,
         copy: bool | None = None,
         copy_threshold: int | None = None,
+        completion_queue: zmq.CompletionQueue | None = None,
+        token: Any = None,
     ) -> None: ...
     def __len__(self) -> int: ...
     def __copy__(self) -> Self: ...
@@ -179,6 +182,90 @@ class Socket:
     def recv_into(
         self, buffer: Buffer, /, *, nbytes: int = 0, flags: int = 0
     ) -> int: ...
+    def recv_multipart_into(
+        self, buffers: Sequence[Buffer], flags: int = 0
+    ) -> list[int]: ...
+    def recv_arena(
+        self, buffer: Buffer, /, *, max_frames: int = 0, flags: int = 0
+    ) -> tuple[array, list[bytes]]: ...
+
+    #
+    def send_multipart(
+        self,
+        msg_parts: Sequence[Frame | Buffer],
+        flags: int = 0,
+        copy: bool = True,
+        track: bool = False,
+    ) -> zmq.MessageTracker | None: ...
+    def send_gather(
+        self,
+        buffers: Sequence[Frame | Buffer],
+        flags: int = 0,
+    ) -> None: ...
+    def send_many(
+        self,
+        msgs: Sequence[Frame | Buffer | Sequence[Frame | Buffer]],
+        flags: int = 0,
+        copy: bool = True,
+    ) -> int: ...
+    @overload  # copy=True (default)
+    def recv_multipart(
+        self, flags: int = 0, copy: Literal[True] = True, track: bool = False
+    ) -> list[bytes]: ...
+    @overload  # copy=False (keyword)
+    def recv_multipart(
+        self, flags: int = 0, *, copy: Literal[False], track: bool = False
+    ) -> list[zmq.Frame]: ...
+    @overload  # copy=False (positional)
+    def recv_multipart(
+        self, flags: int, copy: Literal[False], track: bool = False
+    ) -> list[zmq.Frame]: ...
+    @overload  # fallback overload (mypy bug workaround)
+    def recv_multipart(
+        self, flags: int = 0, copy: bool = True, track: bool = False
+    ) -> list[bytes] | list[zmq.Frame]: ...
+    @overload
+    def recv_many(
+        self,
+        max_messages: int,
+        flags: int = 0,
+        copy: Literal[True] = True,
+        track: bool = False,
+    ) -> list[bytes]: ...
+    @overload
+    def recv_many(
+        self,
+        max_messages: int,
+        flags: int = 0,
+        *,
+        copy: Literal[False],
+        track: bool = False,
+    ) -> list[zmq.Frame]: ...
+    @overload
+    def recv_many(
+        self, max_messages: int, flags: int = 0, copy: bool = True, track: bool = False
+    ) -> list[bytes] | list[zmq.Frame]: ...
+    @overload
+    def recv_many_multipart(
+        self,
+        max_messages: int,
+        flags: int = 0,
+        copy: Literal[True] = True,
+        track: bool = False,
+    ) -> list[list[bytes]]: ...
+    @overload
+    def recv_many_multipart(
+        self,
+        max_messages: int,
+        flags: int = 0,
+        *,
+        copy: Literal[False],
+        track: bool = False,
+    ) -> list[list[zmq.Frame]]: ...
+    @overload
+    def recv_many_multipart(
+        self, max_messages: int, flags: int = 0, copy: bool = True, track: bool = False
+    ) -> list[list[bytes]] | list[list[zmq.Frame]]: ...
 
 class Context:
     handle: int
@@ -214,6 +301,18 @@ def zmq_poll(
     timeout: int = -1,
 ) -> list[tuple[int, int]]: ...
 
+class _PollItems:
+    def __len__(self) -> int: ...
+    def append(self, socket: Socket | int | HasFileno, events: int) -> None: ...
+    def modify(self, idx: int, events: int) -> None: ...
+    def remove(self, idx: int) -> None: ...
+    def poll(self, timeout: int = -1) -> list[tuple[Any, int]]: ...
+
+class _DraftPollItems(_PollItems): ...
+
+def _gc_queue_allocate() -> int: ...
+def _gc_queue_drain(queue_addr: int) -> list[int]: ...
+
 #
 def proxy(frontend: Socket, backend: Socket, capture: Socket | None = None) -> int: ...
 def proxy_steerable(
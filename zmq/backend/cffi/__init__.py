@@ -28,10 +28,12 @@ for submod in (error, message, context, socket, _poll, devices, utils):
     __all__.extend(submod.__all__)
 
 from ._poll import *
+from ._poll import _DraftPollItems, _PollItems
 from .context import *
 from .devices import *
 from .error import *
 from .message import *
+from .message import _gc_queue_allocate, _gc_queue_drain
 from .socket import *
 from .utils import *
 
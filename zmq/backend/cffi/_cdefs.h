@@ -40,6 +40,7 @@ int zmq_msg_init_data(zmq_msg_t *msg,
 size_t zmq_msg_size(zmq_msg_t *msg);
 void *zmq_msg_data(zmq_msg_t *msg);
 int zmq_msg_close(zmq_msg_t *msg);
+int zmq_msg_more(zmq_msg_t *msg);
 
 int zmq_msg_copy(zmq_msg_t *dst, zmq_msg_t *src);
 int zmq_msg_send(zmq_msg_t *msg, void *socket, int flags);
@@ -73,6 +74,21 @@ void *zmq_poller_new ();
 int zmq_poller_destroy (void **poller_p_);
 int zmq_poller_add (void *poller_, void *socket_, void *user_data_, short events_);
 int zmq_poller_fd (void *poller_, ZMQ_FD_T *fd_);
+int zmq_poller_modify (void *poller_, void *socket_, short events_);
+int zmq_poller_remove (void *poller_, void *socket_);
+int zmq_poller_add_fd (void *poller_, ZMQ_FD_T fd_, void *user_data_, short events_);
+int zmq_poller_modify_fd (void *poller_, ZMQ_FD_T fd_, short events_);
+int zmq_poller_remove_fd (void *poller_, ZMQ_FD_T fd_);
+
+typedef struct
+{
+    void *socket;
+    ZMQ_FD_T fd;
+    void *user_data;
+    short events;
+} zmq_poller_event_t;
+
+int zmq_poller_wait_all (void *poller_, zmq_poller_event_t *events_, int n_events_, long timeout_);
 
 // miscellany
 void * memcpy(void *restrict s1, const void *restrict s2, size_t n);
@@ -80,15 +96,16 @@ void * malloc(size_t sz);
 void free(void *p);
 int get_ipc_path_max_len(void);
 
-typedef struct { ...; } mutex_t;
+typedef struct { ...; } gc_queue_t;
 
 typedef struct _zhint {
     void *sock;
-    mutex_t *mutex;
+    gc_queue_t *queue;
     size_t id;
 } zhint;
 
-mutex_t* mutex_allocate();
+gc_queue_t* gc_queue_allocate(void);
+size_t gc_queue_drain(gc_queue_t *queue, size_t *out, size_t n);
 
 int zmq_wrap_msg_init_data(zmq_msg_t *msg,
                       void *data,
@@ -3,13 +3,14 @@
 
 #include "pyversion_compat.h"
 #include "mutex.h"
+#include "gcqueue.h"
 #include "ipcmaxlen.h"
 #include "zmq_compat.h"
 #include <zmq.h>
 
 typedef struct _zhint {
   void *sock;
-  mutex_t *mutex;
+  gc_queue_t *queue;
   size_t id;
 } zhint;
 
@@ -18,28 +19,33 @@ void free_python_msg(void *data, void *vhint) {
   zhint *hint = (zhint *)vhint;
   int rc;
   if (hint != NULL) {
-    zmq_msg_init_size(&msg, sizeof(size_t));
-    memcpy(zmq_msg_data(&msg), &hint->id, sizeof(size_t));
-    rc = mutex_lock(hint->mutex);
+    rc = mutex_lock(hint->queue->mutex);
     if (rc != 0) {
       fprintf(stderr, "pyzmq-gc mutex lock failed rc=%d\n", rc);
     }
-    rc = zmq_msg_send(&msg, hint->sock, 0);
+    rc = gc_queue_push(hint->queue, hint->id);
     if (rc < 0) {
-      /*
-       * gc socket could have been closed, e.g. during process teardown.
-       * If so, ignore the failure because there's nothing to do.
-       */
-      if (zmq_errno() != ENOTSOCK) {
-        fprintf(stderr, "pyzmq-gc send failed: %s\n",
-                zmq_strerror(zmq_errno()));
+      fprintf(stderr, "pyzmq-gc queue allocation failed\n");
+    } else if (rc) {
+      /* queue was empty, wake up the gc thread */
+      zmq_msg_init(&msg);
+      rc = zmq_msg_send(&msg, hint->sock, 0);
+      if (rc < 0) {
+        /*
+         * gc socket could have been closed, e.g. during process teardown.
+         * If so, ignore the failure because there's nothing to do.
+         */
+        if (zmq_errno() != ENOTSOCK) {
+          fprintf(stderr, "pyzmq-gc send failed: %s\n",
+                  zmq_strerror(zmq_errno()));
+        }
       }
+      zmq_msg_close(&msg);
     }
-    rc = mutex_unlock(hint->mutex);
+    rc = mutex_unlock(hint->queue->mutex);
     if (rc != 0) {
       fprintf(stderr, "pyzmq-gc mutex unlock failed rc=%d\n", rc);
     }
-    zmq_msg_close(&msg);
     free(hint);
   }
 }
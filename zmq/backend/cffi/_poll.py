@@ -10,10 +10,12 @@ except ImportError:
 
 import warnings
 
-from zmq.error import InterruptedSystemCall, _check_rc
+from zmq.constants import EAGAIN, ENOTSOCK
+from zmq.error import InterruptedSystemCall, ZMQError, _check_rc
 
 from ._cffi import ffi
 from ._cffi import lib as C
+from .socket import Socket
 
 
 def _make_zmq_pollitem(socket, flags):
@@ -35,10 +37,58 @@ def _make_zmq_pollitem_fromfd(socket_fd, flags):
     return zmq_pollitem[0]
 
 
+def _fileno(socket):
+    """The native fd for an integer fd or object with fileno()"""
+    if isinstance(socket, int):
+        return socket
+    elif hasattr(socket, 'fileno'):
+        return int(socket.fileno())
+    else:
+        raise TypeError(
+            "Socket must be a 0MQ socket, an integer fd or have "
+            f"a fileno() method: {socket!r}"
+        )
+
+
+def _remaining_timeout(timeout, start):
+    """The timeout left for an interrupted poll that started at `start`"""
+    if timeout <= 0:
+        return timeout
+    ms_passed = int(1000 * (monotonic() - start))
+    if ms_passed < 0:
+        # don't allow negative ms_passed,
+        # which can happen on old Python versions without time.monotonic.
+        warnings.warn(
+            f"Negative elapsed time for interrupted poll: {ms_passed}."
+            "  Did the clock change?",
+            RuntimeWarning,
+        )
+        ms_passed = 0
+    return max(0, timeout - ms_passed)
+
+
+def _poll(items, nitems, timeout):
+    """zmq_poll, retrying interrupted calls
+
+    Returns the number of items with events.
+    """
+    list_length = ffi.cast('int', nitems)
+    while True:
+        c_timeout = ffi.cast('long', timeout)
+        start = monotonic()
+        rc = C.zmq_poll(items, list_length, c_timeout)
+        try:
+            _check_rc(rc)
+        except InterruptedSystemCall:
+            timeout = _remaining_timeout(timeout, start)
+            continue
+        else:
+            return rc
+
+
 def zmq_poll(sockets, timeout):
     cffi_pollitem_list = []
     low_level_to_socket_obj = {}
-    from zmq import Socket
 
     for item in sockets:
         if isinstance(item[0], Socket):
@@ -51,29 +101,7 @@ def zmq_poll(sockets, timeout):
             low_level_to_socket_obj[item[0]] = item
             cffi_pollitem_list.append(_make_zmq_pollitem_fromfd(item[0], item[1]))
     items = ffi.new('zmq_pollitem_t[]', cffi_pollitem_list)
-    list_length = ffi.cast('int', len(cffi_pollitem_list))
-    while True:
-        c_timeout = ffi.cast('long', timeout)
-        start = monotonic()
-        rc = C.zmq_poll(items, list_length, c_timeout)
-        try:
-            _check_rc(rc)
-        except InterruptedSystemCall:
-            if timeout > 0:
-                ms_passed = int(1000 * (monotonic() - start))
-                if ms_passed < 0:
-                    # don't allow negative ms_passed,
-                    # which can happen on old Python versions without time.monotonic.
-                    warnings.warn(
-                        f"Negative elapsed time for interrupted poll: {ms_passed}."
-                        "  Did the clock change?",
-                        RuntimeWarning,
-                    )
-                    ms_passed = 0
-                timeout = max(0, timeout - ms_passed)
-            continue
-        else:
-            break
+    _poll(items, len(cffi_pollitem_list), timeout)
     result = []
     for item in items:
         if item.revents > 0:
@@ -89,4 +117,197 @@ def zmq_poll(sockets, timeout):
     return result
 
 
+class _PollItems:
+    """A persistent zmq_pollitem_t array, for use by zmq.Poller
+
+    Items are addressed by index.
+    Removing an item moves the items after it down one place,
+    so callers tracking indices must do the same.
+    """
+
+    def __init__(self):
+        self.items = ffi.new('zmq_pollitem_t[]', 8)
+        self.nitems = 0
+        self.sockets = []
+
+    def __len__(self):
+        return self.nitems
+
+    def append(self, socket, events):
+        if self.nitems == len(self.items):
+            items = ffi.new('zmq_pollitem_t[]', 2 * len(self.items))
+            ffi.memmove(items, self.items, ffi.sizeof(self.items))
+            self.items = items
+        if isinstance(socket, Socket):
+            item = _make_zmq_pollitem(socket, events)
+        else:
+            item = _make_zmq_pollitem_fromfd(_fileno(socket), events)
+            socket = None
+        self.items[self.nitems] = item
+        self.sockets.append(socket)
+        self.nitems += 1
+
+    def modify(self, idx, events):
+        if not 0 <= idx < self.nitems:
+            raise IndexError(idx)
+        self.items[idx].events = events
+
+    def remove(self, idx):
+        if not 0 <= idx < self.nitems:
+            raise IndexError(idx)
+        ffi.memmove(
+            self.items + idx,
+            self.items + idx + 1,
+            (self.nitems - idx - 1) * ffi.sizeof('zmq_pollitem_t'),
+        )
+        del self.sockets[idx]
+        self.nitems -= 1
+
+    def poll(self, timeout=-1):
+        if self.nitems == 0:
+            return []
+        items = self.items
+        sockets = self.sockets
+        for i, socket in enumerate(sockets):
+            if socket is not None:
+                if socket._closed:
+                    raise ZMQError(ENOTSOCK)
+                items[i].socket = socket._zmq_socket
+
+        nready = _poll(items, self.nitems, timeout)
+        result = []
+        for i in range(self.nitems):
+            if not nready:
+                break
+            item = items[i]
+            if item.revents > 0:
+                nready -= 1
+                if item.socket != ffi.NULL:
+                    result.append((sockets[i], item.revents))
+                else:
+                    result.append((item.fd, item.revents))
+        return result
+
+
+class _DraftPollItems:
+    """Like _PollItems, but backed by a zmq_poller (draft API)
+
+    zmq_poller_wait_all scales with the number of items that have events,
+    rather than the number registered.
+    """
+
+    _poller_p = None
+
+    def __init__(self):
+        import zmq
+
+        if not zmq.DRAFT_API:
+            raise RuntimeError("libzmq and pyzmq must be built with draft support")
+        self._poller_p = ffi.new('void**', C.zmq_poller_new())
+        if self._poller_p[0] == ffi.NULL:
+            raise ZMQError()
+        self.events = ffi.new('zmq_poller_event_t[]', 8)
+        self.sockets = []
+        self.flags = []
+        self._socket_map = {}
+
+    def __del__(self):
+        if self._poller_p is not None and self._poller_p[0] != ffi.NULL:
+            C.zmq_poller_destroy(self._poller_p)
+
+    def __len__(self):
+        return len(self.sockets)
+
+    def _add(self, socket, events):
+        if isinstance(socket, Socket):
+            if socket._closed:
+                # like _PollItems, closed sockets raise in poll
+                return
+            rc = C.zmq_poller_add(
+                self._poller_p[0], socket._zmq_socket, ffi.NULL, events
+            )
+            self._socket_map[socket._zmq_socket] = socket
+        else:
+            rc = C.zmq_poller_add_fd(self._poller_p[0], socket, ffi.NULL, events)
+        _check_rc(rc)
+
+    def append(self, socket, events):
+        if not isinstance(socket, Socket):
+            socket = _fileno(socket)
+        if len(self.sockets) == len(self.events):
+            self.events = ffi.new('zmq_poller_event_t[]', 2 * len(self.events))
+        self._add(socket, events)
+        self.sockets.append(socket)
+        self.flags.append(events)
+
+    def modify(self, idx, events):
+        socket = self.sockets[idx]
+        if isinstance(socket, Socket):
+            if socket._closed:
+                # not in the zmq_poller, closed sockets raise in poll
+                self.flags[idx] = events
+                return
+            rc = C.zmq_poller_modify(self._poller_p[0], socket._zmq_socket, events)
+        else:
+            rc = C.zmq_poller_modify_fd(self._poller_p[0], socket, events)
+        _check_rc(rc)
+        self.flags[idx] = events
+
+    def remove(self, idx):
+        socket = self.sockets.pop(idx)
+        del self.flags[idx]
+        if isinstance(socket, Socket):
+            self._socket_map.pop(socket._zmq_socket, None)
+            if socket._closed:
+                # libzmq can't remove a closed socket, start a new poller
+                self._rebuild()
+                return
+            rc = C.zmq_poller_remove(self._poller_p[0], socket._zmq_socket)
+        else:
+            rc = C.zmq_poller_remove_fd(self._poller_p[0], socket)
+        _check_rc(rc)
+
+    def _rebuild(self):
+        C.zmq_poller_destroy(self._poller_p)
+        self._poller_p[0] = C.zmq_poller_new()
+        if self._poller_p[0] == ffi.NULL:
+            raise ZMQError()
+        self._socket_map = {}
+        for socket, events in zip(self.sockets, self.flags):
+            self._add(socket, events)
+
+    def poll(self, timeout=-1):
+        nitems = len(self.sockets)
+        if nitems == 0:
+            return []
+        # a closed socket's handle may already be freed by libzmq
+        for socket in self.sockets:
+            if isinstance(socket, Socket) and socket._closed:
+                raise ZMQError(ENOTSOCK)
+
+        events = self.events
+        while True:
+            start = monotonic()
+            rc = C.zmq_poller_wait_all(self._poller_p[0], events, nitems, timeout)
+            if rc < 0 and C.zmq_errno() == EAGAIN:
+                # timeout
+                return []
+            try:
+                _check_rc(rc)
+            except InterruptedSystemCall:
+                timeout = _remaining_timeout(timeout, start)
+                continue
+            else:
+                break
+
+        result = []
+        for i in range(rc):
+            event = events[i]
+            if event.socket != ffi.NULL:
+                result.append((self._socket_map[event.socket], event.events))
+            else:
+                result.append((event.fd, event.events))
+        return result
+
+
 __all__ = ['zmq_poll']
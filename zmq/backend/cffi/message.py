@@ -55,7 +55,15 @@ class Frame(maybe_bufferable):
     tracker_event = None
     zmq_msg = None
 
-    def __init__(self, data=None, track=False, copy=None, copy_threshold=None):
+    def __init__(
+        self,
+        data=None,
+        track=False,
+        copy=None,
+        copy_threshold=None,
+        completion_queue=None,
+        token=None,
+    ):
         self._failed_init = True
 
         self.zmq_msg = ffi.cast('zmq_msg_t[1]', C.malloc(ffi.sizeof("zmq_msg_t")))
@@ -70,10 +78,15 @@ class Frame(maybe_bufferable):
                 "Unicode strings are not allowed. Only: bytes, buffer interfaces."
             )
 
+        if completion_queue is not None and token is None:
+            token = data
+
         if data is None:
             rc = C.zmq_msg_init(self.zmq_msg)
             _check_rc(rc)
             self._failed_init = False
+            if completion_queue is not None:
+                completion_queue._complete([token])
             return
 
         self._data = data
@@ -100,6 +113,8 @@ class Frame(maybe_bufferable):
             _check_rc(rc)
             ffi.buffer(C.zmq_msg_data(self.zmq_msg), data_len_c)[:] = self._buffer
             self._failed_init = False
+            if completion_queue is not None:
+                completion_queue._complete([token])
             return
 
         # Getting here means that we are doing a true zero-copy Frame,
@@ -112,18 +127,15 @@ class Frame(maybe_bufferable):
             self.tracker_event = evt
             self.tracker = zmq.MessageTracker(evt)
         # create the hint for zmq_free_fn
-        # two pointers: the zmq_gc context and a message to be sent to the zmq_gc PULL socket
+        # the zmq_gc PUSH socket, the zmq_gc release queue, and the id to be queued
         # allows libzmq to signal to Python when it is done with Python-owned memory.
         global zmq_gc
         if zmq_gc is None:
             from zmq.utils.garbage import gc as zmq_gc
         # can't use ffi.new because it will be freed at the wrong time!
         hint = ffi.cast("zhint[1]", C.malloc(ffi.sizeof("zhint")))
-        hint[0].id = zmq_gc.store(data, self.tracker_event)
-        if not zmq_gc._push_mutex:
-            zmq_gc._push_mutex = C.mutex_allocate()
-
-        hint[0].mutex = ffi.cast("mutex_t*", zmq_gc._push_mutex)
+        hint[0].id = zmq_gc.store(data, self.tracker_event, completion_queue, token)
+        hint[0].queue = ffi.cast("gc_queue_t*", zmq_gc._release_queue)
         hint[0].sock = ffi.cast("void*", zmq_gc._push_socket.underlying)
 
         # calls zmq_wrap_msg_init_data with the C.free_python_msg callback
@@ -220,6 +232,27 @@ class Frame(maybe_bufferable):
         return new_msg
 
 
+def _gc_queue_allocate():
+    """Allocate a queue of released zero-copy ids, returning its address"""
+    queue = C.gc_queue_allocate()
+    if queue == ffi.NULL:
+        raise MemoryError("Could not allocate gc queue")
+    return int(ffi.cast("size_t", queue))
+
+
+def _gc_queue_drain(queue_addr):
+    """Drain the ids released by libzmq from the gc queue at queue_addr"""
+    queue = ffi.cast("gc_queue_t*", queue_addr)
+    buf = ffi.new("size_t[]", 256)
+    ids = []
+    n = 256
+    # a partial batch means the queue was emptied
+    while n == 256:
+        n = C.gc_queue_drain(queue, buf, 256)
+        ids.extend(buf[0:n])
+    return ids
+
+
 Message = Frame
 
 __all__ = ['Frame', 'Message']
@@ -5,6 +5,7 @@
 
 import errno as errno_mod
 import warnings
+from array import array
 
 import zmq
 from zmq.constants import SocketOption, _OptType
@@ -95,6 +96,24 @@ def initialize_opt_pointer(option, value, length=0):
         return value_int_pointer(value)
 
 
+def _check_msg_parts(msg_parts):
+    """typecheck the parts of a multipart message before sending"""
+    if not msg_parts:
+        raise IndexError("Cannot send an empty multipart message")
+    for i, msg in enumerate(msg_parts):
+        if isinstance(msg, (Frame, bytes, memoryview)):
+            continue
+        try:
+            memoryview(msg)
+        except Exception:
+            rmsg = repr(msg)
+            if len(rmsg) > 32:
+                rmsg = rmsg[:32] + '...'
+            raise TypeError(
+                f"Frame {i} ({rmsg}) does not support the buffer interface."
+            )
+
+
 class Socket:
     context = None
     socket_type = None
@@ -364,6 +383,66 @@ class Socket:
                 frame.close()
             return tracker
 
+    def send_multipart(self, msg_parts, flags=0, copy=True, track=False):
+        if not isinstance(msg_parts, (list, tuple)):
+            msg_parts = list(msg_parts)
+        _check_msg_parts(msg_parts)
+        for msg in msg_parts[:-1]:
+            self.send(msg, zmq.SNDMORE | flags, copy=copy, track=track)
+        # Send the last part without the extra SNDMORE flag.
+        return self.send(msg_parts[-1], flags, copy=copy, track=track)
+
+    def send_gather(self, buffers, flags=0):
+        views = []
+        for i, buf in enumerate(buffers):
+            if isinstance(buf, str):
+                raise TypeError("Message must be in bytes, not a unicode object")
+            if isinstance(buf, Frame):
+                buf = buf.buffer
+            try:
+                views.append(memoryview(buf).cast('B'))
+            except Exception:
+                rmsg = repr(buf)
+                if len(rmsg) > 32:
+                    rmsg = rmsg[:32] + '...'
+                raise TypeError(
+                    f"Buffer {i} ({rmsg}) does not support the buffer interface."
+                )
+        nbytes = sum(view.nbytes for view in views)
+
+        zmq_msg = ffi.new('zmq_msg_t*')
+        rc = C.zmq_msg_init_size(zmq_msg, nbytes)
+        _check_rc(rc)
+        dest = ffi.buffer(C.zmq_msg_data(zmq_msg), nbytes)
+        offset = 0
+        for view in views:
+            dest[offset : offset + view.nbytes] = view
+            offset += view.nbytes
+        try:
+            _retry_sys_call(C.zmq_msg_send, zmq_msg, self._zmq_socket, flags)
+        except Exception:
+            C.zmq_msg_close(zmq_msg)
+            raise
+        rc2 = C.zmq_msg_close(zmq_msg)
+        _check_rc(rc2)
+
+    def send_many(self, msgs, flags=0, copy=True):
+        if not isinstance(msgs, (list, tuple)):
+            msgs = list(msgs)
+        for msg in msgs:
+            _check_msg_parts(msg if isinstance(msg, (list, tuple)) else [msg])
+        sent = 0
+        for msg in msgs:
+            try:
+                if isinstance(msg, (list, tuple)):
+                    Socket.send_multipart(self, msg, flags, copy=copy)
+                else:
+                    Socket.send(self, msg, flags, copy=copy)
+            except zmq.Again:
+                break
+            sent += 1
+        return sent
+
     def recv(self, flags=0, copy=True, track=False):
         if copy:
             zmq_msg = ffi.new('zmq_msg_t*')
@@ -380,6 +459,7 @@ class Socket:
             raise
 
         if not copy:
+            frame.more = bool(C.zmq_msg_more(zmq_msg))
             return frame
 
         _buffer = ffi.buffer(C.zmq_msg_data(zmq_msg), C.zmq_msg_size(zmq_msg))
@@ -388,6 +468,51 @@ class Socket:
         _check_rc(rc)
         return _bytes
 
+    def recv_multipart(self, flags=0, copy=True, track=False):
+        parts = []
+        more = True
+        if copy:
+            zmq_msg = ffi.new('zmq_msg_t*')
+            while more:
+                C.zmq_msg_init(zmq_msg)
+                try:
+                    _retry_sys_call(C.zmq_msg_recv, zmq_msg, self._zmq_socket, flags)
+                except Exception:
+                    C.zmq_msg_close(zmq_msg)
+                    raise
+                parts.append(
+                    ffi.buffer(C.zmq_msg_data(zmq_msg), C.zmq_msg_size(zmq_msg))[:]
+                )
+                more = bool(C.zmq_msg_more(zmq_msg))
+                rc = C.zmq_msg_close(zmq_msg)
+                _check_rc(rc)
+        else:
+            while more:
+                frame = zmq.Frame(track=track)
+                _retry_sys_call(C.zmq_msg_recv, frame.zmq_msg, self._zmq_socket, flags)
+                more = frame.more = bool(C.zmq_msg_more(frame.zmq_msg))
+                parts.append(frame)
+        return parts
+
+    def recv_many(self, max_messages, flags=0, copy=True, track=False):
+        return self._recv_many(Socket.recv, max_messages, flags, copy, track)
+
+    def recv_many_multipart(self, max_messages, flags=0, copy=True, track=False):
+        return self._recv_many(Socket.recv_multipart, max_messages, flags, copy, track)
+
+    def _recv_many(self, recv, max_messages, flags, copy, track):
+        if max_messages < 1:
+            raise ValueError(f"max_messages must be at least 1, not {max_messages}")
+        msgs = [recv(self, flags, copy=copy, track=track)]
+        flags |= zmq.DONTWAIT
+        while len(msgs) < max_messages:
+            try:
+                msgs.append(recv(self, flags, copy=copy, track=track))
+            except ZMQError:
+                # return what we have, the next recv will see the error
+                break
+        return msgs
+
     def recv_into(self, buffer, /, *, nbytes: int = 0, flags: int = 0) -> int:
         view = memoryview(buffer)
         if not view.contiguous:
@@ -406,6 +531,95 @@ class Socket:
         _check_rc(rc)
         return rc
 
+    def recv_multipart_into(self, buffers, flags=0):
+        c_bufs = []
+        for buffer in buffers:
+            view = memoryview(buffer)
+            if not view.contiguous:
+                raise BufferError("Can only recv_into contiguous buffers")
+            if view.readonly:
+                raise BufferError("Cannot recv_into readonly buffer")
+            c_bufs.append((ffi.from_buffer(view), view.nbytes))
+
+        sizes = []
+        more = True
+        zmq_msg = ffi.new('zmq_msg_t*')
+        while more:
+            C.zmq_msg_init(zmq_msg)
+            try:
+                _retry_sys_call(C.zmq_msg_recv, zmq_msg, self._zmq_socket, flags)
+            except Exception:
+                C.zmq_msg_close(zmq_msg)
+                raise
+            nbytes = C.zmq_msg_size(zmq_msg)
+            if len(sizes) < len(c_bufs):
+                c_buf, buf_bytes = c_bufs[len(sizes)]
+                C.memcpy(c_buf, C.zmq_msg_data(zmq_msg), min(nbytes, buf_bytes))
+            more = bool(C.zmq_msg_more(zmq_msg))
+            rc = C.zmq_msg_close(zmq_msg)
+            _check_rc(rc)
+            sizes.append(nbytes)
+        return sizes
+
+    def recv_arena(self, buffer, /, *, max_frames: int = 0, flags: int = 0):
+        view = memoryview(buffer)
+        if not view.contiguous:
+            raise BufferError("Can only recv_into contiguous buffers")
+        if view.readonly:
+            raise BufferError("Cannot recv_into readonly buffer")
+        if max_frames < 0:
+            raise ValueError(f"{max_frames=} must be non-negative")
+        if not max_frames:
+            max_frames = 0x7FFFFFFF
+        arena = view.cast('B')
+        capacity = view.nbytes
+        index = array('Q')
+        rest = []
+        offset = 0
+        c_buf = ffi.from_buffer(view)
+        zmq_msg = ffi.new('zmq_msg_t*')
+        msg_start = 0
+        while True:
+            nframes = len(index) // 3
+            if not index or not index[-1]:
+                # at a message boundary
+                msg_start = nframes
+                if nframes >= max_frames or (index and offset == capacity):
+                    break
+            C.zmq_msg_init(zmq_msg)
+            try:
+                _retry_sys_call(C.zmq_msg_recv, zmq_msg, self._zmq_socket, flags)
+            except ZMQError:
+                C.zmq_msg_close(zmq_msg)
+                if index:
+                    # return what we have, the next recv will see the error
+                    break
+                raise
+            flags |= zmq.DONTWAIT
+            nbytes = C.zmq_msg_size(zmq_msg)
+            more = C.zmq_msg_more(zmq_msg)
+            if nbytes > capacity - offset or nframes >= max_frames:
+                # the message that doesn't fit is returned separately,
+                # including any of its frames already in the arena
+                rest = [
+                    bytes(arena[index[3 * i] : index[3 * i] + index[3 * i + 1]])
+                    for i in range(msg_start, nframes)
+                ]
+                rest.append(ffi.buffer(C.zmq_msg_data(zmq_msg), nbytes)[:])
+                C.zmq_msg_close(zmq_msg)
+                while more:
+                    # the rest of a multipart message is already here
+                    rest.append(self.recv(zmq.DONTWAIT))
+                    more = self.get(zmq.RCVMORE)
+                del index[3 * msg_start :]
+                break
+            C.memcpy(c_buf + offset, C.zmq_msg_data(zmq_msg), nbytes)
+            index.extend((offset, nbytes, more))
+            rc = C.zmq_msg_close(zmq_msg)
+            _check_rc(rc)
+            offset += nbytes
+        return index, rest
+
     def monitor(self, addr, events=-1):
         """s.monitor(addr, flags)
 
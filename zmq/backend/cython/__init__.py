@@ -7,7 +7,13 @@ from . import _zmq
 
 # mq not in __all__
 from ._zmq import *  # noqa
-from ._zmq import monitored_queue  # noqa
+from ._zmq import (  # noqa
+    _DraftPollItems,
+    _gc_queue_allocate,
+    _gc_queue_drain,
+    _PollItems,
+    monitored_queue,
+)
 
 Message = _zmq.Frame
 
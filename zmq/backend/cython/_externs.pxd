@@ -6,6 +6,13 @@ cdef extern from "mutex.h" nogil:
     cdef int mutex_lock(mutex_t*)
     cdef int mutex_unlock(mutex_t*)
 
+cdef extern from "gcqueue.h" nogil:
+    ctypedef struct gc_queue_t:
+        mutex_t *mutex
+    cdef gc_queue_t* gc_queue_allocate()
+    cdef int gc_queue_push(gc_queue_t*, size_t)
+    cdef size_t gc_queue_drain(gc_queue_t*, size_t*, size_t)
+
 cdef extern from "getpid_compat.h":
     cdef int getpid()
 
@@ -4,7 +4,7 @@
 # Copyright (C) PyZMQ Developers
 # Distributed under the terms of the Modified BSD License.
 
-from zmq.backend.cython.libzmq cimport zmq_msg_t
+from zmq.backend.cython.libzmq cimport zmq_msg_t, zmq_poller_event_t, zmq_pollitem_t
 
 cdef class Context:
 
@@ -50,3 +50,23 @@ cdef class Socket:
     cpdef object send(self, data, int flags=*, bint copy=*, bint track=*)
     cpdef object recv(self, int flags=*, bint copy=*, bint track=*)
     cpdef int recv_into(self, buffer, int nbytes=*, int flags=*)
+    cpdef object send_multipart(self, msg_parts, int flags=*, bint copy=*, bint track=*)
+    cpdef list recv_multipart(self, int flags=*, bint copy=*, bint track=*)
+
+cdef class _PollItems:
+
+    cdef zmq_pollitem_t *items  # The pollitem array, updated in place
+    cdef int nitems             # The number of items in use
+    cdef int capacity           # The allocated length of items
+    cdef list sockets           # zmq Sockets by index, None for fds
+
+cdef class _DraftPollItems:
+
+    cdef void *poller                 # The zmq_poller
+    cdef zmq_poller_event_t *events   # Buffer for zmq_poller_wait_all results
+    cdef int capacity                 # The allocated length of events
+    cdef list sockets                 # zmq Sockets or int fds by index
+    cdef list flags                   # The events polled for each item
+
+    cdef _add(self, socket, int events)
+    cdef _rebuild(self)
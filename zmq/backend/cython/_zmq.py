@@ -34,6 +34,7 @@ except ImportError:
     raise ImportError(msg)
 
 import warnings
+from array import array
 from threading import Event
 from time import monotonic
 from weakref import ref
@@ -71,21 +72,24 @@ from cython.cimports.cpython.bytes import (
 )
 from cython.cimports.cpython.exc import PyErr_CheckSignals
 from cython.cimports.libc.errno import EAGAIN, EINTR, ENAMETOOLONG, ENOENT, ENOTSOCK
-from cython.cimports.libc.stdint import uint32_t
+from cython.cimports.libc.stdint import uint32_t, uint64_t
 from cython.cimports.libc.stdio import fprintf
 from cython.cimports.libc.stdio import stderr as cstderr
-from cython.cimports.libc.stdlib import free, malloc
-from cython.cimports.libc.string import memcpy
+from cython.cimports.libc.stdlib import free, malloc, realloc
+from cython.cimports.libc.string import memcpy, memmove
 from cython.cimports.zmq.backend.cython import libzmq
 from cython.cimports.zmq.backend.cython._externs import (
+    gc_queue_allocate,
+    gc_queue_drain,
+    gc_queue_push,
+    gc_queue_t,
     get_ipc_path_max_len,
     getpid,
-    mutex_allocate,
     mutex_lock,
-    mutex_t,
     mutex_unlock,
 )
 from cython.cimports.zmq.backend.cython.libzmq import (
+    ZMQ_DONTWAIT,
     ZMQ_ENOTSOCK,
     ZMQ_ETERM,
     ZMQ_EVENT_ALL,
@@ -127,6 +131,8 @@ from cython.cimports.zmq.backend.cython.libzmq import (
     zmq_msg_init,
     zmq_msg_init_data,
     zmq_msg_init_size,
+    zmq_msg_more,
+    zmq_msg_move,
     zmq_msg_recv,
     zmq_msg_routing_id,
     zmq_msg_send,
@@ -136,9 +142,16 @@ from cython.cimports.zmq.backend.cython.libzmq import (
     zmq_msg_size,
     zmq_msg_t,
     zmq_poller_add,
+    zmq_poller_add_fd,
     zmq_poller_destroy,
+    zmq_poller_event_t,
     zmq_poller_fd,
+    zmq_poller_modify,
+    zmq_poller_modify_fd,
     zmq_poller_new,
+    zmq_poller_remove,
+    zmq_poller_remove_fd,
+    zmq_poller_wait_all,
     zmq_pollitem_t,
     zmq_proxy,
     zmq_proxy_steerable,
@@ -195,7 +208,7 @@ def _check_rc(rc: C.int, error_without_errno: bint = False) -> C.int:
 
 _zhint = C.struct(
     sock=p_void,
-    mutex=pointer(mutex_t),
+    queue=pointer(gc_queue_t),
     id=size_t,
 )
 
@@ -205,16 +218,19 @@ _zhint = C.struct(
 def free_python_msg(data: p_void, vhint: p_void) -> C.int:
     """A pure-C function for DECREF'ing Python-owned message data.
 
-    Sends a message on a PUSH socket
+    Queues the id for the Garbage Collector
 
-    The hint is a `zhint` struct with two values:
+    The hint is a `zhint` struct with three values:
 
     sock (void *): pointer to the Garbage Collector's PUSH socket
-    id (size_t): the id to be used to construct a zmq_msg_t that should be sent on a PUSH socket,
+    queue (gc_queue_t *): the queue of released ids, drained by the Garbage Collector
+    id (size_t): the id to be queued,
        signaling the Garbage Collector to remove its reference to the object.
 
+    Only the release that finds the queue empty sends a (empty) wakeup message
+    on the PUSH socket, so a burst of releases costs one message.
     When the Garbage Collector's PULL socket receives the message,
-    it deletes its reference to the object,
+    it drains the queue and deletes its references to the objects,
     allowing Python to free the memory.
     """
     msg = declare(zmq_msg_t)
@@ -223,28 +239,58 @@ def free_python_msg(data: p_void, vhint: p_void) -> C.int:
     rc: C.int
 
     if hint != NULL:
-        zmq_msg_init_size(msg_ptr, sizeof(size_t))
-        memcpy(zmq_msg_data(msg_ptr), address(hint.id), sizeof(size_t))
-        rc = mutex_lock(hint.mutex)
+        rc = mutex_lock(hint.queue.mutex)
         if rc != 0:
             fprintf(cstderr, "pyzmq-gc mutex lock failed rc=%d\n", rc)
-        rc = zmq_msg_send(msg_ptr, hint.sock, 0)
+        rc = gc_queue_push(hint.queue, hint.id)
         if rc < 0:
-            # gc socket could have been closed, e.g. during process teardown.
-            # If so, ignore the failure because there's nothing to do.
-            if _zmq_errno() != ZMQ_ENOTSOCK:
-                fprintf(
-                    cstderr, "pyzmq-gc send failed: %s\n", zmq_strerror(_zmq_errno())
-                )
-        rc = mutex_unlock(hint.mutex)
+            fprintf(cstderr, "pyzmq-gc queue allocation failed\n")
+        elif rc:
+            # queue was empty, wake up the gc thread
+            zmq_msg_init(msg_ptr)
+            rc = zmq_msg_send(msg_ptr, hint.sock, 0)
+            if rc < 0:
+                # gc socket could have been closed, e.g. during process teardown.
+                # If so, ignore the failure because there's nothing to do.
+                if _zmq_errno() != ZMQ_ENOTSOCK:
+                    fprintf(
+                        cstderr,
+                        "pyzmq-gc send failed: %s\n",
+                        zmq_strerror(_zmq_errno()),
+                    )
+            zmq_msg_close(msg_ptr)
+        rc = mutex_unlock(hint.queue.mutex)
         if rc != 0:
             fprintf(cstderr, "pyzmq-gc mutex unlock failed rc=%d\n", rc)
 
-        zmq_msg_close(msg_ptr)
         free(hint)
         return 0
 
 
+def _gc_queue_allocate() -> size_t:
+    """Allocate a queue of released zero-copy ids, returning its address"""
+    queue: pointer(gc_queue_t) = gc_queue_allocate()
+    if queue == NULL:
+        raise MemoryError("Could not allocate gc queue")
+    return cast(size_t, queue)
+
+
+def _gc_queue_drain(queue_addr: size_t) -> list:
+    """Drain the ids released by libzmq from the gc queue at queue_addr"""
+    queue: pointer(gc_queue_t) = cast(pointer(gc_queue_t), queue_addr)
+    buf = declare(size_t[256])
+    n: size_t = 256
+    i: size_t
+    ids: list = []
+    # a partial batch means the queue was emptied
+    while n == 256:
+        with nogil:
+            n = gc_queue_drain(queue, buf, 256)
+        for i in range(n):
+            ids.append(buf[i])
+    return ids
+
+
 @cfunc
 @inline
 def _copy_zmq_msg_bytes(zmq_msg: pointer(zmq_msg_t)) -> bytes:
@@ -279,7 +325,14 @@ _gc = None
 @cclass
 class Frame:
     def __init__(
-        self, data=None, track=False, copy=None, copy_threshold=None, **kwargs
+        self,
+        data=None,
+        track=False,
+        copy=None,
+        copy_threshold=None,
+        completion_queue=None,
+        token=None,
+        **kwargs,
     ):
         rc: C.int
         data_c: p_char = NULL
@@ -312,10 +365,15 @@ class Frame:
         if isinstance(data, str):
             raise TypeError("Str objects not allowed. Only: bytes, buffer interfaces.")
 
+        if completion_queue is not None and token is None:
+            token = data
+
         if data is None:
             rc = zmq_msg_init(zmq_msg_ptr)
             _check_rc(rc)
             self._failed_init = False
+            if completion_queue is not None:
+                completion_queue._complete([token])
             return
 
         data_len_c = _asbuffer(data, cast(pointer(p_void), address(data_c)))
@@ -336,6 +394,8 @@ class Frame:
             _check_rc(rc)
             memcpy(zmq_msg_data(zmq_msg_ptr), data_c, data_len_c)
             self._failed_init = False
+            if completion_queue is not None:
+                completion_queue._complete([token])
             return
 
         # Getting here means that we are doing a true zero-copy Frame,
@@ -348,19 +408,15 @@ class Frame:
             self.tracker_event = evt
             self.tracker = zmq.MessageTracker(evt)
         # create the hint for zmq_free_fn
-        # two pointers: the gc context and a message to be sent to the gc PULL socket
+        # the gc PUSH socket, the gc release queue, and the id to be queued
         # allows libzmq to signal to Python when it is done with Python-owned memory.
         global _gc
         if _gc is None:
             from zmq.utils.garbage import gc as _gc
 
         hint = cast(pointer(_zhint), malloc(sizeof(_zhint)))
-        hint.id = _gc.store(data, self.tracker_event)
-        if not _gc._push_mutex:
-            hint.mutex = mutex_allocate()
-            _gc._push_mutex = cast(size_t, hint.mutex)
-        else:
-            hint.mutex = cast(pointer(mutex_t), cast(size_t, _gc._push_mutex))
+        hint.id = _gc.store(data, self.tracker_event, completion_queue, token)
+        hint.queue = cast(pointer(gc_queue_t), cast(size_t, _gc._release_queue))
         hint.sock = cast(p_void, cast(size_t, _gc._push_socket.underlying))
 
         rc = zmq_msg_init_data(
@@ -1324,6 +1380,580 @@ class Socket:
             else:
                 return rc
 
+    def recv_multipart_into(self, buffers, flags=0) -> list:
+        """
+        Receive a multipart message, storing each frame into a buffer
+        rather than allocating a new Frame.
+
+        Frame `i` of the message is stored in ``buffers[i]``.
+        Frames larger than their buffer are truncated, like `recv_into`.
+        If the message has more frames than there are buffers,
+        the extra frames are discarded, as if received into empty buffers.
+
+        .. versionadded:: 27.3
+
+        Parameters
+        ----------
+        buffers : sequence of memoryview
+            Objects providing the buffer interface,
+            where each memoryview is contiguous and writable,
+            e.g. slices of one preallocated array.
+        flags: int, default=0
+            See `socket.recv`
+
+        Returns
+        -------
+        bytes_received: list of int
+            The size of each frame of the message, with one entry per frame.
+            Frame `i` has been truncated if ``bytes_received[i]``
+            is larger than the size of ``buffers[i]``.
+            Truncated data cannot be recovered.
+
+        Raises
+        ------
+        ZMQError
+            for any of the reasons `zmq_msg_recv` might fail.
+        BufferError
+            for invalid buffers, such as readonly or not contiguous.
+            Nothing is received in this case.
+        """
+        _check_closed(self)
+        c_flags: C.int = flags
+        if not isinstance(buffers, (list, tuple)):
+            buffers = list(buffers)
+        n: Py_ssize_t = len(buffers)
+        i: Py_ssize_t
+        nbytes: size_t
+        more: bint = True
+        zmq_msg = declare(zmq_msg_t)
+        zmq_msg_p: pointer(zmq_msg_t) = address(zmq_msg)
+        sizes: list = []
+        views: list = [memoryview(buf) for buf in buffers]
+        bufs: pointer(p_void) = cast(pointer(p_void), malloc((n + 1) * sizeof(p_void)))
+        lens: pointer(size_t) = cast(pointer(size_t), malloc((n + 1) * sizeof(size_t)))
+        if bufs == NULL or lens == NULL:
+            free(bufs)
+            free(lens)
+            raise MemoryError("Could not allocate buffer array")
+
+        try:
+            for i in range(n):
+                lens[i] = _asbuffer(views[i], bufs + i, True)
+            i = 0
+            while more:
+                _recv_msg(self.handle, zmq_msg_p, c_flags)
+                nbytes = zmq_msg_size(zmq_msg_p)
+                if i < n:
+                    with nogil:
+                        memcpy(
+                            bufs[i],
+                            zmq_msg_data(zmq_msg_p),
+                            nbytes if nbytes < lens[i] else lens[i],
+                        )
+                more = zmq_msg_more(zmq_msg_p)
+                zmq_msg_close(zmq_msg_p)
+                sizes.append(nbytes)
+                i += 1
+        finally:
+            free(bufs)
+            free(lens)
+        return sizes
+
+    def recv_arena(self, buffer, /, *, max_frames=0, flags=0):
+        """
+        Receive as many pending messages as fit
+        into one contiguous buffer.
+
+        Frames are stored back-to-back in `buffer`,
+        and an index of ``(offset, length, more)`` entries is returned,
+        avoiding a bytes object per frame.
+        Only the first frame waits according to `flags`;
+        receiving stops when no more messages are pending,
+        `max_frames` have been received, or `buffer` is full.
+
+        Only whole messages are stored.
+        libzmq can't tell the size of a message before receiving it,
+        so the first message that does not fit in what is left of `buffer`
+        or `max_frames` has already been received.
+        It is returned separately as a list of bytes, and comes after
+        the messages in the index.
+
+        The index can be viewed as a structured array with numpy::
+
+            index, rest = sock.recv_arena(arena)
+            records = np.frombuffer(
+                index, dtype=[("offset", "u8"), ("length", "u8"), ("more", "u8")]
+            )
+
+        .. versionadded:: 27.3
+
+        Parameters
+        ----------
+        buffer : memoryview
+            Any object providing the buffer interface (i.e. `memoryview(buffer)` works),
+            where the memoryview is contiguous and writable, e.g. a bytearray or mmap.
+        max_frames: int, default=0
+            The maximum number of frames to receive.
+            If 0, receive as many as fit.
+        flags: int, default=0
+            See `socket.recv`
+
+        Returns
+        -------
+        index: array.array
+            An array of unsigned 64-bit ints, with three entries per frame:
+            the offset of the frame in `buffer`, the size of the frame,
+            and whether more frames of the same message follow.
+        rest: list of bytes
+            The frames of the message that did not fit, if any,
+            otherwise an empty list.
+
+        Raises
+        ------
+        ZMQError
+            for any of the reasons `zmq_msg_recv` might fail
+            when receiving the first frame.
+        BufferError
+            for invalid buffers, such as readonly or not contiguous.
+        """
+        _check_closed(self)
+        c_flags: C.int = flags
+        if max_frames < 0:
+            raise ValueError(f"{max_frames=} must be non-negative")
+        c_max_frames: C.int = max_frames if max_frames else 0x7FFFFFFF
+        view = memoryview(buffer)
+        c_data = declare(p_void)
+        capacity: size_t = _asbuffer(view, address(c_data), True)
+        offset: size_t = 0
+        nframes: C.int = 0
+        msg_start: C.int = 0
+        overflow = declare(zmq_msg_t)
+        rest: list = []
+        index_capacity: C.int = min(c_max_frames, 64)
+        index: pointer(uint64_t) = cast(
+            pointer(uint64_t), malloc(3 * index_capacity * sizeof(uint64_t))
+        )
+        if index == NULL:
+            raise MemoryError("Could not allocate index")
+        new_index: pointer(uint64_t)
+        rc: C.int
+        try:
+            while True:
+                zmq_msg_init(address(overflow))
+                with nogil:
+                    rc = _recv_arena_nogil(
+                        self.handle,
+                        cast(p_char, c_data),
+                        capacity,
+                        address(offset),
+                        index,
+                        index_capacity,
+                        address(nframes),
+                        c_max_frames,
+                        c_flags,
+                        address(msg_start),
+                        address(overflow),
+                    )
+                if rc == 1:
+                    zmq_msg_close(address(overflow))
+                    # index is full, make room for more frames
+                    new_index = cast(
+                        pointer(uint64_t),
+                        realloc(index, 6 * index_capacity * sizeof(uint64_t)),
+                    )
+                    if new_index == NULL:
+                        raise MemoryError("Could not allocate index")
+                    index = new_index
+                    index_capacity *= 2
+                    continue
+                if rc == 2:
+                    # the message that doesn't fit is returned separately,
+                    # including any of its frames already in the arena
+                    arena = view.cast('B')
+                    rest = [
+                        bytes(arena[index[3 * i] : index[3 * i] + index[3 * i + 1]])
+                        for i in range(msg_start, nframes)
+                    ]
+                    rest.append(_copy_zmq_msg_bytes(address(overflow)))
+                    more: bint = zmq_msg_more(address(overflow))
+                    zmq_msg_close(address(overflow))
+                    while more:
+                        # the rest of a multipart message is already here
+                        rest.append(self.recv(ZMQ_DONTWAIT))
+                        more = self.get(ZMQ_RCVMORE)
+                    nframes = msg_start
+                    break
+                zmq_msg_close(address(overflow))
+                if rc == 0 or nframes > 0:
+                    # return what we have, the next recv will see any error
+                    break
+                try:
+                    _check_rc(-1, True)
+                except InterruptedSystemCall:
+                    continue
+            result = array('Q')
+            result.frombytes(
+                PyBytes_FromStringAndSize(
+                    cast(p_char, index), 3 * nframes * sizeof(uint64_t)
+                )
+            )
+        finally:
+            free(index)
+        return result, rest
+
+    def send_multipart(
+        self, msg_parts, flags=0, copy: bint = True, track: bint = False
+    ):
+        """
+        Send a sequence of buffers as a multipart message.
+
+        All parts are prepared before anything is sent,
+        then every part is sent in a single call without the GIL.
+        The zmq.SNDMORE flag is added to all parts before the last.
+
+        .. versionadded:: 27.3
+
+        Parameters
+        ----------
+        msg_parts : sequence
+            A sequence of objects to send as a multipart message.
+            Each element can be any sendable object (Frame, bytes, buffer-providers).
+        flags : int
+            Any valid flags for :func:`Socket.send`.
+        copy : bool
+            Should the frame(s) be sent in a copying or non-copying manner.
+            If copy=False, frames smaller than self.copy_threshold bytes
+            will be copied anyway.
+        track : bool
+            Should the frame(s) be tracked for notification that ZMQ has
+            finished with it (ignored if copy=True).
+
+        Returns
+        -------
+        MessageTracker : if the last part is a :class:`Frame` or `copy=False`
+            a MessageTracker object, whose `done` property will
+            be False until the send is completed.
+        None : otherwise
+            None if message was sent, raises an exception otherwise.
+
+        Raises
+        ------
+        TypeError
+            If any part does not support the buffer interface.
+            Nothing is sent in this case.
+        ZMQError
+            for any of the reasons zmq_msg_send might fail.
+        """
+        _check_closed(self)
+        if not isinstance(msg_parts, (list, tuple)):
+            msg_parts = list(msg_parts)
+        nparts: C.int = len(msg_parts)
+        if nparts == 0:
+            raise IndexError("Cannot send an empty multipart message")
+
+        c_flags: C.int = flags
+        msgs: pointer(zmq_msg_t) = cast(
+            pointer(zmq_msg_t), malloc(nparts * sizeof(zmq_msg_t))
+        )
+        srcs: pointer(p_void) = cast(pointer(p_void), malloc(nparts * sizeof(p_void)))
+        if msgs == NULL or srcs == NULL:
+            free(msgs)
+            free(srcs)
+            raise MemoryError("Could not allocate multipart message")
+
+        i: C.int
+        ninit: C.int = 0
+        result = None
+        try:
+            for i in range(nparts):
+                result = _init_send_msg(
+                    self,
+                    address(msgs[i]),
+                    address(srcs[i]),
+                    msg_parts[i],
+                    i,
+                    copy,
+                    track,
+                )
+                ninit += 1
+            _send_msgs(self.handle, msgs, srcs, nparts, c_flags)
+        finally:
+            # close anything prepared but not sent.
+            # After a successful zmq_msg_send, msgs are empty and closing is a no-op.
+            for i in range(ninit):
+                zmq_msg_close(address(msgs[i]))
+            free(msgs)
+            free(srcs)
+        return result
+
+    def recv_multipart(self, flags=0, copy: bint = True, track: bint = False):
+        """
+        Receive a multipart message as a list of bytes or Frame objects
+
+        Parts are received in a loop without looking up RCVMORE for each part.
+
+        .. versionadded:: 27.3
+
+        Parameters
+        ----------
+        flags : int
+            Any valid flags for :func:`Socket.recv`.
+        copy : bool
+            Should the message frame(s) be received in a copying or non-copying manner?
+            If False a Frame object is returned for each part, if True a copy of
+            the bytes is made for each frame.
+        track : bool
+            Should the message frame(s) be tracked for notification that ZMQ has
+            finished with it? (ignored if copy=True)
+
+        Returns
+        -------
+        msg_parts : list
+            A list of frames in the multipart message; either Frames or bytes,
+            depending on `copy`.
+
+        Raises
+        ------
+        ZMQError
+            for any of the reasons zmq_msg_recv might fail
+        """
+        _check_closed(self)
+        c_flags: C.int = flags
+        parts: list = []
+        more: bint = True
+        if copy:
+            zmq_msg = declare(zmq_msg_t)
+            zmq_msg_p: pointer(zmq_msg_t) = address(zmq_msg)
+            while more:
+                _recv_msg(self.handle, zmq_msg_p, c_flags)
+                parts.append(_copy_zmq_msg_bytes(zmq_msg_p))
+                more = zmq_msg_more(zmq_msg_p)
+                zmq_msg_close(zmq_msg_p)
+        else:
+            while more:
+                frame: Frame = _recv_frame(self.handle, c_flags, track)
+                more = zmq_msg_more(address(frame.zmq_msg))
+                frame.more = more
+                parts.append(frame)
+        return parts
+
+    def send_gather(self, buffers, flags=0):
+        """
+        Send a sequence of buffers as a single message frame.
+
+        The buffers are copied in order straight into the message,
+        so e.g. a header, payload and trailer can be sent
+        without joining them in Python first.
+
+        .. versionadded:: 27.3
+
+        Parameters
+        ----------
+        buffers : sequence
+            Objects providing the buffer interface,
+            to be concatenated into one frame.
+        flags : int
+            0, NOBLOCK, SNDMORE, or NOBLOCK|SNDMORE.
+
+        Raises
+        ------
+        TypeError
+            If any buffer is unicode or does not support the buffer interface.
+        ZMQError
+            for any of the reasons zmq_msg_send might fail (including
+            if NOBLOCK is set and the outgoing queue is full).
+        """
+        _check_closed(self)
+        if not isinstance(buffers, (list, tuple)):
+            buffers = list(buffers)
+        _send_gather(self.handle, buffers, flags)
+
+    def send_many(self, msgs, flags=0, copy: bint = True) -> C.int:
+        """
+        Send a sequence of messages back-to-back in one call.
+
+        All messages are prepared before anything is sent,
+        then sent in a single loop without the GIL.
+        Each message may be a single frame (any sendable object)
+        or a list or tuple of frames to send as a multipart message.
+
+        If a send would block (EAGAIN, e.g. DONTWAIT was passed
+        and the socket is at its high-water mark),
+        sending stops without raising and the number of messages
+        that were sent is returned.
+        Unsent messages are discarded, so they can be retried
+        with ``msgs[sent:]``.
+
+        .. versionadded:: 27.3
+
+        Parameters
+        ----------
+        msgs : sequence
+            The messages to send.
+        flags : int
+            Any valid flags for :func:`Socket.send`.
+        copy : bool
+            Should the frames be sent in a copying or non-copying manner.
+            If copy=False, frames smaller than self.copy_threshold bytes
+            will be copied anyway.
+
+        Returns
+        -------
+        sent : int
+            The number of messages sent.
+
+        Raises
+        ------
+        TypeError
+            If any frame does not support the buffer interface.
+            Nothing is sent in this case.
+        IndexError
+            If any multipart message is empty.
+            Nothing is sent in this case.
+        ZMQError
+            for any reason zmq_msg_send might fail other than EAGAIN.
+        """
+        _check_closed(self)
+        if not isinstance(msgs, (list, tuple)):
+            msgs = list(msgs)
+        nframes: C.int = 0
+        for msg in msgs:
+            if isinstance(msg, (list, tuple)):
+                if len(msg) == 0:
+                    raise IndexError("Cannot send an empty multipart message")
+                nframes += len(msg)
+            else:
+                nframes += 1
+        if nframes == 0:
+            return 0
+
+        c_flags: C.int = flags
+        zmq_msgs: pointer(zmq_msg_t) = cast(
+            pointer(zmq_msg_t), malloc(nframes * sizeof(zmq_msg_t))
+        )
+        srcs: pointer(p_void) = cast(pointer(p_void), malloc(nframes * sizeof(p_void)))
+        more: pointer(bint) = cast(pointer(bint), malloc(nframes * sizeof(bint)))
+        if zmq_msgs == NULL or srcs == NULL or more == NULL:
+            free(zmq_msgs)
+            free(srcs)
+            free(more)
+            raise MemoryError("Could not allocate messages")
+
+        i: C.int
+        j: C.int
+        ninit: C.int = 0
+        sent: C.int = 0
+        nsent: C.int = 0
+        try:
+            for msg in msgs:
+                parts = msg if isinstance(msg, (list, tuple)) else (msg,)
+                for j in range(len(parts)):
+                    _init_send_msg(
+                        self,
+                        address(zmq_msgs[ninit]),
+                        address(srcs[ninit]),
+                        parts[j],
+                        j,
+                        copy,
+                        False,
+                    )
+                    more[ninit] = j < len(parts) - 1
+                    ninit += 1
+            sent = _send_many(self.handle, zmq_msgs, srcs, more, nframes, c_flags)
+            for i in range(sent):
+                if not more[i]:
+                    nsent += 1
+        finally:
+            # close anything prepared but not sent.
+            for i in range(ninit):
+                zmq_msg_close(address(zmq_msgs[i]))
+            free(zmq_msgs)
+            free(srcs)
+            free(more)
+        return nsent
+
+    def recv_many(
+        self, max_messages: C.int, flags=0, copy: bint = True, track: bint = False
+    ):
+        """
+        Receive up to `max_messages` messages in one call.
+
+        Only the first receive honors `flags` as given
+        (i.e. blocks unless DONTWAIT is passed).
+        Messages already queued after that are received with DONTWAIT
+        in the same call without the GIL, so the per-message cost
+        of a busy socket is amortized across the batch.
+        Each frame of a multipart message counts as one message,
+        use :meth:`recv_many_multipart` to receive whole multipart messages.
+
+        .. versionadded:: 27.3
+
+        Parameters
+        ----------
+        max_messages : int
+            The maximum number of messages to receive (at least 1).
+        flags : int
+            Any valid flags for :func:`Socket.recv`.
+        copy : bool
+            Should the messages be received in a copying or non-copying manner?
+            If False, Frame objects are returned, if True bytes.
+        track : bool
+            Should the messages be tracked for notification that ZMQ has
+            finished with them? (ignored if copy=True)
+
+        Returns
+        -------
+        msgs : list
+            Between 1 and `max_messages` messages, either bytes or Frames.
+
+        Raises
+        ------
+        ZMQError
+            for any of the reasons zmq_msg_recv might fail
+            before the first message is received
+            (including Again if DONTWAIT is set and no message is waiting).
+            Errors after the first message end the batch
+            and are raised by the next receive.
+        """
+        return _recv_many(self, max_messages, flags, copy, track, False)
+
+    def recv_many_multipart(
+        self, max_messages: C.int, flags=0, copy: bint = True, track: bint = False
+    ):
+        """
+        Receive up to `max_messages` multipart messages in one call.
+
+        Like :meth:`recv_many`, but each message is a list of parts,
+        as returned by :meth:`recv_multipart`.
+
+        .. versionadded:: 27.3
+
+        Parameters
+        ----------
+        max_messages : int
+            The maximum number of multipart messages to receive (at least 1).
+        flags : int
+            Any valid flags for :func:`Socket.recv`.
+        copy : bool
+            Should the message frame(s) be received in a copying or non-copying manner?
+            If False, Frame objects are returned, if True bytes.
+        track : bool
+            Should the message frame(s) be tracked for notification that ZMQ has
+            finished with it? (ignored if copy=True)
+
+        Returns
+        -------
+        msgs : list of lists
+            Between 1 and `max_messages` multipart messages.
+
+        Raises
+        ------
+        ZMQError
+            for any of the reasons zmq_msg_recv might fail
+            before the first message is received.
+        """
+        return _recv_many(self, max_messages, flags, copy, track, True)
+
 
 # inline socket methods
 
@@ -1395,10 +2025,12 @@ def _recv_frame(handle: p_void, flags: C.int = 0, track: bint = False) -> Frame:
 
 @cfunc
 @inline
-def _recv_copy(handle: p_void, flags: C.int = 0):
-    """Receive a message and return a copy"""
-    zmq_msg = declare(zmq_msg_t)
-    zmq_msg_p: pointer(zmq_msg_t) = address(zmq_msg)
+def _recv_msg(handle: p_void, zmq_msg_p: pointer(zmq_msg_t), flags: C.int = 0):
+    """Initialize zmq_msg_p and receive a message into it
+
+    The caller is responsible for closing the message on success.
+    On failure, the message is closed and the error raised.
+    """
     rc: C.int = zmq_msg_init(zmq_msg_p)
     _check_rc(rc)
     while True:
@@ -1414,6 +2046,213 @@ def _recv_copy(handle: p_void, flags: C.int = 0):
         else:
             break
 
+
+@cfunc
+@inline
+@nogil
+def _recv_msgs_nogil(
+    handle: p_void,
+    msgs: pointer(zmq_msg_t),
+    start: C.int,
+    capacity: C.int,
+    flags: C.int,
+    max_messages: C.int,
+    multipart: bint,
+    nmsgs: pointer(C.int),
+) -> C.int:
+    """Receive frames into msgs[start:capacity] until max_messages are complete
+
+    Only the first frame uses `flags` as given, later frames add ZMQ_DONTWAIT.
+    nmsgs[0] is incremented for each complete message.
+
+    Returns the number of frames in msgs.
+    Stops early if msgs is full or a receive fails,
+    in which case zmq_errno() has the reason.
+    """
+    i: C.int = start
+    rc: C.int
+    while i < capacity and nmsgs[0] < max_messages:
+        zmq_msg_init(address(msgs[i]))
+        if i == 0:
+            rc = zmq_msg_recv(address(msgs[i]), handle, flags)
+        else:
+            rc = zmq_msg_recv(address(msgs[i]), handle, flags | ZMQ_DONTWAIT)
+        if rc < 0:
+            zmq_msg_close(address(msgs[i]))
+            return i
+        if not multipart or not zmq_msg_more(address(msgs[i])):
+            nmsgs[0] += 1
+        i += 1
+    return i
+
+
+@cfunc
+@inline
+@nogil
+def _recv_arena_nogil(
+    handle: p_void,
+    arena: p_char,
+    capacity: size_t,
+    offset: pointer(size_t),
+    index: pointer(uint64_t),
+    index_capacity: C.int,
+    nframes: pointer(C.int),
+    max_frames: C.int,
+    flags: C.int,
+    msg_start: pointer(C.int),
+    overflow: pointer(zmq_msg_t),
+) -> C.int:
+    """Receive whole messages into arena[offset:capacity], recording them in index
+
+    Each frame adds (offset, length, more) to index and increments nframes[0].
+    Only the first frame uses `flags` as given, later frames add ZMQ_DONTWAIT.
+    msg_start[0] is set to the index of the first frame of the message being received.
+
+    Returns 1 if index is full and there may be more to receive,
+    -1 if a receive failed, in which case zmq_errno() has the reason,
+    2 if a frame does not fit in the arena or max_frames,
+    in which case it is moved to `overflow` (initialized by the caller),
+    and 0 when max_frames have been received or the arena is full.
+    """
+    msg = declare(zmq_msg_t)
+    rc: C.int
+    nbytes: size_t
+    i: C.int
+    while True:
+        if nframes[0] == 0 or not index[3 * nframes[0] - 1]:
+            # at a message boundary
+            msg_start[0] = nframes[0]
+            if nframes[0] >= max_frames or (nframes[0] > 0 and offset[0] == capacity):
+                return 0
+        if nframes[0] == index_capacity:
+            return 1
+        zmq_msg_init(address(msg))
+        if nframes[0] == 0:
+            rc = zmq_msg_recv(address(msg), handle, flags)
+        else:
+            rc = zmq_msg_recv(address(msg), handle, flags | ZMQ_DONTWAIT)
+        if rc < 0:
+            zmq_msg_close(address(msg))
+            return -1
+        nbytes = zmq_msg_size(address(msg))
+        if nbytes > capacity - offset[0] or nframes[0] >= max_frames:
+            zmq_msg_move(overflow, address(msg))
+            zmq_msg_close(address(msg))
+            return 2
+        memcpy(arena + offset[0], zmq_msg_data(address(msg)), nbytes)
+        i = 3 * nframes[0]
+        index[i] = offset[0]
+        index[i + 1] = nbytes
+        index[i + 2] = zmq_msg_more(address(msg))
+        zmq_msg_close(address(msg))
+        nframes[0] += 1
+        offset[0] += nbytes
+
+
+@cfunc
+def _recv_many(
+    s: Socket,
+    max_messages: C.int,
+    flags: C.int,
+    copy: bint,
+    track: bint,
+    multipart: bint,
+) -> list:
+    """Receive up to max_messages messages (or multipart messages) as a list"""
+    _check_closed(s)
+    if max_messages < 1:
+        raise ValueError(f"max_messages must be at least 1, not {max_messages}")
+    # start small, growing as frames arrive, not by the size of the request
+    capacity: C.int = min(max_messages, 64)
+    msgs: pointer(zmq_msg_t) = cast(
+        pointer(zmq_msg_t), malloc(capacity * sizeof(zmq_msg_t))
+    )
+    if msgs == NULL:
+        raise MemoryError("Could not allocate messages")
+    new_msgs: pointer(zmq_msg_t)
+    nframes: C.int = 0
+    nmsgs: C.int = 0
+    i: C.int = 0
+    more: bint
+    partial: bint
+    frame: Frame
+    result: list = []
+    parts: list = []
+    try:
+        while True:
+            with nogil:
+                nframes = _recv_msgs_nogil(
+                    s.handle,
+                    msgs,
+                    nframes,
+                    capacity,
+                    flags,
+                    max_messages,
+                    multipart,
+                    address(nmsgs),
+                )
+            if nmsgs == max_messages:
+                break
+            if nframes == capacity:
+                # more frames than we have room for
+                new_msgs = cast(
+                    pointer(zmq_msg_t), malloc(2 * capacity * sizeof(zmq_msg_t))
+                )
+                if new_msgs == NULL:
+                    raise MemoryError("Could not allocate messages")
+                for i in range(nframes):
+                    zmq_msg_init(address(new_msgs[i]))
+                    zmq_msg_move(address(new_msgs[i]), address(msgs[i]))
+                free(msgs)
+                msgs = new_msgs
+                capacity *= 2
+                continue
+            # frames past the last complete message must not be dropped,
+            # or libzmq would deliver the rest of the message on its own
+            partial = (
+                multipart and nframes > 0 and zmq_msg_more(address(msgs[nframes - 1]))
+            )
+            if nmsgs > 0 and not partial:
+                # return what we have, the next recv will see the error
+                break
+            try:
+                _check_rc(-1, True)
+            except InterruptedSystemCall:
+                # later frames use DONTWAIT, so retrying can't block
+                continue
+
+        for i in range(nframes):
+            more = zmq_msg_more(address(msgs[i]))
+            if copy:
+                part = _copy_zmq_msg_bytes(address(msgs[i]))
+            else:
+                frame = zmq.Frame(track=track)
+                zmq_msg_move(address(frame.zmq_msg), address(msgs[i]))
+                frame.more = more
+                part = frame
+            if not multipart:
+                result.append(part)
+                continue
+            parts.append(part)
+            if not more:
+                result.append(parts)
+                parts = []
+                if len(result) == nmsgs:
+                    break
+    finally:
+        for i in range(nframes):
+            zmq_msg_close(address(msgs[i]))
+        free(msgs)
+    return result
+
+
+@cfunc
+@inline
+def _recv_copy(handle: p_void, flags: C.int = 0):
+    """Receive a message and return a copy"""
+    zmq_msg = declare(zmq_msg_t)
+    zmq_msg_p: pointer(zmq_msg_t) = address(zmq_msg)
+    _recv_msg(handle, zmq_msg_p, flags)
     msg_bytes = _copy_zmq_msg_bytes(zmq_msg_p)
     zmq_msg_close(zmq_msg_p)
     return msg_bytes
@@ -1477,6 +2316,255 @@ def _send_copy(handle: p_void, buf, flags: C.int = 0):
             break
 
 
+@cfunc
+def _send_gather(handle: p_void, buffers, flags: C.int = 0):
+    """Send a sequence of buffers as one message, copying them in order."""
+    rc: C.int
+    msg = declare(zmq_msg_t)
+    n: Py_ssize_t = len(buffers)
+    i: Py_ssize_t
+    total: size_t = 0
+    dest: p_char
+    srcs: pointer(p_void) = cast(pointer(p_void), malloc((n + 1) * sizeof(p_void)))
+    sizes: pointer(size_t) = cast(pointer(size_t), malloc((n + 1) * sizeof(size_t)))
+    if srcs == NULL or sizes == NULL:
+        free(srcs)
+        free(sizes)
+        raise MemoryError("Could not allocate buffer array")
+
+    try:
+        for i in range(n):
+            buf = buffers[i]
+            if isinstance(buf, str):
+                raise TypeError("unicode not allowed, use send_string")
+            try:
+                sizes[i] = _asbuffer(buf, srcs + i)
+            except Exception:
+                rmsg = repr(buf)
+                if len(rmsg) > 32:
+                    rmsg = rmsg[:32] + '...'
+                raise TypeError(
+                    f"Buffer {i} ({rmsg}) does not support the buffer interface."
+                )
+            total += sizes[i]
+
+        # If zmq_msg_init_* fails we must not call zmq_msg_close (Bus Error)
+        rc = zmq_msg_init_size(address(msg), total)
+        _check_rc(rc)
+        with nogil:
+            dest = cast(p_char, zmq_msg_data(address(msg)))
+            for i in range(n):
+                memcpy(dest, srcs[i], sizes[i])
+                dest += sizes[i]
+    finally:
+        free(srcs)
+        free(sizes)
+
+    while True:
+        with nogil:
+            rc = zmq_msg_send(address(msg), handle, flags)
+        try:
+            _check_rc(rc)
+        except InterruptedSystemCall:
+            continue
+        except Exception:
+            zmq_msg_close(address(msg))  # close the unused msg
+            raise  # raise original exception
+        else:
+            rc = zmq_msg_close(address(msg))
+            _check_rc(rc)
+            break
+
+
+@cfunc
+def _init_send_msg(
+    s: Socket,
+    zmq_msg: pointer(zmq_msg_t),
+    src: pointer(p_void),
+    part,
+    index: C.int,
+    copy: bint,
+    track: bint,
+):
+    """Initialize a zmq_msg_t for sending one part of a multipart message.
+
+    Follows the same copy/track rules as `Socket.send`,
+    returning what `send` would have returned for this part.
+
+    For copied parts, the message is allocated but not yet filled.
+    `src` is set to the data to be copied into it (without the GIL) before sending,
+    and NULL otherwise.
+    """
+    rc: C.int
+    c_bytes = declare(p_void)
+    c_bytes_len: size_t
+    copy_threshold: size_t
+
+    src[0] = NULL
+    if isinstance(part, Frame):
+        if track and not cast(Frame, part).tracker:
+            raise ValueError('Not a tracked message')
+        # share the Frame's message, like Frame.fast_copy
+        rc = zmq_msg_init(zmq_msg)
+        _check_rc(rc)
+        zmq_msg_copy(zmq_msg, address(cast(Frame, part).zmq_msg))
+        return cast(Frame, part).tracker
+
+    if isinstance(part, str):
+        raise TypeError("unicode not allowed, use send_string")
+    try:
+        c_bytes_len = _asbuffer(part, address(c_bytes))
+    except Exception:
+        rmsg = repr(part)
+        if len(rmsg) > 32:
+            rmsg = rmsg[:32] + '...'
+        raise TypeError(
+            f"Frame {index} ({rmsg}) does not support the buffer interface."
+        )
+
+    if not copy:
+        copy_threshold = s.copy_threshold
+        if not copy_threshold or c_bytes_len >= copy_threshold:
+            frame: Frame = Frame(part, track=track, copy_threshold=s.copy_threshold)
+            rc = zmq_msg_init(zmq_msg)
+            _check_rc(rc)
+            zmq_msg_copy(zmq_msg, address(frame.zmq_msg))
+            return frame.tracker
+
+    # copy message data. If zmq_msg_init_* fails we must not call zmq_msg_close.
+    rc = zmq_msg_init_size(zmq_msg, c_bytes_len)
+    _check_rc(rc)
+    src[0] = c_bytes
+    if copy:
+        return None
+    # always copy messages smaller than copy_threshold
+    return zmq._FINISHED_TRACKER
+
+
+@cfunc
+@inline
+@nogil
+def _send_msgs_nogil(
+    handle: p_void,
+    msgs: pointer(zmq_msg_t),
+    srcs: pointer(p_void),
+    start: C.int,
+    nmsgs: C.int,
+    flags: C.int,
+) -> C.int:
+    """Send msgs[start:nmsgs], adding SNDMORE to all but the last
+
+    Copies pending data from srcs into the messages first.
+
+    Returns the index of the first message that failed to send,
+    or nmsgs if all were sent.
+    """
+    i: C.int
+    rc: C.int
+    for i in range(start, nmsgs):
+        if srcs[i] != NULL:
+            memcpy(
+                zmq_msg_data(address(msgs[i])), srcs[i], zmq_msg_size(address(msgs[i]))
+            )
+            srcs[i] = NULL
+        if i < nmsgs - 1:
+            rc = zmq_msg_send(address(msgs[i]), handle, flags | ZMQ_SNDMORE)
+        else:
+            rc = zmq_msg_send(address(msgs[i]), handle, flags)
+        if rc < 0:
+            return i
+    return nmsgs
+
+
+@cfunc
+@inline
+def _send_msgs(
+    handle: p_void,
+    msgs: pointer(zmq_msg_t),
+    srcs: pointer(p_void),
+    nmsgs: C.int,
+    flags: C.int,
+):
+    """Send an array of prepared zmq_msg_t as one multipart message
+
+    Retries interrupted calls, raising ZMQError on failure.
+    """
+    sent: C.int = 0
+    while True:
+        with nogil:
+            sent = _send_msgs_nogil(handle, msgs, srcs, sent, nmsgs, flags)
+        if sent == nmsgs:
+            break
+        try:
+            _check_rc(-1, True)
+        except InterruptedSystemCall:
+            continue
+
+
+@cfunc
+@inline
+@nogil
+def _send_many_nogil(
+    handle: p_void,
+    msgs: pointer(zmq_msg_t),
+    srcs: pointer(p_void),
+    more: pointer(bint),
+    start: C.int,
+    nmsgs: C.int,
+    flags: C.int,
+) -> C.int:
+    """Send msgs[start:nmsgs], adding SNDMORE where more[i] is set
+
+    Copies pending data from srcs into the messages first.
+
+    Returns the index of the first message that failed to send,
+    or nmsgs if all were sent.
+    """
+    i: C.int
+    rc: C.int
+    for i in range(start, nmsgs):
+        if srcs[i] != NULL:
+            memcpy(
+                zmq_msg_data(address(msgs[i])), srcs[i], zmq_msg_size(address(msgs[i]))
+            )
+            srcs[i] = NULL
+        if more[i]:
+            rc = zmq_msg_send(address(msgs[i]), handle, flags | ZMQ_SNDMORE)
+        else:
+            rc = zmq_msg_send(address(msgs[i]), handle, flags)
+        if rc < 0:
+            return i
+    return nmsgs
+
+
+@cfunc
+@inline
+def _send_many(
+    handle: p_void,
+    msgs: pointer(zmq_msg_t),
+    srcs: pointer(p_void),
+    more: pointer(bint),
+    nmsgs: C.int,
+    flags: C.int,
+) -> C.int:
+    """Send an array of prepared zmq_msg_t
+
+    Retries interrupted calls.
+    Returns the number of frames sent, stopping at EAGAIN.
+    Raises ZMQError on any other failure.
+    """
+    sent: C.int = 0
+    while True:
+        with nogil:
+            sent = _send_many_nogil(handle, msgs, srcs, more, sent, nmsgs, flags)
+        if sent == nmsgs or _zmq_errno() == EAGAIN:
+            return sent
+        try:
+            _check_rc(-1, True)
+        except InterruptedSystemCall:
+            continue
+
+
 @cfunc
 @inline
 def _getsockopt(handle: p_void, option: C.int, optval: p_void, sz: pointer(size_t)):
@@ -1624,9 +2712,7 @@ def zmq_poll(sockets, timeout: C.int = -1):
     timeout : int
         The number of milliseconds to poll for. Negative means no timeout.
     """
-    rc: C.int
     i: C.int
-    fileno: fd_t
     events: C.int
     pollitems: pointer(zmq_pollitem_t) = NULL
     nsockets: C.int = len(sockets)
@@ -1638,65 +2724,11 @@ def zmq_poll(sockets, timeout: C.int = -1):
     if pollitems == NULL:
         raise MemoryError("Could not allocate poll items")
 
-    for i in range(nsockets):
-        s, events = sockets[i]
-        if isinstance(s, Socket):
-            pollitems[i].socket = cast(Socket, s).handle
-            pollitems[i].fd = 0
-            pollitems[i].events = events
-            pollitems[i].revents = 0
-        elif isinstance(s, int):
-            fileno = s
-            pollitems[i].socket = NULL
-            pollitems[i].fd = fileno
-            pollitems[i].events = events
-            pollitems[i].revents = 0
-        elif hasattr(s, 'fileno'):
-            try:
-                fileno = int(s.fileno())
-            except Exception:
-                free(pollitems)
-                raise ValueError('fileno() must return a valid integer fd')
-            else:
-                pollitems[i].socket = NULL
-                pollitems[i].fd = fileno
-                pollitems[i].events = events
-                pollitems[i].revents = 0
-        else:
-            free(pollitems)
-            raise TypeError(
-                "Socket must be a 0MQ socket, an integer fd or have "
-                f"a fileno() method: {s!r}"
-            )
-
-    ms_passed: C.int = 0
-    tic: C.int
     try:
-        while True:
-            start: C.int = monotonic()
-            with nogil:
-                rc = zmq_poll_c(pollitems, nsockets, timeout)
-            try:
-                _check_rc(rc)
-            except InterruptedSystemCall:
-                if timeout > 0:
-                    tic = monotonic()
-                    ms_passed = int(1000 * (tic - start))
-                    if ms_passed < 0:
-                        # don't allow negative ms_passed,
-                        # which can happen on old Python versions without time.monotonic.
-                        warnings.warn(
-                            f"Negative elapsed time for interrupted poll: {ms_passed}."
-                            "  Did the clock change?",
-                            RuntimeWarning,
-                        )
-                        # treat this case the same as no time passing,
-                        # since it should be rare and not happen twice in a row.
-                        ms_passed = 0
-                    timeout = max(0, timeout - ms_passed)
-                continue
-            else:
-                break
+        for i in range(nsockets):
+            s, events = sockets[i]
+            _init_pollitem(address(pollitems[i]), s, events)
+        _poll(pollitems, nsockets, timeout)
     except Exception:
         free(pollitems)
         raise
@@ -1718,6 +2750,316 @@ def zmq_poll(sockets, timeout: C.int = -1):
     return results
 
 
+@cfunc
+def _fileno(s) -> fd_t:
+    """The native fd for an integer fd or object with fileno()"""
+    if isinstance(s, int):
+        return s
+    elif hasattr(s, 'fileno'):
+        try:
+            return int(s.fileno())
+        except Exception:
+            raise ValueError('fileno() must return a valid integer fd')
+    else:
+        raise TypeError(
+            "Socket must be a 0MQ socket, an integer fd or have "
+            f"a fileno() method: {s!r}"
+        )
+
+
+@cfunc
+def _init_pollitem(item: pointer(zmq_pollitem_t), s, events: C.int):
+    """Fill a zmq_pollitem_t for a zmq Socket, integer fd, or object with fileno()"""
+    if isinstance(s, Socket):
+        item.socket = cast(Socket, s).handle
+        item.fd = 0
+    else:
+        item.fd = _fileno(s)
+        item.socket = NULL
+    item.events = events
+    item.revents = 0
+
+
+@cfunc
+def _remaining_timeout(timeout: C.int, start: C.double) -> C.int:
+    """The timeout left for an interrupted poll that started at `start`"""
+    ms_passed: C.int
+    if timeout <= 0:
+        return timeout
+    ms_passed = int(1000 * (monotonic() - start))
+    if ms_passed < 0:
+        # don't allow negative ms_passed,
+        # which can happen on old Python versions without time.monotonic.
+        warnings.warn(
+            f"Negative elapsed time for interrupted poll: {ms_passed}."
+            "  Did the clock change?",
+            RuntimeWarning,
+        )
+        # treat this case the same as no time passing,
+        # since it should be rare and not happen twice in a row.
+        ms_passed = 0
+    return max(0, timeout - ms_passed)
+
+
+@cfunc
+def _poll(pollitems: pointer(zmq_pollitem_t), nitems: C.int, timeout: C.int) -> C.int:
+    """zmq_poll without the GIL, retrying interrupted calls
+
+    Returns the number of items with events.
+    """
+    rc: C.int
+    start: C.double
+    while True:
+        start = monotonic()
+        with nogil:
+            rc = zmq_poll_c(pollitems, nitems, timeout)
+        try:
+            _check_rc(rc)
+        except InterruptedSystemCall:
+            timeout = _remaining_timeout(timeout, start)
+            continue
+        else:
+            return rc
+
+
+@cclass
+class _PollItems:
+    """A persistent zmq_pollitem_t array, for use by zmq.Poller
+
+    Items are addressed by index.
+    Removing an item moves the items after it down one place,
+    so callers tracking indices must do the same.
+    """
+
+    def __cinit__(self):
+        self.items = NULL
+        self.nitems = 0
+        self.capacity = 0
+        self.sockets = []
+
+    def __dealloc__(self):
+        free(self.items)
+        self.items = NULL
+
+    def __len__(self) -> C.int:
+        return self.nitems
+
+    def append(self, socket, events: C.int):
+        """Add a socket or fd to be polled for `events`"""
+        capacity: C.int
+        items: pointer(zmq_pollitem_t)
+        if self.nitems == self.capacity:
+            capacity = max(8, 2 * self.capacity)
+            items = cast(
+                pointer(zmq_pollitem_t),
+                realloc(self.items, capacity * sizeof(zmq_pollitem_t)),
+            )
+            if items == NULL:
+                raise MemoryError("Could not allocate poll items")
+            self.items = items
+            self.capacity = capacity
+        _init_pollitem(address(self.items[self.nitems]), socket, events)
+        # zmq sockets are held to refresh their handle before each poll,
+        # everything else is polled (and returned) as the integer fd
+        self.sockets.append(socket if isinstance(socket, Socket) else None)
+        self.nitems += 1
+
+    def modify(self, idx: C.int, events: C.int):
+        """Change the events polled for the item at `idx`"""
+        if idx < 0 or idx >= self.nitems:
+            raise IndexError(idx)
+        self.items[idx].events = events
+
+    def remove(self, idx: C.int):
+        """Remove the item at `idx`, moving the items after it down one place"""
+        if idx < 0 or idx >= self.nitems:
+            raise IndexError(idx)
+        memmove(
+            address(self.items[idx]),
+            address(self.items[idx + 1]),
+            (self.nitems - idx - 1) * sizeof(zmq_pollitem_t),
+        )
+        del self.sockets[idx]
+        self.nitems -= 1
+
+    def poll(self, timeout: C.int = -1) -> list:
+        """Poll all items, returning a list of (socket or fd, revents)
+
+        Only the items with events are converted to Python objects.
+        """
+        i: C.int
+        nready: C.int
+        revents: C.short
+        s: Socket
+        if self.nitems == 0:
+            return []
+        for i in range(self.nitems):
+            if self.sockets[i] is not None:
+                s = self.sockets[i]
+                _check_closed(s)
+                self.items[i].socket = s.handle
+
+        nready = _poll(self.items, self.nitems, timeout)
+
+        results: list = []
+        i = 0
+        while nready > 0 and i < self.nitems:
+            revents = self.items[i].revents
+            if revents > 0:
+                nready -= 1
+                if self.items[i].socket != NULL:
+                    results.append((self.sockets[i], revents))
+                else:
+                    results.append((self.items[i].fd, revents))
+            i += 1
+        return results
+
+
+@cclass
+class _DraftPollItems:
+    """Like _PollItems, but backed by a zmq_poller (draft API)
+
+    zmq_poller_wait_all scales with the number of items that have events,
+    rather than the number registered.
+    """
+
+    def __cinit__(self):
+        self.poller = NULL
+        self.events = NULL
+        self.capacity = 0
+        self.sockets = []
+        self.flags = []
+
+    def __init__(self):
+        if not zmq.DRAFT_API:
+            raise RuntimeError("libzmq and pyzmq must be built with draft support")
+        self.poller = zmq_poller_new()
+        if self.poller == NULL:
+            raise ZMQError()
+
+    def __dealloc__(self):
+        if self.poller != NULL:
+            zmq_poller_destroy(address(self.poller))
+        free(self.events)
+        self.events = NULL
+
+    def __len__(self) -> C.int:
+        return len(self.sockets)
+
+    @cfunc
+    def _add(self, socket, events: C.int):
+        """Add a Socket or fd to the zmq_poller"""
+        rc: C.int
+        if isinstance(socket, Socket):
+            if cast(Socket, socket)._closed:
+                # like _PollItems, closed sockets raise in poll
+                return
+            # user_data is the Socket itself, held by self.sockets
+            rc = zmq_poller_add(
+                self.poller, cast(Socket, socket).handle, cast(p_void, socket), events
+            )
+        else:
+            rc = zmq_poller_add_fd(self.poller, socket, NULL, events)
+        _check_rc(rc)
+
+    def append(self, socket, events: C.int):
+        """Add a socket or fd to be polled for `events`"""
+        capacity: C.int
+        poller_events: pointer(zmq_poller_event_t)
+        if not isinstance(socket, Socket):
+            socket = _fileno(socket)
+        if len(self.sockets) == self.capacity:
+            capacity = max(8, 2 * self.capacity)
+            poller_events = cast(
+                pointer(zmq_poller_event_t),
+                realloc(self.events, capacity * sizeof(zmq_poller_event_t)),
+            )
+            if poller_events == NULL:
+                raise MemoryError("Could not allocate poller events")
+            self.events = poller_events
+            self.capacity = capacity
+        self._add(socket, events)
+        self.sockets.append(socket)
+        self.flags.append(events)
+
+    def modify(self, idx: C.int, events: C.int):
+        """Change the events polled for the item at `idx`"""
+        rc: C.int
+        socket = self.sockets[idx]
+        if isinstance(socket, Socket):
+            if cast(Socket, socket)._closed:
+                # not in the zmq_poller, closed sockets raise in poll
+                self.flags[idx] = events
+                return
+            rc = zmq_poller_modify(self.poller, cast(Socket, socket).handle, events)
+        else:
+            rc = zmq_poller_modify_fd(self.poller, socket, events)
+        _check_rc(rc)
+        self.flags[idx] = events
+
+    def remove(self, idx: C.int):
+        """Remove the item at `idx`, moving the items after it down one place"""
+        rc: C.int
+        socket = self.sockets.pop(idx)
+        del self.flags[idx]
+        if isinstance(socket, Socket):
+            if cast(Socket, socket)._closed:
+                # libzmq can't remove a closed socket, start a new poller
+                self._rebuild()
+                return
+            rc = zmq_poller_remove(self.poller, cast(Socket, socket).handle)
+        else:
+            rc = zmq_poller_remove_fd(self.poller, socket)
+        _check_rc(rc)
+
+    @cfunc
+    def _rebuild(self):
+        """Replace the zmq_poller with a new one for the current items"""
+        zmq_poller_destroy(address(self.poller))
+        self.poller = zmq_poller_new()
+        if self.poller == NULL:
+            raise ZMQError()
+        for socket, events in zip(self.sockets, self.flags):
+            self._add(socket, events)
+
+    def poll(self, timeout: C.int = -1) -> list:
+        """Poll all items, returning a list of (socket or fd, revents)"""
+        i: C.int
+        rc: C.int
+        nitems: C.int = len(self.sockets)
+        start: C.double
+        if nitems == 0:
+            return []
+        # a closed socket's handle may already be freed by libzmq
+        for socket in self.sockets:
+            if isinstance(socket, Socket):
+                _check_closed(socket)
+
+        while True:
+            start = monotonic()
+            with nogil:
+                rc = zmq_poller_wait_all(self.poller, self.events, nitems, timeout)
+            if rc < 0 and _zmq_errno() == EAGAIN:
+                # timeout
+                return []
+            try:
+                _check_rc(rc)
+            except InterruptedSystemCall:
+                timeout = _remaining_timeout(timeout, start)
+                continue
+            else:
+                break
+
+        results: list = []
+        for i in range(rc):
+            if self.events[i].user_data != NULL:
+                socket = cast(object, self.events[i].user_data)
+                results.append((socket, self.events[i].events))
+            else:
+                results.append((self.events[i].fd, self.events[i].events))
+        return results
+
+
 def proxy(frontend: Socket, backend: Socket, capture: Socket = None):
     """
     Start a zeromq proxy (replacement for device).
@@ -126,3 +126,14 @@ cdef extern from "zmq.h" nogil:
     int zmq_poller_modify (void *poller_, void *socket_, short events_)
     int zmq_poller_remove (void *poller_, void *socket_)
     int zmq_poller_fd (void *poller_, fd_t *fd_)
+    int zmq_poller_add_fd (void *poller_, fd_t fd_, void *user_data_, short events_)
+    int zmq_poller_modify_fd (void *poller_, fd_t fd_, short events_)
+    int zmq_poller_remove_fd (void *poller_, fd_t fd_)
+
+    ctypedef struct zmq_poller_event_t:
+        void *socket
+        fd_t fd
+        void *user_data
+        short events
+
+    int zmq_poller_wait_all (void *poller_, zmq_poller_event_t *events_, int n_events_, long timeout_)
@@ -36,6 +36,10 @@ def select_backend(name: str) -> dict[str, Any]:
     ns = {
         # private API
         'monitored_queue': mod.monitored_queue,
+        '_PollItems': mod._PollItems,
+        '_DraftPollItems': mod._DraftPollItems,
+        '_gc_queue_allocate': mod._gc_queue_allocate,
+        '_gc_queue_drain': mod._gc_queue_drain,
     }
     ns.update({key: getattr(mod, key) for key in public_api})
     return ns
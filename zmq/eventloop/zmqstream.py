@@ -26,6 +26,7 @@ from tornado.log import gen_log
 import zmq
 import zmq._future
 from zmq import POLLIN, POLLOUT
+from zmq.sugar.socket import _array_frames, _array_from_frames, _pickle_frames
 from zmq.utils import jsonapi
 
 
@@ -277,6 +278,26 @@ class ZMQStream:
 
             self.on_recv(stream_callback, copy=copy)
 
+    def on_recv_array(self, callback: Callable[[Any], Any], copy: bool = True):
+        """Register a callback for numpy arrays sent with send_array
+
+        callback will be called with the received array::
+
+            callback(A)
+
+        If copy is False, the array shares memory with the received Frame.
+
+        .. versionadded:: 27.3
+        """
+        if callback is None:
+            self.stop_on_recv()
+        else:
+
+            def array_callback(msg):
+                return callback(_array_from_frames(msg))
+
+            self.on_recv(array_callback, copy=copy)
+
     def on_send(
         self, callback: Callable[[Sequence[Any], zmq.MessageTracker | None], Any]
     ):
@@ -402,15 +423,48 @@ class ZMQStream:
         flags: int = 0,
         protocol: int = -1,
         callback: Callable | None = None,
+        *,
+        out_of_band: bool = False,
         **kwargs: Any,
     ):
         """Send a Python object as a message using pickle to serialize.
 
-        See zmq.socket.send_json for details.
+        See zmq.socket.send_pyobj for details.
+
+        .. versionchanged:: 27.3
+            Added `out_of_band`.
         """
+        if out_of_band:
+            kwargs.setdefault('copy', False)
+            return self.send_multipart(
+                _pickle_frames(obj, protocol), flags, callback=callback, **kwargs
+            )
         msg = pickle.dumps(obj, protocol)
         return self.send(msg, flags, callback=callback, **kwargs)
 
+    def send_array(
+        self,
+        A: Any,
+        flags: int = 0,
+        copy: bool = True,
+        track: bool = False,
+        callback: Callable | None = None,
+        **kwargs: Any,
+    ):
+        """Send a numpy array with its dtype and shape.
+        See zmq.socket.send_array for details.
+
+        .. versionadded:: 27.3
+        """
+        return self.send_multipart(
+            list(_array_frames(A)),
+            flags=flags,
+            copy=copy,
+            track=track,
+            callback=callback,
+            **kwargs,
+        )
+
     def _finish_flush(self):
         """callback for unsetting _flushed flag."""
         self._flushed = False
@@ -281,6 +281,117 @@ class _Socket(_original_Socket):
                 return recvd
             self._wait_read()
 
+    def recv_multipart_into(self, buffers, flags=0):
+        """recv_multipart_into, which will only block current greenlet"""
+        if flags & zmq.DONTWAIT:
+            try:
+                return super().recv_multipart_into(buffers, flags)
+            finally:
+                self.__state_changed()
+        flags |= zmq.DONTWAIT
+        while True:
+            try:
+                sizes = super().recv_multipart_into(buffers, flags)
+            except zmq.ZMQError as e:
+                if e.errno != zmq.EAGAIN:
+                    self.__state_changed()
+                    raise
+            else:
+                self.__state_changed()
+                return sizes
+            self._wait_read()
+
+    def recv_arena(self, buffer, /, *, max_frames=0, flags=0):
+        """recv_arena, which will only block current greenlet"""
+        if flags & zmq.DONTWAIT:
+            try:
+                return super().recv_arena(buffer, max_frames=max_frames, flags=flags)
+            finally:
+                self.__state_changed()
+        flags |= zmq.DONTWAIT
+        while True:
+            try:
+                result = super().recv_arena(buffer, max_frames=max_frames, flags=flags)
+            except zmq.ZMQError as e:
+                if e.errno != zmq.EAGAIN:
+                    self.__state_changed()
+                    raise
+            else:
+                self.__state_changed()
+                return result
+            self._wait_read()
+
+    def send_gather(self, buffers, flags=0):
+        """send_gather, which will only block current greenlet"""
+        if flags & zmq.DONTWAIT:
+            try:
+                return super().send_gather(buffers, flags)
+            finally:
+                self.__state_changed()
+        flags |= zmq.DONTWAIT
+        while True:
+            try:
+                super().send_gather(buffers, flags)
+            except zmq.ZMQError as e:
+                if e.errno != zmq.EAGAIN:
+                    self.__state_changed()
+                    raise
+            else:
+                self.__state_changed()
+                return
+            self._wait_write()
+
+    def send_many(self, msgs, flags=0, copy=True):
+        """send_many, which will only block current greenlet"""
+        if flags & zmq.DONTWAIT:
+            try:
+                return super().send_many(msgs, flags, copy)
+            finally:
+                self.__state_changed()
+        if not isinstance(msgs, (list, tuple)):
+            msgs = list(msgs)
+        flags |= zmq.DONTWAIT
+        sent = 0
+        while True:
+            try:
+                sent += super().send_many(msgs[sent:], flags, copy)
+            except zmq.ZMQError:
+                self.__state_changed()
+                raise
+            if sent == len(msgs):
+                self.__state_changed()
+                return sent
+            self._wait_write()
+
+    def recv_many(self, max_messages, flags=0, copy=True, track=False):
+        """recv_many, which will only block current greenlet"""
+        return self.__recv_many(super().recv_many, max_messages, flags, copy, track)
+
+    def recv_many_multipart(self, max_messages, flags=0, copy=True, track=False):
+        """recv_many_multipart, which will only block current greenlet"""
+        return self.__recv_many(
+            super().recv_many_multipart, max_messages, flags, copy, track
+        )
+
+    def __recv_many(self, recv_many, max_messages, flags, copy, track):
+        if flags & zmq.DONTWAIT:
+            try:
+                return recv_many(max_messages, flags, copy, track)
+            finally:
+                self.__state_changed()
+        flags |= zmq.DONTWAIT
+        while True:
+            try:
+                msgs = recv_many(max_messages, flags, copy, track)
+            except zmq.ZMQError as e:
+                if e.errno != zmq.EAGAIN:
+                    self.__state_changed()
+                    raise
+            else:
+                self.__state_changed()
+                return msgs
+            self._wait_read()
+
     def send_multipart(self, *args, **kwargs):
         """wrap send_multipart to prevent state_changed on each partial send"""
         self.__in_send_multipart = True
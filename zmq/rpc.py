@@ -0,0 +1,291 @@
+"""Pipelined RPC over DEALER/ROUTER sockets, for asyncio.
+
+An :class:`RPCClient` sends calls on a DEALER socket,
+without waiting for earlier calls to return,
+matching replies to calls by a request id.
+An :class:`RPCServer` handles the calls arriving on a ROUTER socket
+concurrently, up to a limit::
+
+    server = RPCServer(ctx.socket(zmq.ROUTER))
+    server.socket.bind(url)
+
+    @server.register
+    async def add(a, b):
+        return a + b
+
+    asyncio.create_task(server.serve())
+
+    client = RPCClient(ctx.socket(zmq.DEALER))
+    client.socket.connect(url)
+    results = await asyncio.gather(*(client.call("add", i, i) for i in range(1000)))
+
+Calls are multipart messages of ``[request_id, method, arguments]``,
+and replies are ``[request_id, status, result]``,
+where `status` is ``OK`` or ``ERR``.
+Arguments and results are serialized with JSON by default.
+
+.. versionadded:: 27.3
+"""
+
+# Copyright (C) PyZMQ Developers
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from itertools import count
+from typing import Any, Callable
+
+import zmq
+import zmq.asyncio
+from zmq.utils import jsonapi
+
+_OK = b'OK'
+_ERR = b'ERR'
+
+
+class RPCError(Exception):
+    """An error raised by a remote call
+
+    Attributes
+    ----------
+    type : str
+        The name of the exception class raised by the server,
+        or ``MethodNotFound`` for calls to unregistered methods.
+    message : str
+        The message of the exception.
+    """
+
+    def __init__(self, type: str, message: str) -> None:
+        super().__init__(type, message)
+        self.type = type
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"{self.type}: {self.message}"
+
+
+class RPCClient:
+    """Make concurrent calls to an :class:`RPCServer` over one DEALER socket.
+
+    Any number of calls may be in flight at once.
+    Replies are received by one background task and handed to the waiting calls.
+
+    Parameters
+    ----------
+    socket : zmq.asyncio.Socket
+        A DEALER socket, connected to one or more servers.
+        The client owns the socket while in use:
+        don't send or receive on it elsewhere.
+    serialize : callable
+        Serializes ``[args, kwargs]`` for a call. Default: JSON.
+    deserialize : callable
+        Deserializes the result of a call. Default: JSON.
+    """
+
+    socket: zmq.asyncio.Socket
+
+    def __init__(
+        self,
+        socket: zmq.asyncio.Socket,
+        *,
+        serialize: Callable[[Any], bytes] = jsonapi.dumps,
+        deserialize: Callable[[bytes], Any] = jsonapi.loads,
+    ) -> None:
+        self.socket = socket
+        self._serialize = serialize
+        self._deserialize = deserialize
+        # waiting calls, by request id
+        self._pending: dict[bytes, asyncio.Future] = {}
+        self._request_ids = count()
+        self._recv_task: asyncio.Task | None = None
+
+    async def call(self, method: str, /, *args: Any, **kwargs: Any) -> Any:
+        """Call a method on the server, and return its result.
+
+        Use :func:`asyncio.wait_for` for a timeout.
+        A late reply to a cancelled call is discarded.
+
+        Raises
+        ------
+        RPCError
+            if the method raised on the server, or isn't registered there.
+        """
+        if self._recv_task is None or self._recv_task.done():
+            self._recv_task = asyncio.ensure_future(self._recv_replies())
+        request_id = next(self._request_ids).to_bytes(8, 'big')
+        reply = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = reply
+        try:
+            self.socket.write_multipart(
+                [request_id, method.encode('utf8'), self._serialize([args, kwargs])]
+            )
+            await self.socket.drain()
+            status, payload = await reply
+        finally:
+            self._pending.pop(request_id, None)
+        if status == _OK:
+            return self._deserialize(payload)
+        error = jsonapi.loads(payload)
+        raise RPCError(error['type'], error['message'])
+
+    async def _recv_replies(self) -> None:
+        """Hand replies to the waiting calls"""
+        pending = self._pending
+        try:
+            async for msg in self.socket:
+                if len(msg) != 3:
+                    # not a reply
+                    continue
+                request_id, status, payload = msg
+                reply = pending.get(request_id)
+                if reply is not None and not reply.done():
+                    reply.set_result((status, payload))
+        except Exception as e:
+            # e.g. the socket was closed, fail every waiting call
+            for reply in pending.values():
+                if not reply.done():
+                    reply.set_exception(e)
+
+    def close(self) -> None:
+        """Stop receiving replies, and cancel the waiting calls
+
+        Does not close the socket.
+        """
+        if self._recv_task is not None:
+            self._recv_task.cancel()
+            self._recv_task = None
+        for reply in self._pending.values():
+            reply.cancel()
+
+    async def __aenter__(self) -> RPCClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class RPCServer:
+    """Handle calls from :class:`RPCClient` on a ROUTER socket.
+
+    Calls are handled concurrently, up to `concurrency` at a time.
+    While that many calls are in progress,
+    the server stops receiving, leaving new calls queued in the socket.
+
+    Parameters
+    ----------
+    socket : zmq.asyncio.Socket
+        A ROUTER socket, bound or connected for clients to reach.
+    handlers : dict, optional
+        Functions to handle calls, by method name.
+        More can be added with :meth:`register`.
+    concurrency : int
+        The maximum number of calls to handle at once.
+    serialize : callable
+        Serializes the result of a call. Default: JSON.
+    deserialize : callable
+        Deserializes ``[args, kwargs]`` for a call. Default: JSON.
+    """
+
+    socket: zmq.asyncio.Socket
+    handlers: dict[str, Callable]
+    concurrency: int
+
+    def __init__(
+        self,
+        socket: zmq.asyncio.Socket,
+        handlers: dict[str, Callable] | None = None,
+        *,
+        concurrency: int = 64,
+        serialize: Callable[[Any], bytes] = jsonapi.dumps,
+        deserialize: Callable[[bytes], Any] = jsonapi.loads,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, not {concurrency}")
+        self.socket = socket
+        self.handlers = dict(handlers or {})
+        self.concurrency = concurrency
+        self._serialize = serialize
+        self._deserialize = deserialize
+
+    def register(self, func: Callable | None = None, *, name: str | None = None):
+        """Register a function to handle calls to a method.
+
+        The function may be a coroutine function.
+        The method name defaults to the function's name.
+        Can be used as a decorator::
+
+            @server.register
+            def add(a, b):
+                return a + b
+
+            @server.register(name="mul")
+            async def multiply(a, b):
+                return a * b
+        """
+        if func is None:
+            return lambda func: self.register(func, name=name)
+        self.handlers[name or func.__name__] = func
+        return func
+
+    async def serve(self) -> None:
+        """Handle calls until cancelled
+
+        Calls still in progress are cancelled when serving stops.
+        Errors sending a reply are reported to the event loop's exception handler.
+        """
+        loop = asyncio.get_running_loop()
+        limit = asyncio.Semaphore(self.concurrency)
+        tasks: set[asyncio.Future] = set()
+
+        def _done(task):
+            tasks.discard(task)
+            limit.release()
+            if not task.cancelled() and task.exception() is not None:
+                loop.call_exception_handler(
+                    {
+                        'message': 'Error handling RPC call',
+                        'exception': task.exception(),
+                        'future': task,
+                    }
+                )
+
+        try:
+            async for msg in self.socket:
+                if len(msg) < 4:
+                    # not a call: [*routing_id, request_id, method, arguments]
+                    continue
+                await limit.acquire()
+                task = asyncio.ensure_future(self._handle(msg))
+                tasks.add(task)
+                task.add_done_callback(_done)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _handle(self, msg: list[bytes]) -> None:
+        """Handle one call, and send the reply"""
+        *routing_id, request_id, method, payload = msg
+        try:
+            name = method.decode('utf8')
+            handler = self.handlers.get(name)
+            if handler is None:
+                raise RPCError('MethodNotFound', f"No such method: {name!r}")
+            args, kwargs = self._deserialize(payload)
+            result = handler(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            reply = [_OK, self._serialize(result)]
+        except Exception as e:
+            if isinstance(e, RPCError):
+                error = {'type': e.type, 'message': e.message}
+            else:
+                error = {'type': type(e).__name__, 'message': str(e)}
+            reply = [_ERR, jsonapi.dumps(error)]
+        self.socket.write_multipart([*routing_id, request_id, *reply])
+        await self.socket.drain()
+
+
+__all__ = ['RPCClient', 'RPCError', 'RPCServer']
@@ -23,12 +23,14 @@ __all__ = [
     'InterruptedSystemCall',
     'Again',
     'ZMQVersionError',
+    'BufferPool',
     'Frame',
     'Message',
     'Poller',
     'select',
     'Socket',
     'SyncSocket',
+    'CompletionQueue',
     'MessageTracker',
     '_FINISHED_TRACKER',
     'zmq_version',
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+from collections import deque
 from typing import Literal, overload
 
 import zmq
@@ -70,6 +71,16 @@ class Frame(FrameBase, AttributeSetter):
         default: :const:`zmq.COPY_THRESHOLD`
         If copy is unspecified, messages smaller than this many bytes
         will be copied and messages larger than this will be shared with libzmq.
+    completion_queue: CompletionQueue
+        default: None
+        A :class:`CompletionQueue` to receive `token`
+        when libzmq is done with the data.
+        Unlike `track`, this does not create an Event per message.
+
+        .. versionadded:: 27.3
+    token: object
+        default: `data`
+        The token to put in `completion_queue`.
     """
 
     @overload
@@ -142,7 +153,96 @@ class Frame(FrameBase, AttributeSetter):
         self.set('routing_id', routing_id)
 
 
+class BufferPool:
+    """A pool of fixed-size writable buffers for zero-copy sends.
+
+    Buffers are returned to the pool automatically
+    when libzmq is done with the Frames created by :meth:`frame`,
+    so large outgoing messages avoid both the copy
+    and allocating a new buffer per message::
+
+        pool = zmq.BufferPool(1 << 20)
+        buf = pool.get()
+        nbytes = serialize_into(buf)
+        socket.send(pool.frame(buf, nbytes))
+
+    Parameters
+    ----------
+    size : int
+        The size in bytes of each buffer.
+    count : int
+        default: 0
+        The number of buffers to allocate up front.
+    max_free : int
+        default: None (unlimited)
+        The maximum number of free buffers to keep.
+        Buffers released while this many are free are discarded.
+
+    .. versionadded:: 27.3
+    """
+
+    size: int
+    max_free: int | None
+    _free: deque[bytearray]
+
+    def __init__(self, size: int, count: int = 0, max_free: int | None = None):
+        if size < 1:
+            raise ValueError(f"size must be positive, not {size}")
+        self.size = size
+        self.max_free = max_free
+        self._free = deque(bytearray(size) for i in range(count))
+
+    def __len__(self) -> int:
+        """The number of free buffers in the pool"""
+        return len(self._free)
+
+    def get(self) -> bytearray:
+        """Get a free buffer from the pool, allocating a new one if none are free"""
+        try:
+            return self._free.pop()
+        except IndexError:
+            return bytearray(self.size)
+
+    def release(self, buf: bytearray) -> None:
+        """Return a buffer that was not sent to the pool"""
+        self._check(buf)
+        self._complete([buf])
+
+    def frame(self, buf: bytearray, nbytes: int | None = None) -> Frame:
+        """Create a zero-copy Frame of the first `nbytes` of `buf`
+
+        `buf` is returned to the pool when libzmq is done with the Frame.
+        It must not be modified until then.
+
+        Parameters
+        ----------
+        buf : bytearray
+            A buffer obtained from :meth:`get`.
+        nbytes : int
+            default: all of `buf`
+            The number of bytes of `buf` to send.
+        """
+        self._check(buf)
+        if nbytes is None:
+            data = buf
+        elif 0 <= nbytes <= self.size:
+            data = memoryview(buf)[:nbytes]
+        else:
+            raise ValueError(f"nbytes must be between 0 and {self.size}, not {nbytes}")
+        return Frame(data, copy=False, completion_queue=self, token=buf)
+
+    def _check(self, buf: bytearray) -> None:
+        if not isinstance(buf, bytearray) or len(buf) != self.size:
+            raise ValueError(f"Not a buffer from this pool: {buf!r:.32}")
+
+    def _complete(self, bufs: list[bytearray]) -> None:
+        """Return released buffers to the pool (called by the gc thread)"""
+        if self.max_free is not None:
+            bufs = bufs[: max(self.max_free - len(self._free), 0)]
+        self._free.extend(bufs)
+
+
 # keep deprecated alias
 Message = Frame
 
-__all__ = ['Frame', 'Message']
+__all__ = ['BufferPool', 'Frame', 'Message']
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from zmq.backend import zmq_poll
+from zmq.backend import _DraftPollItems, _PollItems, zmq_poll
 from zmq.constants import POLLERR, POLLIN, POLLOUT
 
 # -----------------------------------------------------------------------------
@@ -16,14 +16,35 @@ from zmq.constants import POLLERR, POLLIN, POLLOUT
 
 
 class Poller:
-    """A stateful poll interface that mirrors Python's built-in poll."""
+    """A stateful poll interface that mirrors Python's built-in poll.
+
+    Parameters
+    ----------
+    use_zmq_poller : bool, optional
+        Whether to poll with libzmq's ``zmq_poller`` API instead of ``zmq_poll``.
+        ``zmq_poller`` scales with the number of sockets that have events,
+        rather than the number registered,
+        but requires libzmq and pyzmq to be built with draft support.
+        Its semantics differ slightly from ``zmq_poll``,
+        e.g. registering the same fd twice fails with EINVAL.
+        Default: False.
+
+    .. versionadded:: 27.3
+        use_zmq_poller
+    """
 
     sockets: list[tuple[Any, int]]
     _map: dict
+    _pollitems: _PollItems
 
-    def __init__(self) -> None:
+    def __init__(self, use_zmq_poller: bool = False) -> None:
         self.sockets = []
         self._map = {}
+        # native pollitems, kept in the same order as self.sockets
+        if use_zmq_poller:
+            self._pollitems = _DraftPollItems()
+        else:
+            self._pollitems = _PollItems()
 
     def __contains__(self, socket: Any) -> bool:
         return socket in self._map
@@ -43,13 +64,19 @@ class Poller:
         flags : int
             The events to watch for.  Can be POLLIN, POLLOUT or POLLIN|POLLOUT.
             If `flags=0`, socket will be unregistered.
+
+        .. versionchanged:: 27.3
+            The native fd of objects with a ``fileno()`` method is looked up here,
+            rather than on every poll, so invalid sockets raise on register.
         """
         if flags:
             if socket in self._map:
                 idx = self._map[socket]
+                self._pollitems.modify(idx, flags)
                 self.sockets[idx] = (socket, flags)
             else:
                 idx = len(self.sockets)
+                self._pollitems.append(socket, flags)
                 self.sockets.append((socket, flags))
                 self._map[socket] = idx
         elif socket in self._map:
@@ -72,10 +99,11 @@ class Poller:
             The socket instance to stop polling.
         """
         idx = self._map.pop(socket)
-        self.sockets.pop(idx)
-        # shift indices after deletion
-        for socket, flags in self.sockets[idx:]:
-            self._map[socket] -= 1
+        self._pollitems.remove(idx)
+        # the sockets after it move down one place, like _pollitems
+        del self.sockets[idx]
+        for s, flags in self.sockets[idx:]:
+            self._map[s] -= 1
 
     def poll(self, timeout: int | None = None) -> list[tuple[Any, int]]:
         """Poll the registered 0MQ or native fds for I/O.
@@ -103,7 +131,7 @@ class Poller:
             timeout = -1
         elif isinstance(timeout, float):
             timeout = int(timeout)
-        return zmq_poll(self.sockets, timeout=timeout)
+        return self._pollitems.poll(timeout)
 
 
 def select(
@@ -48,6 +48,112 @@ _SocketT_co = TypeVar("_SocketT_co", bound="Socket", covariant=True)
 # must match the `jsonapi.loads` return type
 _JSON: TypeAlias = "dict[str, Any] | list[Any] | str | float"
 
+# the largest array header recv_array(out=...) accepts
+_ARRAY_HEADER_SIZE = 4096
+
+
+def _frame_buffer(frame: Any) -> Any:
+    """Get a buffer for a received Frame that keeps its message alive"""
+    try:
+        memoryview(frame)
+    except TypeError:
+        # the Frame's buffer does not outlive it (cffi), copy
+        return frame.bytes
+    else:
+        return frame
+
+
+def _pickle_frames(obj: object, protocol: int) -> list[Any]:
+    """Pickle an object with its pickle 5 buffers as separate frames
+
+    The first frame is the pickle stream,
+    followed by one frame per out-of-band buffer.
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    msg = pickle.dumps(obj, max(protocol, 5), buffer_callback=buffers.append)
+    return [msg, *buffers]
+
+
+def _unpickle_frames(frames: list[Any]) -> Any:
+    """Unpickle the frames sent by send_pyobj(out_of_band=True)"""
+    return pickle.loads(
+        _frame_buffer(frames[0]),
+        buffers=[_frame_buffer(frame) for frame in frames[1:]],
+    )
+
+
+def _array_frames(A: Any) -> tuple[bytes, Any]:
+    """Serialize a numpy array as a (header, data) pair of frames
+
+    The header is json with the dtype, shape, and strides (if not C-contiguous).
+    The data is a bytewise view of the array's memory, without copying
+    unless the array is not contiguous.
+    """
+    import numpy
+
+    if A.dtype.hasobject:
+        raise TypeError("Cannot send arrays of Python objects")
+    strides = None
+    if not A.flags.c_contiguous:
+        if A.flags.f_contiguous:
+            strides = A.strides
+        else:
+            A = numpy.ascontiguousarray(A)
+    md = dict(
+        dtype=A.dtype.str if A.dtype.fields is None else A.dtype.descr,
+        shape=A.shape,
+        strides=strides,
+    )
+    return jsonapi.dumps(md), A.ravel(order='K').view(numpy.uint8)
+
+
+def _array_metadata(header: bytes) -> tuple[Any, tuple[int, ...], Any]:
+    """Load the dtype, shape, and strides from an array header frame"""
+    import numpy
+
+    md = cast(dict[str, Any], jsonapi.loads(header))
+    descr = md['dtype']
+    dtype = numpy.dtype(descr if isinstance(descr, str) else [tuple(f) for f in descr])
+    strides = md['strides']
+    if strides is not None:
+        strides = tuple(strides)
+    return dtype, tuple(md['shape']), strides
+
+
+def _array_from_frames(frames: list[Any]) -> Any:
+    """Deserialize a numpy array from the frames sent by send_array"""
+    import numpy
+
+    if len(frames) != 2:
+        raise ValueError(f"Expected 2 array frames (header, data), got {len(frames)}")
+    header, data = frames
+    if isinstance(header, zmq.Frame):
+        header = header.bytes
+    if isinstance(data, zmq.Frame):
+        data = _frame_buffer(data)
+    dtype, shape, strides = _array_metadata(header)
+    return numpy.ndarray(shape, dtype=dtype, buffer=data, strides=strides)
+
+
+def _array_into(header: bytearray, sizes: list[int], out: Any) -> Any:
+    """Check the array received into `out` by recv_array"""
+    if len(sizes) != 2:
+        raise ValueError(f"Expected 2 array frames (header, data), got {len(sizes)}")
+    if sizes[0] > len(header):
+        raise ValueError(f"Array header larger than {len(header)}B")
+    dtype, shape, strides = _array_metadata(bytes(header[: sizes[0]]))
+    if dtype != out.dtype or shape != out.shape:
+        raise ValueError(
+            f"Received array of {dtype} {shape} does not match out: {out.dtype} {out.shape}"
+        )
+    if (strides is None and not out.flags.c_contiguous) or (
+        strides is not None and strides != out.strides
+    ):
+        raise ValueError(f"Received array layout does not match out: {strides}")
+    if sizes[1] != out.nbytes:
+        raise ValueError(f"Received {sizes[1]}B of array data, expected {out.nbytes}B")
+    return out
+
 
 class _SocketContext(Generic[_SocketT_co]):
     """Context Manager for socket bind/unbind"""
@@ -105,6 +211,8 @@ class Socket(SocketBase, AttributeSetter, Generic[_SocketReturnT_co]):
 
     _shadow = False
     _shadow_obj: zmq.Socket | int | None = None
+    # whether copy_threshold may still be set from runtime calibration
+    _calibrate_copy_threshold = False
     _monitor_socket = None
     _type_name = 'UNKNOWN'
 
@@ -167,6 +275,7 @@ class Socket(SocketBase, AttributeSetter, Generic[_SocketReturnT_co]):
             shadow=shadow_address,
             copy_threshold=copy_threshold,
         )
+        self._calibrate_copy_threshold = copy_threshold is None
         if self._shadow_obj and shadow_context:
             # keep self.context reference if shadowing a Socket object
             self.context = shadow_context
@@ -318,6 +427,8 @@ class Socket(SocketBase, AttributeSetter, Generic[_SocketReturnT_co]):
             encoded to utf-8 first.
 
         """
+        if self._calibrate_copy_threshold:
+            self._apply_calibrated_copy_threshold(addr)
         try:
             super().bind(addr)
         except ZMQError as e:
@@ -344,6 +455,8 @@ class Socket(SocketBase, AttributeSetter, Generic[_SocketReturnT_co]):
             encoded to utf-8 first.
 
         """
+        if self._calibrate_copy_threshold:
+            self._apply_calibrated_copy_threshold(addr)
         try:
             super().connect(addr)
         except ZMQError as e:
@@ -351,6 +464,18 @@ class Socket(SocketBase, AttributeSetter, Generic[_SocketReturnT_co]):
             raise
         return self._connect_cm(addr)
 
+    def _apply_calibrated_copy_threshold(self, addr: str) -> None:
+        """Use the calibrated copy_threshold for addr's transport, if there is one
+
+        The first endpoint on a calibrated transport decides.
+        """
+        from zmq.utils.calibrate import get_copy_threshold
+
+        threshold = get_copy_threshold(addr)
+        if threshold is not None:
+            # also stops further calibration
+            self.copy_threshold = threshold
+
     # -------------------------------------------------------------------------
     # Deprecated aliases
     # -------------------------------------------------------------------------
@@ -377,6 +502,9 @@ class Socket(SocketBase, AttributeSetter, Generic[_SocketReturnT_co]):
 
     def __setattr__(self, key: str, value: Any) -> None:
         """Override to allow setting zmq.[UN]SUBSCRIBE even though we have a subscribe method"""
+        if key == 'copy_threshold':
+            # set explicitly, don't replace it with a calibrated threshold
+            self._calibrate_copy_threshold = False
         if key in self.__dict__:
             object.__setattr__(self, key, value)
             return
@@ -747,7 +875,14 @@ class Socket(SocketBase, AttributeSetter, Generic[_SocketReturnT_co]):
             be False until the send is completed.
         None : otherwise
             None if message was sent, raises an exception otherwise.
+
+        .. versionchanged:: 27.3
+            All parts are sent in a single backend call,
+            unless `send` is overridden by a subclass.
         """
+        if type(self).send is Socket.send:
+            return super().send_multipart(msg_parts, flags, copy=copy, track=track)
+        # send is overridden (e.g. zmq.green), send each part with self.send
         # typecheck parts before sending:
         for i, msg in enumerate(msg_parts):
             if isinstance(msg, (zmq.Frame, bytes, memoryview)):
@@ -809,7 +944,14 @@ class Socket(SocketBase, AttributeSetter, Generic[_SocketReturnT_co]):
         ------
         ZMQError
             for any of the reasons :func:`~Socket.recv` might fail
+
+        .. versionchanged:: 27.3
+            All parts are received in a single backend call,
+            unless `recv` is overridden by a subclass.
         """
+        if type(self).recv is Socket.recv:
+            return super().recv_multipart(flags, copy=copy, track=track)
+        # recv is overridden (e.g. zmq.green), receive each part with self.recv
         parts = [self.recv(flags, copy=copy, track=track)]
         # have first part already, only loop while more to receive
         while self.getsockopt(zmq.RCVMORE):
@@ -975,6 +1117,8 @@ class Socket(SocketBase, AttributeSetter, Generic[_SocketReturnT_co]):
         obj: object,
         flags: int = 0,
         protocol: int = DEFAULT_PROTOCOL,
+        *,
+        out_of_band: bool = False,
         **kwargs: Any,
     ) -> zmq.MessageTracker | None:
         """
@@ -998,11 +1142,25 @@ class Socket(SocketBase, AttributeSetter, Generic[_SocketReturnT_co]):
         protocol : int
             The pickle protocol number to use. The default is pickle.DEFAULT_PROTOCOL
             where defined, and pickle.HIGHEST_PROTOCOL elsewhere.
+        out_of_band : bool
+            If True, pickle with protocol 5 (or higher)
+            and send buffers exposed by the object (e.g. numpy arrays)
+            as separate frames after the pickle stream, without copying them
+            (unless copy=True is passed explicitly).
+            The message must be received with ``recv_pyobj(out_of_band=True)``.
+            Buffers must not be modified until the send is complete
+            (see `track`).
+
+            .. versionadded:: 27.3
         """
+        if out_of_band:
+            kwargs.setdefault('copy', False)
+            frames = _pickle_frames(obj, protocol)
+            return self.send_multipart(frames, flags=flags, **kwargs)
         msg = pickle.dumps(obj, protocol)
         return self.send(msg, flags=flags, **kwargs)
 
-    def recv_pyobj(self, flags: int = 0) -> Any:
+    def recv_pyobj(self, flags: int = 0, *, out_of_band: bool = False) -> Any:
         """
         Receive a Python object as a message using UNSAFE pickle to serialize.
 
@@ -1019,6 +1177,14 @@ class Socket(SocketBase, AttributeSetter, Generic[_SocketReturnT_co]):
         ----------
         flags : int
             Any valid flags for :func:`Socket.recv`.
+        out_of_band : bool
+            If True, receive a multipart message sent with
+            ``send_pyobj(out_of_band=True)``.
+            Out-of-band buffers are passed to pickle without copying,
+            so e.g. numpy arrays in the result share memory
+            with the received Frames.
+
+            .. versionadded:: 27.3
 
         Returns
         -------
@@ -1030,6 +1196,9 @@ class Socket(SocketBase, AttributeSetter, Generic[_SocketReturnT_co]):
         ZMQError
             for any of the reasons :func:`~Socket.recv` might fail
         """
+        if out_of_band:
+            frames = self.recv_multipart(flags, copy=False)
+            return self._deserialize(frames, _unpickle_frames)
         msg = self.recv(flags)
         return self._deserialize(msg, pickle.loads)
 
@@ -1075,6 +1244,94 @@ class Socket(SocketBase, AttributeSetter, Generic[_SocketReturnT_co]):
         msg = self.recv(flags)
         return self._deserialize(msg, lambda buf: jsonapi.loads(buf, **kwargs))
 
+    def send_array(
+        self,
+        A: Any,
+        flags: int = 0,
+        copy: bool = True,
+        track: bool = False,
+        **kwargs: Any,
+    ) -> zmq.MessageTracker | None:
+        """Send a numpy array as a header frame and a data frame.
+
+        The header is a small json document with the dtype, shape,
+        and strides (for Fortran-ordered arrays) of the array.
+        The data frame is the array's memory,
+        which is sent without copying if copy=False.
+        Arrays that are not contiguous are copied first.
+
+        .. versionadded:: 27.3
+
+        Parameters
+        ----------
+        A : numpy.ndarray
+            The array to send.
+        flags : int
+            Any valid flags for :func:`Socket.send`.
+        copy : bool
+            Should the data be sent in a copying or non-copying manner.
+            If copy=False, the array must not be modified until the send is complete
+            (see `track`).
+        track : bool
+            Should the data be tracked for notification that ZMQ has
+            finished with it? (ignored if copy=True)
+        """
+        frames = _array_frames(A)
+        return self.send_multipart(
+            frames, flags=flags, copy=copy, track=track, **kwargs
+        )
+
+    def recv_array(
+        self,
+        flags: int = 0,
+        copy: bool = True,
+        track: bool = False,
+        out: Any = None,
+    ) -> Any:
+        """Receive a numpy array, as sent by send_array.
+
+        .. versionadded:: 27.3
+
+        Parameters
+        ----------
+        flags : int
+            Any valid flags for :func:`Socket.recv`.
+        copy : bool
+            If False, the returned array shares memory with the received Frame.
+            If True, the array is backed by a (read-only) bytes copy.
+            Ignored if `out` is given.
+        track : bool
+            Should the message frame(s) be tracked for notification that ZMQ has
+            finished with it? (ignored if copy=True)
+        out : numpy.ndarray, optional
+            An existing writable, contiguous array to receive the data into,
+            with no intermediate copy.
+            Its dtype, shape and memory layout must match the array that was sent.
+
+        Returns
+        -------
+        A : numpy.ndarray
+            The received array (`out`, if given).
+
+        Raises
+        ------
+        ValueError
+            If the message is not an array, or doesn't match `out`.
+            The contents of `out` are undefined in this case.
+        ZMQError
+            for any of the reasons :func:`~Socket.recv` might fail
+        """
+        if out is None:
+            frames = self.recv_multipart(flags=flags, copy=copy, track=track)
+            return self._deserialize(frames, _array_from_frames)
+        if not (out.flags.c_contiguous or out.flags.f_contiguous):
+            raise ValueError("recv_array out must be contiguous")
+        header = bytearray(_ARRAY_HEADER_SIZE)
+        # flat bytewise view of out's memory, in whatever order it is laid out
+        data = out.ravel(order='K').view('u1')
+        sizes = self.recv_multipart_into([header, data], flags=flags)
+        return self._deserialize(sizes, lambda sizes: _array_into(header, sizes, out))
+
     _poller_class = Poller
 
     def poll(self, timeout: int | None = None, flags: int = zmq.POLLIN) -> int:
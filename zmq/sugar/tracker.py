@@ -5,8 +5,13 @@
 
 from __future__ import annotations
 
+import select
+import socket
 import time
-from threading import Event
+from collections import deque
+from collections.abc import Generator
+from threading import Event, Lock
+from typing import Any
 
 from zmq.backend import Frame
 from zmq.error import NotDone
@@ -27,6 +32,15 @@ class MessageTracker:
         This objects to track. This class can track the low-level
         Events used by the Message class, other MessageTrackers or
         actual Messages.
+
+    .. versionchanged:: 27.3
+        MessageTrackers can be awaited in asyncio,
+        waking the loop when 0MQ is done with the message(s),
+        without a thread per wait::
+
+            tracker = await socket.send(buf, copy=False, track=True)
+            await tracker
+            # buf can be reused
     """
 
     events: set[Event]
@@ -110,7 +124,212 @@ class MessageTracker:
             remaining -= toc - tic
             tic = toc
 
+    async def _wait_async(self) -> None:
+        import asyncio
+
+        from zmq.utils.garbage import gc
+
+        loop = asyncio.get_running_loop()
+        for evt in self.events:
+            if evt.is_set():
+                continue
+            f = loop.create_future()
+
+            def _set(f=f):
+                if not f.done():
+                    f.set_result(None)
+
+            def _wake(_set=_set):
+                # called in the gc thread
+                try:
+                    loop.call_soon_threadsafe(_set)
+                except RuntimeError:
+                    # loop closed
+                    pass
+
+            gc.add_event_callback(evt, _wake)
+            try:
+                await f
+            finally:
+                gc.remove_event_callback(evt, _wake)
+
+        for peer in self.peers:
+            await peer
+
+    def __await__(self) -> Generator[Any, None, None]:
+        return self._wait_async().__await__()
+
+
+class CompletionQueue:
+    """A queue of tokens for zero-copy messages 0MQ is done with.
+
+    A lighter-weight alternative to :class:`MessageTracker`
+    for recycling send buffers.
+    Pass a CompletionQueue and a token to :class:`Frame`,
+    and the token is put in the queue when 0MQ no longer needs the Frame's data
+    (immediately, if the data was copied)::
+
+        cq = zmq.CompletionQueue()
+        for buf in buffers:
+            socket.send(zmq.Frame(buf, copy=False, completion_queue=cq, token=buf))
+        ...
+        free_buffers.extend(cq.get(timeout=-1))
+
+    No Event is created per message, and tokens are delivered in bulk.
+
+    Only Frames constructed with a `completion_queue` are tracked this way.
+    :meth:`Socket.send` has no `completion_queue` argument,
+    so ``socket.send(buf, copy=False)`` must be given a Frame like the above
+    to have its buffer reported to the queue.
+
+    The queue is readable via :meth:`fileno` while tokens are waiting,
+    so it can be registered with a :class:`Poller` or event loop,
+    and awaiting it in asyncio returns the next batch of tokens.
+
+    .. versionadded:: 27.3
+    """
+
+    _tokens: deque[Any]
+    _lock: Lock
+    _signaled: bool
+    _waiters: list[Any]
+    _selector: Any
+    closed: bool
+
+    def __init__(self) -> None:
+        self._tokens = deque()
+        self._lock = Lock()
+        self._signaled = False
+        # asyncio Futures awaiting tokens
+        self._waiters = []
+        self._selector = None
+        self.closed = False
+        self._reader, self._writer = socket.socketpair()
+        self._reader.setblocking(False)
+        self._writer.setblocking(False)
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def fileno(self) -> int:
+        """The file descriptor, readable while tokens are waiting in the queue"""
+        return self._reader.fileno()
+
+    def _complete(self, tokens: list[Any]) -> None:
+        """Add the tokens of released messages (called by the gc thread)"""
+        with self._lock:
+            if self.closed:
+                # nobody can get them anymore
+                return
+            self._tokens.extend(tokens)
+            if self._signaled:
+                return
+            self._signaled = True
+            try:
+                self._writer.send(b'\0')
+            except OSError:
+                pass
+
+    def get(self, timeout: float | int = 0) -> list[Any]:
+        """Get the tokens of all messages released since the last call
+
+        Parameters
+        ----------
+        timeout : float
+            default: 0, which returns immediately.
+            Maximum time in (s) to wait for at least one token.
+            Negative means wait forever.
+
+        Returns
+        -------
+        tokens : list
+            the tokens in the order their messages were released,
+            empty if `timeout` is reached first.
+        """
+        if timeout is None or timeout < 0:
+            deadline = None
+        else:
+            deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                if self._signaled:
+                    self._signaled = False
+                    try:
+                        self._reader.recv(64)
+                    except OSError:
+                        pass
+                if self._tokens:
+                    tokens = list(self._tokens)
+                    self._tokens.clear()
+                    return tokens
+            if deadline is None:
+                remaining = None
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+            select.select([self._reader], [], [], remaining)
+
+    async def _get_async(self) -> list[Any]:
+        import asyncio
+
+        from zmq.asyncio import _get_selector
+
+        loop = asyncio.get_running_loop()
+        while True:
+            tokens = self.get()
+            if tokens:
+                return tokens
+            if not self._waiters:
+                # one reader per queue, waking every waiter
+                self._selector = _get_selector(loop)
+                self._selector.add_reader(self._reader, self._wake_waiters)
+            elif self._waiters[0].get_loop() is not loop:
+                raise RuntimeError(
+                    "CompletionQueue is already awaited in another event loop"
+                )
+            f = loop.create_future()
+            self._waiters.append(f)
+            try:
+                await f
+            finally:
+                if f in self._waiters:
+                    # cancelled
+                    self._waiters.remove(f)
+                    if not self._waiters:
+                        self._selector.remove_reader(self._reader)
+
+    def _wake_waiters(self) -> None:
+        """Wake every coroutine awaiting the queue, to race for the tokens"""
+        self._selector.remove_reader(self._reader)
+        waiters = self._waiters
+        self._waiters = []
+        for f in waiters:
+            if not f.done():
+                f.set_result(None)
+
+    def __await__(self) -> Generator[Any, None, list[Any]]:
+        return self._get_async().__await__()
+
+    def close(self) -> None:
+        """Close the queue's file descriptors
+
+        Coroutines awaiting the queue are cancelled,
+        and tokens of messages released after closing are dropped.
+        """
+        if self._waiters:
+            # stop watching the reader before it is closed
+            self._selector.remove_reader(self._reader)
+            waiters = self._waiters
+            self._waiters = []
+            for f in waiters:
+                f.cancel()
+        with self._lock:
+            self.closed = True
+            self._reader.close()
+            self._writer.close()
+
 
 _FINISHED_TRACKER = MessageTracker()
 
-__all__ = ['MessageTracker', '_FINISHED_TRACKER']
+__all__ = ['CompletionQueue', 'MessageTracker', '_FINISHED_TRACKER']
@@ -0,0 +1,239 @@
+"""Runtime calibration of the copy/zero-copy crossover.
+
+Zero-copy sends have a fixed overhead in pyzmq,
+which is not worth paying for small messages.
+Where the crossover lies depends on the machine, the transport,
+and the pyzmq backend,
+so :data:`zmq.COPY_THRESHOLD` is only a rough default.
+
+:func:`calibrate_copy_threshold` measures the crossover
+with the same throughput test as ``perf/collect.py``
+and records the result,
+which sockets created with the default `copy_threshold`
+then pick up when they bind or connect on a calibrated transport.
+
+.. versionadded:: 27.3
+"""
+
+# Copyright (C) PyZMQ Developers
+# Distributed under the terms of the Modified BSD License.
+
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from collections.abc import Sequence
+from itertools import count as _counter
+from threading import Thread
+
+import zmq
+
+#: message sizes measured by default: 1kB - 1MB
+DEFAULT_SIZES: tuple[int, ...] = tuple(2**i for i in range(10, 21, 2))
+
+# calibrated thresholds, by (backend, transport)
+_thresholds: dict[tuple[str, str], int] = {}
+# unique ipc/inproc endpoints, since rebinding a just-closed one can fail
+_run_ids = _counter()
+
+
+def _backend_name() -> str:
+    """The name of the active backend (cython or cffi)"""
+    return zmq.backend.Socket.__module__.split('.')[2]
+
+
+def _transport(addr: str | bytes) -> str:
+    if isinstance(addr, bytes):
+        addr = addr.decode('utf8', 'replace')
+    return addr.partition('://')[0]
+
+
+def get_copy_threshold(transport: str | bytes) -> int | None:
+    """Get the calibrated copy threshold for a transport, if any.
+
+    Parameters
+    ----------
+    transport : str
+        The transport, e.g. 'tcp' or 'ipc'.
+        A full endpoint URL is also accepted.
+
+    Returns
+    -------
+    threshold : int or None
+        The calibrated threshold for the active backend,
+        or None if the transport has not been calibrated.
+    """
+    return _thresholds.get((_backend_name(), _transport(transport)))
+
+
+def set_copy_threshold(transport: str, threshold: int | None) -> None:
+    """Record the copy threshold to use for a transport.
+
+    For applying a threshold measured elsewhere, e.g. on another host of a fleet,
+    without calibrating again.
+    Pass None to clear the calibrated threshold.
+    """
+    key = (_backend_name(), _transport(transport))
+    if threshold is None:
+        _thresholds.pop(key, None)
+    else:
+        _thresholds[key] = threshold
+
+
+def _url(transport: str) -> str:
+    """A new local endpoint to measure a transport on"""
+    name = f'pyzmq-calibrate-{os.getpid()}-{next(_run_ids)}'
+    if transport == 'tcp':
+        return 'tcp://127.0.0.1:0'
+    elif transport == 'ipc':
+        return f'ipc://{os.path.join(tempfile.gettempdir(), name)}'
+    elif transport == 'inproc':
+        return f'inproc://{name}'
+    else:
+        raise ValueError(f"Cannot calibrate transport {transport!r}")
+
+
+def _sink(sock: zmq.Socket, count: int) -> None:
+    """Receive messages on a ROUTER socket, as in perf's thr_sink"""
+    msg = sock.recv_multipart()
+    sock.send_multipart(msg)
+    for _ in range(count):
+        sock.recv_multipart(copy=False)
+    sock.send_multipart([msg[0], b'DONE'])
+
+
+def _throughput(
+    ctx: zmq.Context, transport: str, count: int, size: int, copy: bool
+) -> float:
+    """Run one throughput test, as in perf's throughput
+
+    Returns the rate of messages per second
+    """
+    sink = ctx.socket(zmq.ROUTER)
+    sink.rcvhwm = 0
+    sink.linger = 0
+    # no threshold, so copy=False is always zero-copy
+    source = ctx.socket(zmq.DEALER, copy_threshold=0)
+    source.sndhwm = 0
+    source.linger = 0
+    try:
+        sink.bind(_url(transport))
+        source.connect(sink.last_endpoint.decode())
+        thread = Thread(target=_sink, args=(sink, count), daemon=True)
+        thread.start()
+        data = b' ' * size
+        source.send(b'BEGIN')
+        # wait for the sink to be connected
+        source.recv()
+        tic = time.perf_counter()
+        for _ in range(count):
+            source.send(data, copy=copy)
+        # wait for the sink to receive everything
+        source.recv()
+        elapsed = time.perf_counter() - tic
+        thread.join()
+    finally:
+        source.close()
+        sink.close()
+    return count / elapsed
+
+
+def _measure(
+    ctx: zmq.Context, transport: str, size: int, copy: bool, min_time: float
+) -> float:
+    """Measure throughput, growing the count until the run takes at least min_time
+
+    as in perf/collect.py's compute_data_point
+    """
+    count = 16
+    while True:
+        tic = time.perf_counter()
+        result = _throughput(ctx, transport, count, size, copy)
+        if time.perf_counter() - tic >= min_time:
+            return result
+        count *= 2
+
+
+def measure_copy_threshold(
+    transport: str = 'tcp',
+    *,
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    min_time: float = 0.1,
+    context: zmq.Context | None = None,
+) -> int:
+    """Measure the copy/zero-copy crossover for a transport.
+
+    For each message size,
+    the throughput of sending with copy=True and copy=False is compared.
+
+    Parameters
+    ----------
+    transport : str
+        The transport to measure: 'tcp', 'ipc', or 'inproc'.
+    sizes : list of int
+        The message sizes to measure, in increasing order.
+    min_time : float
+        The minimum duration (in seconds) of each measurement.
+        Longer is more accurate.
+    context : zmq.Context
+        The Context to use. Default: a new Context, destroyed when done.
+
+    Returns
+    -------
+    threshold : int
+        The smallest size from which zero-copy is always faster.
+        If zero-copy is not faster even for the largest size,
+        twice the largest size.
+    """
+    _url(transport)  # check the transport before starting
+    ctx = context or zmq.Context()
+    threshold = 2 * sizes[-1]
+    try:
+        for size in reversed(sizes):
+            copied = _measure(ctx, transport, size, True, min_time)
+            zero_copy = _measure(ctx, transport, size, False, min_time)
+            if zero_copy < copied:
+                break
+            threshold = size
+    finally:
+        if context is None:
+            ctx.destroy()
+    return threshold
+
+
+def calibrate_copy_threshold(
+    transports: Sequence[str] = ('tcp', 'ipc', 'inproc'), **kwargs
+) -> dict[str, int]:
+    """Calibrate the copy threshold for transports on this machine.
+
+    Measures the crossover with :func:`measure_copy_threshold`
+    and records it for the active backend.
+    Sockets created without an explicit `copy_threshold`
+    use the calibrated threshold when they bind or connect
+    to an endpoint on a calibrated transport
+    (the first such endpoint decides).
+
+    Calibration takes a few seconds per transport.
+    Unavailable transports (e.g. ipc on Windows) are skipped.
+
+    Parameters
+    ----------
+    transports : list of str
+        The transports to calibrate.
+    **kwargs
+        Passed to :func:`measure_copy_threshold`.
+
+    Returns
+    -------
+    thresholds : dict
+        The calibrated threshold for each transport.
+    """
+    thresholds = {}
+    for transport in transports:
+        if transport == 'ipc' and not zmq.has('ipc'):
+            continue
+        threshold = measure_copy_threshold(transport, **kwargs)
+        set_copy_threshold(transport, threshold)
+        thresholds[transport] = threshold
+    return thresholds
@@ -8,18 +8,23 @@ used in zero-copy sends.
 from __future__ import annotations
 
 import atexit
-import struct
 import warnings
 from os import getpid
 from threading import Event, Lock, Thread
-from typing import Final, NamedTuple
+from typing import TYPE_CHECKING, Any, Callable, Final, NamedTuple
 
 import zmq
+from zmq.backend import _gc_queue_allocate, _gc_queue_drain
+
+if TYPE_CHECKING:
+    from zmq.sugar.tracker import CompletionQueue
 
 
 class gcref(NamedTuple):
     obj: object
     event: Event | None
+    completion_queue: CompletionQueue | None = None
+    token: Any = None
 
 
 class GarbageCollectorThread(Thread):
@@ -56,12 +61,27 @@ class GarbageCollectorThread(Thread):
             msg = s.recv()
             if msg == b'DIE':
                 break
-            fmt = 'L' if len(msg) == 4 else 'Q'
-            key = struct.unpack(fmt, msg)[0]
-            tup = self.gc.refs.pop(key, None)
-            if tup and tup.event:
-                tup.event.set()
-            del tup
+            # any other message is a wakeup: collect every id released so far
+            refs = self.gc.refs
+            completed: dict[CompletionQueue, list[Any]] = {}
+            callbacks: list[Callable[[], Any]] = []
+            for key in _gc_queue_drain(self.gc._release_queue):
+                tup = refs.pop(key, None)
+                if tup and tup.event:
+                    tup.event.set()
+                    if self.gc._event_callbacks:
+                        callbacks.extend(self.gc._pop_event_callbacks(tup.event))
+                if tup and tup.completion_queue is not None:
+                    completed.setdefault(tup.completion_queue, []).append(tup.token)
+                del tup
+            for completion_queue, tokens in completed.items():
+                completion_queue._complete(tokens)
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception as e:
+                    warnings.warn(f"Error in tracker callback: {e!r}", RuntimeWarning)
+            del completed, callbacks
         s.close()
 
 
@@ -72,12 +92,14 @@ class GarbageCollector:
     This object holds a dictionary, keyed by Python id,
     of the Python objects whose memory are currently in use by zeromq.
 
-    When zeromq is done with the memory, it sends a message on an inproc PUSH socket
-    containing the packed size_t (32 or 64-bit unsigned int),
-    which is the key in the dict.
+    When zeromq is done with the memory, it appends the size_t key
+    to a native release queue shared by all zero-copy messages.
+    Only the release that finds the queue empty sends a wakeup message
+    on an inproc PUSH socket.
     When the PULL socket in the gc thread receives that message,
-    the reference is popped from the dict,
-    and any tracker events that should be signaled fire.
+    the queue is drained, every released reference is popped from the dict,
+    and any tracker events that should be signaled fire,
+    calling the callbacks added with :meth:`add_event_callback`.
     """
 
     # refs = None
@@ -88,6 +110,8 @@ class GarbageCollector:
     refs: dict[int, gcref]
     _lock: Lock
     _push: zmq.Socket | None
+    _event_callbacks: dict[Event, list[Callable[[], Any]]]
+    _callback_lock: Lock
 
     def __init__(self, context: zmq.Context | None = None) -> None:
         super().__init__()
@@ -98,7 +122,9 @@ class GarbageCollector:
         self._lock = Lock()
         self._stay_down = False
         self._push = None
-        self._push_mutex = None
+        self._queue: int | None = None
+        self._event_callbacks = {}
+        self._callback_lock = Lock()
         atexit.register(self._atexit)
 
     @property
@@ -143,7 +169,7 @@ class GarbageCollector:
         called after stop or when setting up a new subprocess
         """
         self._push = None
-        self._push_mutex = None
+        self._queue = None
         self.thread = None
         self.refs.clear()
         self.context = None
@@ -169,6 +195,15 @@ class GarbageCollector:
             self._push.connect(self.url)
         return self._push
 
+    @property
+    def _release_queue(self) -> int:
+        """The address of the native queue of ids released by libzmq."""
+        if not self._queue:
+            with self._lock:
+                if not self._queue:
+                    self._queue = _gc_queue_allocate()
+        return self._queue
+
     def start(self) -> None:
         """Start a new garbage collection thread.
 
@@ -199,8 +234,14 @@ class GarbageCollector:
             return False
         return True
 
-    def store(self, obj: object, event: Event | None = None) -> int:
-        """store an object and (optionally) event for zero-copy"""
+    def store(
+        self,
+        obj: object,
+        event: Event | None = None,
+        completion_queue: CompletionQueue | None = None,
+        token: Any = None,
+    ) -> int:
+        """store an object and (optionally) event or completion token for zero-copy"""
         if not self.is_alive():
             if self._stay_down:
                 return 0
@@ -210,11 +251,59 @@ class GarbageCollector:
             with self._lock:
                 if not self.is_alive():
                     self.start()
-        tup = gcref(obj, event)
+        tup = gcref(obj, event, completion_queue, token)
         theid = id(tup)
         self.refs[theid] = tup
         return theid
 
+    def add_event_callback(self, event: Event, callback: Callable[[], Any]) -> None:
+        """Call callback() when a tracker event is set
+
+        Called in the gc thread right after the event is set,
+        or immediately if it is already set.
+        The callback must be quick and thread-safe,
+        e.g. ``loop.call_soon_threadsafe``.
+        """
+        with self._callback_lock:
+            if not event.is_set():
+                self._event_callbacks.setdefault(event, []).append(callback)
+                added = True
+            else:
+                added = False
+        if added:
+            # the gc thread checks for callbacks without the lock after setting,
+            # so it may have missed ours if it set the event just now.
+            # Whoever takes the callback out calls it.
+            if not event.is_set():
+                return
+            with self._callback_lock:
+                callbacks = self._event_callbacks.get(event)
+                if callbacks is None or callback not in callbacks:
+                    # the gc thread has it
+                    return
+                callbacks.remove(callback)
+                if not callbacks:
+                    del self._event_callbacks[event]
+        callback()
+
+    def remove_event_callback(self, event: Event, callback: Callable[[], Any]) -> None:
+        """Remove a callback added with add_event_callback, if it hasn't been called"""
+        with self._callback_lock:
+            callbacks = self._event_callbacks.get(event)
+            if callbacks is None:
+                return
+            try:
+                callbacks.remove(callback)
+            except ValueError:
+                pass
+            if not callbacks:
+                del self._event_callbacks[event]
+
+    def _pop_event_callbacks(self, event: Event) -> list[Callable[[], Any]]:
+        """The callbacks for an event that has been set"""
+        with self._callback_lock:
+            return self._event_callbacks.pop(event, [])
+
     def __del__(self) -> None:
         if not self.is_alive():
             return
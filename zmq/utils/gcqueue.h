@@ -0,0 +1,78 @@
+/*
+* Queue of zero-copy message ids released by libzmq,
+* drained in bulk by the pyzmq garbage collection thread.
+*
+* This file is Copyright (C) PyZMQ Developers
+* Distributed under the terms of the Modified BSD License.
+*
+*/
+
+#pragma once
+
+#include <stdlib.h>
+#include <string.h>
+
+#include "mutex.h"
+
+typedef struct {
+    mutex_t *mutex;
+    size_t *ids;
+    size_t len;
+    size_t capacity;
+} gc_queue_t;
+
+gc_queue_t*
+gc_queue_allocate(void) {
+    gc_queue_t* queue = (gc_queue_t*)malloc(sizeof(gc_queue_t));
+    if (!queue)
+        return NULL;
+    queue->capacity = 1024;
+    queue->len = 0;
+    queue->ids = (size_t*)malloc(queue->capacity * sizeof(size_t));
+    queue->mutex = mutex_allocate();
+    if (!queue->ids || !queue->mutex) {
+        free(queue->ids);
+        mutex_deallocate(queue->mutex);
+        free(queue);
+        return NULL;
+    }
+    return queue;
+}
+
+/*
+* Add an id to the queue. The caller must hold queue->mutex.
+*
+* Returns 1 if the queue was empty, meaning the gc thread needs waking,
+* 0 if it was not, and -1 if the queue could not grow.
+*/
+int
+gc_queue_push(gc_queue_t* queue, size_t id) {
+    size_t *ids;
+    if (queue->len == queue->capacity) {
+        ids = (size_t*)realloc(queue->ids, 2 * queue->capacity * sizeof(size_t));
+        if (!ids)
+            return -1;
+        queue->ids = ids;
+        queue->capacity *= 2;
+    }
+    queue->ids[queue->len++] = id;
+    return queue->len == 1;
+}
+
+/*
+* Move up to n ids from the queue to out.
+*
+* Returns the number of ids moved.
+* If fewer than n, the queue was emptied
+* and the next push will ask for a wakeup.
+*/
+size_t
+gc_queue_drain(gc_queue_t* queue, size_t* out, size_t n) {
+    size_t count;
+    mutex_lock(queue->mutex);
+    count = queue->len < n ? queue->len : n;
+    queue->len -= count;
+    memcpy(out, queue->ids + queue->len, count * sizeof(size_t));
+    mutex_unlock(queue->mutex);
+    return count;
+}
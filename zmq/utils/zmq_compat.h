@@ -80,6 +80,17 @@
     #define zmq_poller_add(poller, socket, userdata, events) _missing
     #define zmq_poller_modify(poller, socket, events) _missing
     #define zmq_poller_remove(poller, socket) _missing
+    #define zmq_poller_add_fd(poller, fd, userdata, events) _missing
+    #define zmq_poller_modify_fd(poller, fd, events) _missing
+    #define zmq_poller_remove_fd(poller, fd) _missing
+    #define zmq_poller_wait_all(poller, events, n_events, timeout) _missing
+    typedef struct zmq_poller_event_t
+    {
+        void *socket;
+        ZMQ_FD_T fd;
+        void *user_data;
+        short events;
+    } zmq_poller_event_t;
 #endif
 #ifndef PYZMQ_DRAFT_432
     #define zmq_poller_fd(poller, fd) _missing